@@ -1,7 +1,18 @@
+import asyncio
 import tempfile
 from pathlib import Path
+from typing import Any
 
 
 root = Path(__file__).parent.parent
 fixtures_dir = root.joinpath("tests/fixtures")
 xsdata_temp_dir = Path(tempfile.gettempdir()).joinpath("xsdata")
+
+
+def run_async(coroutine: Any) -> Any:
+    """Run the coroutine in a new event loop and return its result."""
+    loop = asyncio.new_event_loop()
+    try:
+        return loop.run_until_complete(coroutine)
+    finally:
+        loop.close()
@@ -0,0 +1,139 @@
+import gzip
+import threading
+import time
+import zlib
+from http.server import BaseHTTPRequestHandler
+from http.server import HTTPServer
+from socketserver import ThreadingMixIn
+from typing import Any
+from typing import List
+from typing import Tuple
+
+from tests.fixtures.calculator.services import AddResponse
+from tests.fixtures.calculator.services import CalculatorSoapAddInput
+from tests.fixtures.calculator.services import CalculatorSoapAddOutput
+from xsdata.formats.dataclass.parsers import XmlParser
+from xsdata.formats.dataclass.serializers import XmlSerializer
+
+
+class CalculatorServer(ThreadingMixIn, HTTPServer):
+    """
+    Local stand-in for the calculator soap service.
+
+    The add operation is served on any path, the response holds the sum
+    of the request integers. Every connection is handled in its own
+    thread, use it as a context manager to serve in the background.
+
+    :param delay: Seconds to wait before every response
+    :param keep_alive: Keep the connections open after every response
+    :param chunked: Send the responses with chunked transfer encoding
+    :param announce_close: Send the ``Connection: close`` header when
+        the connection is not kept alive
+    :param compress: Send gzip compressed responses when the client
+        accepts them
+    """
+
+    daemon_threads = True
+    allow_reuse_address = True
+    request_queue_size = 128
+
+    def __init__(
+        self,
+        delay: float = 0.0,
+        keep_alive: bool = True,
+        chunked: bool = False,
+        announce_close: bool = True,
+        compress: bool = False,
+    ):
+        super().__init__(("127.0.0.1", 0), CalculatorHandler)
+        self.delay = delay
+        self.keep_alive = keep_alive
+        self.chunked = chunked
+        self.announce_close = announce_close
+        self.compress = compress
+        self.connections = 0
+        self.requests: List[Tuple[str, str, Any]] = []
+        self.parser = XmlParser()
+        self.serializer = XmlSerializer()
+
+    @property
+    def url(self) -> str:
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}/calculator.asmx"
+
+    def process_request(self, request: Any, client_address: Any):
+        self.connections += 1
+        super().process_request(request, client_address)
+
+    def __enter__(self) -> "CalculatorServer":
+        thread = threading.Thread(
+            target=self.serve_forever, kwargs={"poll_interval": 0.01}, daemon=True
+        )
+        thread.start()
+        return self
+
+    def __exit__(self, *args: Any):
+        self.shutdown()
+        self.server_close()
+
+
+class CalculatorHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    wbufsize = -1
+    server: CalculatorServer
+
+    def do_GET(self):
+        self.server.requests.append(("GET", self.path, dict(self.headers)))
+        self.send_content(200, self.path.encode())
+
+    def do_POST(self):
+        length = int(self.headers.get("Content-Length", 0))
+        body = self.rfile.read(length)
+        self.server.requests.append(("POST", self.path, dict(self.headers)))
+        encoding = self.headers.get("Content-Encoding")
+        if encoding == "gzip":
+            body = gzip.decompress(body)
+        elif encoding == "deflate":
+            body = zlib.decompress(body)
+
+        if self.path.endswith("/missing"):
+            self.send_content(404, b"")
+            return
+
+        if self.server.delay:
+            time.sleep(self.server.delay)
+
+        obj = self.server.parser.from_bytes(body, CalculatorSoapAddInput)
+        add = obj.body.add
+        output = CalculatorSoapAddOutput(
+            body=CalculatorSoapAddOutput.Body(
+                add_response=AddResponse(add_result=add.int_a + add.int_b)
+            )
+        )
+        self.send_content(200, self.server.serializer.render_bytes(output))
+
+    def send_content(self, status: int, content: bytes):
+        self.send_response(status)
+        self.send_header("Content-Type", "text/xml; charset=utf-8")
+        if self.server.compress and "gzip" in self.headers.get("Accept-Encoding", ""):
+            self.send_header("Content-Encoding", "gzip")
+            content = gzip.compress(content)
+        if not self.server.keep_alive:
+            self.close_connection = True
+
+        if self.close_connection and self.server.announce_close:
+            self.send_header("Connection", "close")
+
+        if self.server.chunked:
+            self.send_header("Transfer-Encoding", "chunked")
+            self.end_headers()
+            middle = len(content) // 2
+            for chunk in (content[:middle], content[middle:], b""):
+                self.wfile.write(b"%x\r\n%s\r\n" % (len(chunk), chunk))
+        else:
+            self.send_header("Content-Length", str(len(content)))
+            self.end_headers()
+            self.wfile.write(content)
+
+    def log_message(self, *args: Any):
+        pass
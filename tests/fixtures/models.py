@@ -66,6 +66,16 @@ class NillableType:
     value: Optional[str] = field(default="abc")
 
 
+@dataclass
+class NillableElements:
+    a: Optional[int] = field(
+        default=None, metadata={"type": "Element", "nillable": True}
+    )
+    b: List[Optional[str]] = field(
+        default_factory=list, metadata={"type": "Element", "nillable": True}
+    )
+
+
 @dataclass
 class FixedType:
     value: str = field(init=False, default="abc")
@@ -99,7 +109,7 @@ class ChoiceType:
                     "name": "tokens",
                     "type": List[int],
                     "tokens": True,
-                    "default_factory": return_true
+                    "default_factory": return_true,
                 },
                 {"name": "union", "type": Type["UnionType"], "namespace": "foo"},
                 {"name": "p", "type": float, "fixed": True, "default": 1.1},
@@ -168,6 +178,12 @@ class Paragraph:
     )
 
 
+@dataclass
+class LazyType:
+    a: Optional[TypeB] = field(default=None, metadata={"lazy": True})
+    b: List[TypeB] = field(default_factory=list, metadata={"lazy": True})
+
+
 @dataclass
 class Parent:
     @dataclass
@@ -212,6 +212,25 @@ class XmlMetaBuilderTests(FactoryTestCase):
         actual = list(result)
         self.assertEqual(2, len(actual))
 
+    def test_build_local_names(self):
+        meta = self.builder.build(BookForm, None)
+        expected = {var.local_name for var in meta.get_all_vars()}
+        self.assertEqual(expected, self.builder.build_local_names(BookForm))
+
+        @dataclass
+        class Thing:
+            first_name: str = field(metadata={"type": "Attribute"})
+            last_name: str
+            nick_name: str = field(metadata={"name": "nick"})
+            hidden: str = field(metadata={"type": "Ignore"})
+
+            class Meta:
+                attribute_name_generator = text.camel_case
+
+        self.builder.element_name_generator = text.pascal_case
+        actual = self.builder.build_local_names(Thing)
+        self.assertEqual({"firstName", "LastName", "nick"}, actual)
+
     def test_default_xml_type(self):
         cls = make_dataclass("a", [("x", int)])
         self.assertEqual(XmlType.TEXT, self.builder.default_xml_type(cls))
@@ -392,6 +411,22 @@ class XmlVarBuilderTests(TestCase):
             str(cm.exception),
         )
 
+    def test_build_with_lazy_field(self):
+        var = self.builder.build(1, "foo", TypeA, {"lazy": True}, True, None, None)
+        self.assertTrue(var.lazy)
+        self.assertEqual(TypeA, var.clazz)
+
+        var = self.builder.build(1, "foo", TypeA, {}, True, None, None)
+        self.assertFalse(var.lazy)
+
+        with self.assertRaises(XmlContextError) as cm:
+            self.builder.build(1, "foo", int, {"lazy": True}, True, None, None)
+
+        self.assertEqual(
+            "Lazy fields must be a single class element: <class 'int'>",
+            str(cm.exception),
+        )
+
     def test_resolve_namespaces(self):
         func = self.builder.resolve_namespaces
         self.builder.parent_ns = "bar"
@@ -0,0 +1,232 @@
+import gc
+import os
+import pickle
+import sys
+import tempfile
+import weakref
+from dataclasses import make_dataclass
+from unittest import TestCase
+
+from tests.fixtures.books import BookForm
+from tests.fixtures.books import Books
+from tests.fixtures.models import ChoiceType
+from xsdata.formats.dataclass.context import XmlContext
+from xsdata.formats.dataclass.models.cache import XmlMetaCache
+from xsdata.formats.dataclass.models.cache import XmlMetaStore
+from xsdata.formats.dataclass.parsers.compiler import compile_binder
+from xsdata.formats.dataclass.serializers.compiler import compile_serializer
+
+
+class XmlMetaStoreTests(TestCase):
+    def setUp(self):
+        super().setUp()
+        self.context = XmlContext()
+        self.metas = [self.context.build(clazz) for clazz in (BookForm, Books)]
+
+    def test_get_and_add(self):
+        store = XmlMetaStore()
+        self.assertIsNone(store.get(Books))
+
+        for meta in self.metas:
+            store.add(meta)
+
+        self.assertIs(self.metas[1], store.get(Books))
+        self.assertIn(BookForm, store)
+        self.assertEqual([BookForm, Books], list(store))
+        self.assertEqual(2, len(store))
+        self.assertEqual(1, store.hits)
+        self.assertEqual(1, store.misses)
+
+        store.clear()
+        self.assertEqual(0, len(store))
+        self.assertIsNone(store.peek(Books))
+
+    def test_mapping_interface(self):
+        store = XmlMetaStore()
+        store[BookForm] = self.metas[0]
+        store[Books] = self.metas[1]
+
+        self.assertIs(self.metas[0], store[BookForm])
+        self.assertEqual([BookForm, Books], store.keys())
+        self.assertEqual(self.metas, store.values())
+        self.assertEqual(list(zip([BookForm, Books], self.metas)), store.items())
+        self.assertEqual(0, store.hits)
+
+        del store[BookForm]
+        self.assertNotIn(BookForm, store)
+        self.assertIs(self.metas[1], store.get(BookForm, self.metas[1]))
+
+        with self.assertRaises(KeyError):
+            store[BookForm]
+
+        with self.assertRaises(KeyError):
+            del store[BookForm]
+
+        with self.assertRaises(ValueError):
+            store[BookForm] = self.metas[1]
+
+    def test_mapping_interface_with_weak(self):
+        store = XmlMetaStore(weak=True)
+        store[BookForm] = self.metas[0]
+        self.assertIs(self.metas[0], BookForm.__xsdata_meta__[store])
+
+        del store[BookForm]
+        self.assertEqual(0, len(store))
+        self.assertNotIn(store, BookForm.__xsdata_meta__)
+
+    def test_add_with_maxsize(self):
+        store = XmlMetaStore(maxsize=1)
+        store.add(self.metas[0])
+        store.add(self.metas[1])
+
+        self.assertEqual([Books], list(store))
+        self.assertEqual(1, store.evictions)
+
+        with self.assertRaises(ValueError):
+            XmlMetaStore(maxsize=0)
+
+    def test_get_with_maxsize_updates_order(self):
+        store = XmlMetaStore(maxsize=2)
+        store.add(self.metas[0])
+        store.add(self.metas[1])
+        store.get(BookForm)
+        store.add(self.context.build(ChoiceType))
+
+        self.assertEqual([BookForm, ChoiceType], list(store))
+
+    def test_weak(self):
+        store = XmlMetaStore(maxsize=1, weak=True)
+        store.add(self.metas[0])
+        self.assertIs(self.metas[0], store.get(BookForm))
+        self.assertEqual([BookForm], list(store))
+
+        store.add(self.metas[1])
+        self.assertEqual([Books], list(store))
+        self.assertIsNone(store.peek(BookForm))
+        self.assertEqual(0, len(BookForm.__xsdata_meta__))
+
+        store.clear()
+        self.assertIsNone(store.peek(Books))
+
+    def test_weak_with_garbage_collected_class(self):
+        context = XmlContext(weak_cache=True)
+        clazz = make_dataclass("A", [("x", int)])
+        context.build(clazz)
+        context.compile(clazz, compile_binder)
+        context.compile(clazz, compile_serializer)
+        self.assertEqual(1, len(context.cache))
+
+        ref = weakref.ref(clazz)
+        del clazz
+        gc.collect()
+        self.assertEqual(0, len(context.cache))
+        self.assertIsNone(ref())
+
+
+class XmlMetaCacheTests(TestCase):
+    def setUp(self):
+        super().setUp()
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.cache = XmlMetaCache(self.tmp_dir.name, "key")
+        self.meta = XmlContext().build(Books)
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+        super().tearDown()
+
+    def test_save_without_compiled_functions(self):
+        context = XmlContext()
+        context.compile(Books, compile_binder)
+        meta = context.build(Books)
+
+        self.cache.add(meta)
+        self.cache.save()
+
+        actual = XmlMetaCache(self.tmp_dir.name, "key").get(Books)
+        self.assertEqual(1, len(meta.compiled))
+        self.assertEqual({}, actual.compiled)
+        self.assertEqual(meta.elements, actual.elements)
+
+    def test_get_and_add(self):
+        self.assertIsNone(self.cache.get(Books))
+
+        self.cache.add(self.meta)
+        self.assertIs(self.meta, self.cache.get(Books))
+        self.assertEqual({"tests"}, self.cache.dirty)
+        self.assertFalse(self.cache.file_path("tests").exists())
+
+        self.cache.save()
+        self.assertEqual(set(), self.cache.dirty)
+        self.assertTrue(self.cache.file_path("tests").exists())
+
+        cache = XmlMetaCache(self.tmp_dir.name, "key")
+        actual = cache.get(Books)
+        self.assertIsNot(self.meta, actual)
+        self.assertEqual(self.meta, actual)
+        self.assertIs(actual, cache.get(Books))
+        self.assertIsNone(cache.get(BookForm))
+
+    def test_get_with_stale_entry(self):
+        self.cache.add(self.meta)
+        self.cache.save()
+
+        cache = XmlMetaCache(self.tmp_dir.name, "key")
+        path, mtime, size = cache.stamp(Books)[0]
+        cache.stamps[Books.__module__] = (path, mtime + 1, size)
+
+        self.assertIsNone(cache.get(Books))
+        self.assertEqual({}, cache.packages["tests"])
+
+    def test_get_with_broken_entry(self):
+        stamp = self.cache.stamp(Books)
+        self.cache.packages["tests"] = {
+            self.cache.entry_name(Books): (stamp, b"broken"),
+            self.cache.entry_name(BookForm): (stamp, pickle.dumps(self.meta)),
+        }
+
+        self.assertIsNone(self.cache.get(Books))
+        self.assertIsNone(self.cache.get(BookForm))
+        self.assertEqual({}, self.cache.packages["tests"])
+
+    def test_load_with_different_key(self):
+        self.cache.add(self.meta)
+        self.cache.save()
+
+        cache = XmlMetaCache(self.tmp_dir.name, "other")
+        self.assertEqual({}, cache.load("tests"))
+
+        cache.file_path("tests").write_bytes(b"broken")
+        self.assertEqual({}, XmlMetaCache(self.tmp_dir.name, "key").load("tests"))
+
+    def test_save_skips_unpicklable_entries(self):
+        self.cache.add(self.meta)
+        name = self.cache.entry_name(ChoiceType)
+        self.cache.packages["tests"][name] = ((), lambda: None)
+        self.cache.save()
+
+        entries = XmlMetaCache(self.tmp_dir.name, "key").load("tests")
+        self.assertEqual([self.cache.entry_name(Books)], list(entries))
+
+    def test_stamp(self):
+        module = sys.modules[Books.__module__]
+        path, mtime, size = self.cache.stamp(Books)[0]
+        stat = os.stat(module.__file__)
+
+        self.assertEqual(
+            (module.__file__, stat.st_mtime_ns, stat.st_size), (path, mtime, size)
+        )
+        self.assertEqual(1, len(self.cache.stamp(Books)))
+
+        clazz = make_dataclass("A", [], bases=(Books,))
+        self.assertEqual(2, len(self.cache.stamp(clazz)))
+        self.assertIn((path, mtime, size), self.cache.stamp(clazz))
+
+    def test_package_name(self):
+        self.assertEqual("tests", self.cache.package_name(Books))
+        self.assertEqual("tests", self.cache.package_name(BookForm))
+        self.assertIsNone(self.cache.package_name(make_dataclass("A", [])))
+
+        class Local:
+            pass
+
+        self.assertIsNone(self.cache.package_name(Local))
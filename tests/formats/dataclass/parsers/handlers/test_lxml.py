@@ -1,3 +1,4 @@
+from unittest import mock
 from unittest.case import TestCase
 
 from lxml import etree
@@ -8,10 +9,14 @@ from tests.fixtures.books import Books
 from tests.fixtures.books.fixtures import books
 from tests.fixtures.books.fixtures import events
 from tests.fixtures.books.fixtures import events_default_ns
+from tests.fixtures.models import Paragraph
 from xsdata.exceptions import ParserError
 from xsdata.exceptions import XmlHandlerError
+from xsdata.formats.dataclass.parsers import XmlParser
 from xsdata.formats.dataclass.parsers.bases import RecordParser
 from xsdata.formats.dataclass.parsers.handlers import LxmlEventHandler
+from xsdata.formats.dataclass.parsers.handlers import LxmlTargetHandler
+from xsdata.formats.dataclass.parsers.mixins import PathTracker
 
 
 class LxmlEventHandlerTests(TestCase):
@@ -69,3 +74,171 @@ class LxmlEventHandlerTests(TestCase):
     def test_parse_with_xml_syntax_error(self):
         with self.assertRaises(ParserError):
             self.parser.from_string("<", Books)
+
+    def test_feed(self):
+        path = fixtures_dir.joinpath("books/books.xml")
+        data = path.read_bytes()
+
+        for index in range(0, len(data), 100):
+            self.parser.feed(data[index : index + 100], Books)
+
+        self.assertEqual(books, self.parser.close())
+        self.assertEqual({"brk": "urn:books"}, self.parser.ns_map)
+        self.assertEqual(events, self.parser.events)
+
+    def test_feed_with_error(self):
+        with self.assertRaises(ParserError):
+            self.parser.feed(b"<books><foo>", Books)
+
+        self.assertIsNone(self.parser.feed_handler)
+
+    def test_close_without_data(self):
+        handler = LxmlEventHandler(clazz=Books, parser=self.parser)
+        self.assertIsNone(handler.close())
+
+    def test_iterparse(self):
+        path = fixtures_dir.joinpath("books/books.xml")
+        result = list(self.parser.iterparse(str(path), Books, "book"))
+
+        self.assertEqual(books.book, result)
+        self.assertEqual({"brk": "urn:books"}, self.parser.ns_map)
+        self.assertEqual(events, self.parser.events)
+
+    def test_iterparse_with_element_or_tree(self):
+        path = fixtures_dir.joinpath("books/books.xml")
+        tree = etree.parse(str(path))
+
+        result = list(self.parser.iterparse(tree, Books, "book.title"))
+        self.assertEqual([x.title for x in books.book], result)
+
+    @mock.patch.object(
+        LxmlEventHandler, "create_context", return_value=[("reverse", None)]
+    )
+    def test_iterparse_with_unhandled_event(self, mock_create_context):
+        handler = LxmlEventHandler(clazz=Books, parser=self.parser)
+
+        with self.assertRaises(XmlHandlerError) as cm:
+            list(handler.iterparse(None, PathTracker([])))
+
+        self.assertEqual("Unhandled event: `reverse`.", str(cm.exception))
+
+
+class LxmlTargetHandlerTests(TestCase):
+    def setUp(self) -> None:
+        self.parser = RecordParser(handler=LxmlTargetHandler)
+
+    def test_parse(self):
+        path = fixtures_dir.joinpath("books/books.xml")
+        self.assertEqual(books, self.parser.from_path(path, Books))
+        self.assertEqual({"brk": "urn:books"}, self.parser.ns_map)
+        self.assertEqual(events, self.parser.events)
+
+    def test_parse_with_default_ns(self):
+        path = fixtures_dir.joinpath("books/books_default_ns.xml")
+        self.assertEqual(books, self.parser.from_path(path, Books))
+        self.assertEqual({None: "urn:books"}, self.parser.ns_map)
+        self.assertEqual(events_default_ns, self.parser.events)
+
+    def test_parse_with_mixed_content(self):
+        xml = (
+            '<p xmlns:x="urn:x">a<b>b<!-- c -->b<i>i</i>b</b>'
+            "c<x:u><i/>u</x:u>e &amp; f</p>"
+        )
+        expected = XmlParser(handler=LxmlEventHandler).from_string(xml, Paragraph)
+        result = XmlParser(handler=LxmlTargetHandler).from_string(xml, Paragraph)
+
+        self.assertEqual(expected, result)
+        self.assertEqual("bb", result.content[1].text)
+        self.assertEqual("e & f", result.content[-1].tail)
+
+    def test_parse_with_element_or_tree(self):
+        path = fixtures_dir.joinpath("books/books.xml")
+        tree = etree.parse(str(path))
+
+        result = self.parser.parse(tree, Books)
+        self.assertEqual(books, result)
+
+        tree = etree.parse(str(path))
+        result = self.parser.parse(tree.find(".//book"), BookForm)
+        self.assertEqual(books.book[0], result)
+
+    def test_parse_with_xinclude(self):
+        path = fixtures_dir.joinpath("books/books-xinclude.xml")
+        ns_map = {"brk": "urn:books", "xi": "http://www.w3.org/2001/XInclude"}
+
+        self.parser.config.process_xinclude = True
+        self.assertEqual(books, self.parser.from_path(path, Books))
+        self.assertEqual(ns_map, self.parser.ns_map)
+
+    def test_parse_with_xml_syntax_error(self):
+        with self.assertRaises(ParserError):
+            self.parser.from_string("<", Books)
+
+    def test_parse_with_truncated_document(self):
+        xml = "<books><book id='1'><author>a</author>t"
+        expected = XmlParser(handler=LxmlEventHandler).from_string(xml, Books)
+        result = XmlParser(handler=LxmlTargetHandler).from_string(xml, Books)
+
+        self.assertEqual(Books(book=[BookForm(author="a", id="1")]), result)
+        self.assertEqual(expected, result)
+
+    def test_parse_with_missing_file(self):
+        path = fixtures_dir.joinpath("books/missing.xml")
+        with self.assertRaises(FileNotFoundError):
+            self.parser.from_path(path, Books)
+
+    @mock.patch.object(etree, "parse")
+    def test_parse_with_io_error(self, mock_parse):
+        error = mock.Mock(
+            domain=etree.ErrorDomains.IO, type=-1, message="Permission denied"
+        )
+        mock_parse.return_value = None
+        with mock.patch.object(
+            LxmlTargetHandler,
+            "create_parser",
+            return_value=mock.Mock(error_log=[error]),
+        ):
+            with self.assertRaises(OSError) as cm:
+                self.parser.parse("books.xml", Books)
+
+        self.assertEqual(
+            "Error reading books.xml: Permission denied", str(cm.exception)
+        )
+
+    def test_feed(self):
+        path = fixtures_dir.joinpath("books/books.xml")
+        data = path.read_bytes()
+
+        for index in range(0, len(data), 100):
+            self.parser.feed(data[index : index + 100], Books)
+
+        self.assertEqual(books, self.parser.close())
+        self.assertEqual(events, self.parser.events)
+
+    def test_parse_with_binding_error(self):
+        with self.assertRaises(ParserError) as cm:
+            self.parser.from_string("<books><foo/><book>", Books)
+
+        self.assertEqual("Unknown property {urn:books}books:foo", str(cm.exception))
+
+        with mock.patch.object(RecordParser, "end", side_effect=ParserError("end")):
+            with self.assertRaises(ParserError) as cm:
+                self.parser.from_string("<books><book/><book>", Books)
+
+        self.assertEqual("end", str(cm.exception))
+
+    def test_feed_with_truncated_document(self):
+        self.parser.feed(b"<books><book id='1'><author>a</author>", Books)
+        result = self.parser.close()
+
+        self.assertEqual(Books(book=[BookForm(author="a", id="1")]), result)
+
+    def test_close_without_data(self):
+        handler = LxmlTargetHandler(clazz=Books, parser=self.parser)
+        self.assertIsNone(handler.close())
+
+    def test_iterparse(self):
+        path = fixtures_dir.joinpath("books/books.xml")
+        result = list(self.parser.iterparse(str(path), Books, "book"))
+
+        self.assertEqual(books.book, result)
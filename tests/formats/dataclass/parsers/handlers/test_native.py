@@ -1,4 +1,5 @@
 import sys
+from unittest import mock
 from unittest.case import TestCase
 from xml import etree
 
@@ -10,11 +11,15 @@ from tests.fixtures.books import Books
 from tests.fixtures.books.fixtures import books
 from tests.fixtures.books.fixtures import events
 from tests.fixtures.books.fixtures import events_default_ns
+from tests.fixtures.models import Paragraph
 from xsdata.exceptions import ParserError
 from xsdata.exceptions import XmlHandlerError
+from xsdata.formats.dataclass.parsers import XmlParser
 from xsdata.formats.dataclass.parsers.bases import RecordParser
 from xsdata.formats.dataclass.parsers.handlers import XmlEventHandler
+from xsdata.formats.dataclass.parsers.handlers import XmlExpatHandler
 from xsdata.formats.dataclass.parsers.handlers.native import get_base_url
+from xsdata.formats.dataclass.parsers.mixins import PathTracker
 
 
 class XmlEventHandlerTests(TestCase):
@@ -80,3 +85,152 @@ class XmlEventHandlerTests(TestCase):
         self.assertIsNone(get_base_url(None, None))
         self.assertIsNone(get_base_url(None, None))
         self.assertEqual("config/", get_base_url("config/", "/tmp/foo.xml"))
+
+    def test_feed(self):
+        path = fixtures_dir.joinpath("books/books.xml")
+        data = path.read_bytes()
+
+        for index in range(0, len(data), 100):
+            self.parser.feed(data[index : index + 100], Books)
+
+        self.assertEqual(books, self.parser.close())
+        self.assertEqual({"brk": "urn:books"}, self.parser.ns_map)
+        self.assertEqual(events, self.parser.events)
+
+    def test_feed_with_error(self):
+        with self.assertRaises(ParserError):
+            self.parser.feed(b"<books><foo>", Books)
+
+        self.assertIsNone(self.parser.feed_handler)
+
+        with self.assertRaises(ParserError):
+            self.parser.feed(b"<books><", Books)
+            self.parser.feed(b"<", Books)
+
+        self.assertIsNone(self.parser.feed_handler)
+
+    def test_close_without_data(self):
+        handler = XmlEventHandler(clazz=Books, parser=self.parser)
+        self.assertIsNone(handler.close())
+
+    def test_iterparse(self):
+        path = fixtures_dir.joinpath("books/books.xml")
+        result = list(self.parser.iterparse(str(path), Books, "book"))
+
+        self.assertEqual(books.book, result)
+        self.assertEqual({"brk": "urn:books"}, self.parser.ns_map)
+        self.assertEqual(events, self.parser.events)
+
+    def test_iterparse_with_element_or_tree(self):
+        path = fixtures_dir.joinpath("books/books.xml")
+        tree = etree.ElementTree.parse(str(path))
+
+        result = list(self.parser.iterparse(tree, Books, "book.title"))
+        self.assertEqual([x.title for x in books.book], result)
+
+    @mock.patch.object(
+        XmlEventHandler, "create_context", return_value=[("reverse", None)]
+    )
+    def test_iterparse_with_unhandled_event(self, mock_create_context):
+        handler = XmlEventHandler(clazz=Books, parser=self.parser)
+
+        with self.assertRaises(XmlHandlerError) as cm:
+            list(handler.iterparse(None, PathTracker([])))
+
+        self.assertEqual("Unhandled event: `reverse`.", str(cm.exception))
+
+
+class XmlExpatHandlerTests(TestCase):
+    def setUp(self):
+        self.parser = RecordParser(handler=XmlExpatHandler)
+
+    def test_parse(self):
+        path = fixtures_dir.joinpath("books/books.xml")
+        self.assertEqual(books, self.parser.from_path(path, Books))
+        self.assertEqual({"brk": "urn:books"}, self.parser.ns_map)
+        self.assertEqual(events, self.parser.events)
+
+    def test_parse_with_default_ns(self):
+        path = fixtures_dir.joinpath("books/books_default_ns.xml")
+        self.assertEqual(books, self.parser.from_path(path, Books))
+        self.assertEqual({None: "urn:books"}, self.parser.ns_map)
+        self.assertEqual(events_default_ns, self.parser.events)
+
+    def test_parse_with_mixed_content(self):
+        xml = (
+            '<p xmlns:x="urn:x">a<b>b<!-- c -->b<i>i</i>b</b>'
+            'c<x:u x:a="1" xml:lang="en"><i/>u</x:u>e &amp; f</p>'
+        )
+        expected = XmlParser(handler=XmlEventHandler).from_string(xml, Paragraph)
+        result = XmlParser(handler=XmlExpatHandler).from_string(xml, Paragraph)
+
+        self.assertEqual(expected, result)
+        self.assertEqual("bb", result.content[1].text)
+        self.assertEqual("e & f", result.content[-1].tail)
+        self.assertEqual(
+            {"{urn:x}a": "1", "{http://www.w3.org/XML/1998/namespace}lang": "en"},
+            result.content[-1].attributes,
+        )
+
+    def test_parse_with_namespace_declarations(self):
+        xml = '<p xmlns="urn:a"><b xmlns:x="urn:x"/><c/></p>'
+        self.parser.from_string(xml, Paragraph)
+
+        ns_maps = [x[-1] for x in self.parser.events if x[0] == "start"]
+        expected = [
+            {None: "urn:a"},
+            {None: "urn:a", "x": "urn:x"},
+            {None: "urn:a"},
+        ]
+        self.assertEqual(expected, ns_maps)
+        self.assertIs(ns_maps[0], ns_maps[2])
+
+    def test_parse_with_element_or_tree(self):
+        path = fixtures_dir.joinpath("books/books.xml")
+        tree = etree.ElementTree.parse(str(path))
+
+        result = self.parser.parse(tree, Books)
+        self.assertEqual(books, result)
+
+    def test_parse_with_xinclude(self):
+        path = fixtures_dir.joinpath("books/books-xinclude.xml")
+
+        self.parser.config.process_xinclude = True
+        self.assertEqual(books, self.parser.from_path(path, Books))
+
+    def test_parse_with_xml_syntax_error(self):
+        with self.assertRaises(ParserError) as cm:
+            self.parser.from_string("<a><", Books)
+
+        self.assertEqual("unclosed token: line 1, column 3", str(cm.exception))
+
+    def test_feed(self):
+        path = fixtures_dir.joinpath("books/books.xml")
+        data = path.read_bytes()
+
+        for index in range(0, len(data), 100):
+            self.parser.feed(data[index : index + 100], Books)
+
+        self.assertEqual(books, self.parser.close())
+        self.assertEqual(events, self.parser.events)
+
+    def test_feed_with_error(self):
+        with self.assertRaises(ParserError):
+            self.parser.feed(b"<books><", Books)
+            self.parser.feed(b"<", Books)
+
+        self.assertIsNone(self.parser.feed_handler)
+
+        self.parser.feed(b"<books>", Books)
+        with self.assertRaises(ParserError):
+            self.parser.close()
+
+    def test_close_without_data(self):
+        handler = XmlExpatHandler(clazz=Books, parser=self.parser)
+        self.assertIsNone(handler.close())
+
+    def test_iterparse(self):
+        path = fixtures_dir.joinpath("books/books.xml")
+        result = list(self.parser.iterparse(str(path), Books, "book"))
+
+        self.assertEqual(books.book, result)
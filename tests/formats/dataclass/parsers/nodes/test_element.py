@@ -20,6 +20,7 @@ from xsdata.formats.dataclass.models.generics import AnyElement
 from xsdata.formats.dataclass.models.generics import DerivedElement
 from xsdata.formats.dataclass.parsers.config import ParserConfig
 from xsdata.formats.dataclass.parsers.nodes import ElementNode
+from xsdata.formats.dataclass.parsers.nodes import LazyNode
 from xsdata.formats.dataclass.parsers.nodes import PrimitiveNode
 from xsdata.formats.dataclass.parsers.nodes import SkipNode
 from xsdata.formats.dataclass.parsers.nodes import StandardNode
@@ -302,6 +303,41 @@ class ElementNodeTests(FactoryTestCase):
         self.assertEqual(ns_map, actual.ns_map)
         self.assertEqual(position, actual.position)
 
+    def test_child_with_projection(self):
+        var = XmlVarFactory.create(
+            xml_type=XmlType.ELEMENT, name="a", qname="a", types=(TypeC,)
+        )
+        self.meta.elements[var.qname] = [var]
+        self.node.config.fail_on_unknown_properties = True
+
+        self.node.projection = {"b": None}
+        actual = self.node.child("a", {}, {}, 0)
+        self.assertIsInstance(actual, SkipNode)
+
+        self.node.projection = {"a": {"x": None}}
+        actual = self.node.child("a", {}, {}, 0)
+        self.assertIsInstance(actual, ElementNode)
+        self.assertEqual({"x": None}, actual.projection)
+
+    def test_bind_with_projection(self):
+        self.node.meta = self.context.build(AttrsType)
+        self.node.attrs = {"index": "0", "extended": "attr"}
+        self.node.projection = {"index": None}
+
+        params = {}
+        self.node.bind_attrs(params)
+        self.assertEqual({"index": 0}, params)
+
+        self.node.meta = self.context.build(NillableType)
+        self.node.projection = {"other": None}
+        params = {}
+        self.assertTrue(self.node.bind_text(params, "foo"))
+        self.assertEqual({}, params)
+
+        self.node.projection = {"value": None}
+        self.assertTrue(self.node.bind_text(params, "foo"))
+        self.assertEqual({"value": "foo"}, params)
+
     def test_child_with_unique_element(self):
         single = XmlVarFactory.create(
             index=1, xml_type=XmlType.ELEMENT, qname="a", types=(TypeC,)
@@ -362,6 +398,21 @@ class ElementNodeTests(FactoryTestCase):
         self.assertEqual(0, actual.level)
         self.assertEqual(0, len(actual.events))
 
+    def test_build_node_with_lazy_var(self):
+        var = XmlVarFactory.create(
+            xml_type=XmlType.ELEMENT, name="a", qname="a", types=(TypeC,), lazy=True
+        )
+        attrs = {"a": "b"}
+        ns_map = {"ns0": "xsdata"}
+        actual = self.node.build_node(var, attrs, ns_map, 10)
+
+        self.assertIsInstance(actual, LazyNode)
+        self.assertEqual(TypeC, actual.clazz)
+        self.assertEqual(attrs, actual.attrs)
+        self.assertEqual(ns_map, actual.ns_map)
+        self.assertEqual(self.meta.namespace, actual.namespace)
+        self.assertFalse(actual.nested)
+
     @mock.patch.object(ParserUtils, "xsi_type", return_value="foo")
     @mock.patch.object(XmlContext, "fetch")
     def test_build_node_with_dataclass_var(self, mock_ctx_fetch, mock_xsi_type):
@@ -0,0 +1,118 @@
+import copy
+import pickle
+from dataclasses import make_dataclass
+from unittest import TestCase
+
+from tests.fixtures.models import TypeB
+from xsdata.formats.dataclass.context import XmlContext
+from xsdata.formats.dataclass.models.generics import LazyElement
+from xsdata.formats.dataclass.parsers.config import ParserConfig
+from xsdata.formats.dataclass.parsers.nodes import LazyNode
+from xsdata.models.enums import EventType
+from xsdata.models.enums import QNames
+
+
+class LazyNodeTests(TestCase):
+    def setUp(self):
+        super().setUp()
+        self.node = LazyNode(
+            clazz=TypeB,
+            attrs={"id": "1"},
+            ns_map={"ns0": "xsdata"},
+            namespace=None,
+            config=ParserConfig(),
+            context=XmlContext(),
+        )
+
+    def test_child(self):
+        actual = self.node.child("x", {}, {}, 1)
+
+        self.assertIsInstance(actual, LazyNode)
+        self.assertTrue(actual.nested)
+        self.assertIs(self.node.events, actual.events)
+        self.assertEqual([(EventType.START, "x", {}, {})], self.node.events)
+
+    def test_bind(self):
+        objects = []
+        child = self.node.child("x", {}, {}, 0)
+        self.assertFalse(child.bind("x", "1", "\n", objects))
+        self.assertEqual(0, len(objects))
+
+        self.assertTrue(self.node.bind("a", None, "tail", objects))
+        self.assertEqual(1, len(objects))
+        self.assertEqual("a", objects[0][0])
+
+        expected = [
+            (EventType.START, "a", {"id": "1"}, {"ns0": "xsdata"}),
+            (EventType.START, "x", {}, {}),
+            (EventType.END, "x", "1", "\n"),
+            (EventType.END, "a", None, None),
+        ]
+        proxy = objects[0][1]
+        self.assertIsInstance(proxy, LazyElement)
+        self.assertEqual(TypeB, proxy.lazy_clazz)
+        self.assertEqual(expected, proxy.lazy_events)
+
+    def test_build(self):
+        objects = []
+        self.node.child("x", {}, {}, 0).bind("x", "1", None, objects)
+        self.node.child("y", {}, {}, 0).bind("y", "b", None, objects)
+        self.node.bind("a", None, None, objects)
+
+        proxy = objects[0][1]
+        self.assertEqual("LazyElement(TypeB)", repr(proxy))
+        self.assertEqual(1, proxy.x)
+        self.assertIsNone(proxy.lazy_events)
+        self.assertEqual(TypeB(x=1, y="b"), proxy.lazy_value())
+        self.assertEqual(TypeB(x=1, y="b"), proxy)
+        self.assertEqual(proxy, TypeB(x=1, y="b"))
+        self.assertEqual("TypeB(x=1, y='b', skip=None)", repr(proxy))
+
+        proxy.y = "c"
+        self.assertEqual("c", proxy.lazy_value().y)
+        self.assertFalse(hasattr(proxy, "__missing__"))
+
+    def test_child_copies_the_attributes(self):
+        attrs = {"a": "1"}
+        self.node.child("x", attrs, {}, 0)
+        attrs.clear()
+
+        self.assertEqual([(EventType.START, "x", {"a": "1"}, {})], self.node.events)
+
+    def test_bind_with_xsi_type(self):
+        objects = []
+        base = make_dataclass("LazyBase", fields=[("x", int)])
+        clazz = make_dataclass("LazyDerived", fields=[], bases=(base,))
+        context = XmlContext()
+        context.register_model(clazz)
+        node = LazyNode(
+            clazz=base,
+            attrs={QNames.XSI_TYPE: "LazyDerived"},
+            ns_map={},
+            namespace=None,
+            config=ParserConfig(),
+            context=context,
+        )
+        node.bind("a", None, None, objects)
+
+        proxy = objects[0][1]
+        self.assertEqual(clazz, proxy.lazy_clazz)
+        self.assertIsInstance(proxy, clazz)
+        self.assertIsNotNone(proxy.lazy_events)
+
+    def test_isinstance_and_pickle(self):
+        objects = []
+        self.node.child("x", {}, {}, 0).bind("x", "1", None, objects)
+        self.node.child("y", {}, {}, 0).bind("y", "b", None, objects)
+        self.node.bind("a", None, None, objects)
+
+        proxy = objects[0][1]
+        self.assertIsInstance(proxy, TypeB)
+        self.assertIsInstance(proxy, LazyElement)
+        self.assertIs(LazyElement, type(proxy))
+        self.assertIsNotNone(proxy.lazy_events)
+
+        clone = pickle.loads(pickle.dumps(proxy))
+        self.assertIs(TypeB, type(clone))
+        self.assertEqual(TypeB(x=1, y="b"), clone)
+        self.assertIs(TypeB, type(copy.deepcopy(proxy)))
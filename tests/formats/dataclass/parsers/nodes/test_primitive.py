@@ -3,14 +3,14 @@ from unittest import TestCase
 
 from xsdata.exceptions import XmlContextError
 from xsdata.formats.dataclass.models.elements import XmlType
+from xsdata.formats.dataclass.models.elements import XmlVar
 from xsdata.formats.dataclass.models.generics import DerivedElement
 from xsdata.formats.dataclass.parsers.nodes import PrimitiveNode
-from xsdata.formats.dataclass.parsers.utils import ParserUtils
 from xsdata.utils.testing import XmlVarFactory
 
 
 class PrimitiveNodeTests(TestCase):
-    @mock.patch.object(ParserUtils, "parse_value")
+    @mock.patch.object(XmlVar, "parse_value")
     def test_bind(self, mock_parse_value):
         mock_parse_value.return_value = 13
         var = XmlVarFactory.create(
@@ -23,14 +23,7 @@ class PrimitiveNodeTests(TestCase):
         self.assertTrue(node.bind("foo", "13", "Impossible", objects))
         self.assertEqual(("foo", 13), objects[-1])
 
-        mock_parse_value.assert_called_once_with(
-            value="13",
-            types=var.types,
-            default=var.default,
-            ns_map=ns_map,
-            tokens_factory=var.tokens_factory,
-            format=var.format,
-        )
+        mock_parse_value.assert_called_once_with("13", ns_map)
 
     def test_bind_derived_mode(self):
         var = XmlVarFactory.create(
@@ -63,7 +63,7 @@ class UnionNodeTests(TestCase):
         root = make_dataclass("Root", [("item", Union[str, int, item2, item])])
 
         meta = self.context.build(root)
-        var = next(meta.find_children("item"))
+        var = meta.find_children("item")[0]
         attrs = {"a": "1", "b": 2}
         ns_map = {}
         node = UnionNode(
@@ -99,7 +99,7 @@ class UnionNodeTests(TestCase):
 
     def test_bind_raises_parser_error_on_failure(self):
         meta = self.context.build(UnionType)
-        var = next(meta.find_children("element"))
+        var = meta.find_children("element")[0]
 
         node = UnionNode(
             position=0,
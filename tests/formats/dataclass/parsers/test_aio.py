@@ -0,0 +1,88 @@
+import asyncio
+from unittest import TestCase
+
+from tests import fixtures_dir
+from tests import run_async
+from tests.fixtures.books import Books
+from xsdata.exceptions import ParserError
+from xsdata.formats.dataclass.parsers import AsyncJsonParser
+from xsdata.formats.dataclass.parsers import AsyncXmlParser
+from xsdata.formats.dataclass.parsers import JsonParser
+from xsdata.formats.dataclass.parsers import XmlParser
+from xsdata.formats.dataclass.parsers.aio import read_chunks
+from xsdata.formats.dataclass.parsers.handlers import XmlEventHandler
+from xsdata.formats.dataclass.parsers.handlers import XmlExpatHandler
+
+
+async def iterate(*chunks):
+    for chunk in chunks:
+        yield chunk
+
+
+class AsyncXmlParserTests(TestCase):
+    def setUp(self):
+        self.source = fixtures_dir.joinpath("books/books.xml").read_bytes()
+        self.expected = XmlParser().from_bytes(self.source, Books)
+
+    def test_parse(self):
+        handlers = (AsyncXmlParser.handler, XmlEventHandler, XmlExpatHandler)
+        for handler in handlers:
+            parser = AsyncXmlParser(handler=handler, chunk_size=100)
+            source = iterate(self.source[:150], self.source[150:])
+            self.assertEqual(self.expected, run_async(parser.parse(source, Books)))
+
+        source = iterate(self.source.decode())
+        self.assertEqual(self.expected, run_async(parser.parse(source, Books)))
+
+    def test_parse_from_stream_reader(self):
+        async def parse():
+            reader = asyncio.StreamReader()
+            reader.feed_data(self.source)
+            reader.feed_eof()
+            return await AsyncXmlParser().parse(reader)
+
+        self.assertEqual(self.expected, run_async(parse()))
+
+    def test_parse_yields_control(self):
+        ticks = []
+
+        async def tick():
+            while True:
+                ticks.append(None)
+                await asyncio.sleep(0)
+
+        async def parse():
+            task = asyncio.ensure_future(tick())
+            parser = AsyncXmlParser(chunk_size=100)
+            result = await parser.parse(iterate(self.source), Books)
+            task.cancel()
+            return result
+
+        self.assertEqual(self.expected, run_async(parse()))
+        self.assertGreater(len(ticks), len(self.source) // 100 - 1)
+
+    def test_parse_raises_parser_error(self):
+        parser = AsyncXmlParser()
+        with self.assertRaises(ParserError):
+            run_async(parser.parse(iterate(b"<books><foo/></books>"), Books))
+
+        with self.assertRaises(ParserError):
+            run_async(parser.parse(iterate(), Books))
+
+    def test_read_chunks(self):
+        async def collect(source):
+            return [chunk async for chunk in read_chunks(source, 2)]
+
+        self.assertEqual(
+            ["ab", "cd", "e", "f"], run_async(collect(iterate("abcde", "f")))
+        )
+
+
+class AsyncJsonParserTests(TestCase):
+    def test_parse(self):
+        source = fixtures_dir.joinpath("books/books.json").read_bytes()
+        expected = JsonParser().from_bytes(source, Books)
+
+        parser = AsyncJsonParser()
+        chunks = iterate(source[:100], source[100:].decode())
+        self.assertEqual(expected, run_async(parser.parse(chunks, Books)))
@@ -0,0 +1,164 @@
+from dataclasses import dataclass
+from dataclasses import field
+from typing import List
+from typing import Optional
+from typing import Tuple
+from unittest import TestCase
+
+from tests import fixtures_dir
+from tests.fixtures.artists import Metadata
+from tests.fixtures.books import Books
+from tests.fixtures.compound.models import Root
+from tests.fixtures.models import AttrsType
+from tests.fixtures.models import ChoiceType
+from tests.fixtures.models import ExtendedType
+from tests.fixtures.models import NillableType
+from tests.fixtures.models import Paragraph
+from tests.fixtures.models import SequentialType
+from tests.fixtures.models import TypeA
+from tests.fixtures.models import TypeDuplicate
+from tests.fixtures.models import UnionType
+from tests.fixtures.primer import PurchaseOrder
+from xsdata.exceptions import ParserError
+from xsdata.formats.converter import converter
+from xsdata.formats.dataclass.context import XmlContext
+from xsdata.formats.dataclass.parsers import XmlParser
+from xsdata.formats.dataclass.parsers.compiler import BinderCompiler
+from xsdata.formats.dataclass.parsers.compiler import compile_binder
+from xsdata.formats.dataclass.parsers.compiler import GENERIC_SOURCE
+from xsdata.formats.dataclass.parsers.config import ParserConfig
+
+
+@dataclass
+class TupleType:
+    value: Tuple[int, ...] = field(
+        default_factory=tuple, metadata={"type": "Element", "name": "v"}
+    )
+    other: List[str] = field(default_factory=list, metadata={"type": "Element"})
+    text: Optional[str] = field(default=None, metadata={"type": "Attribute"})
+
+
+class BinderCompilerTests(TestCase):
+    def setUp(self):
+        self.parser = XmlParser(config=ParserConfig(compiled=True))
+        self.generic = XmlParser()
+
+    def assert_parse(self, source, clazz):
+        expected = self.generic.from_string(source, clazz)
+        self.assertEqual(expected, self.parser.from_string(source, clazz))
+
+    def test_parse_matches_generic_parser(self):
+        samples = [
+            ("books/books.xml", Books),
+            ("primer/sample.xml", PurchaseOrder),
+            ("compound/sample.xml", Root),
+            ("artists/art002.xml", Metadata),
+        ]
+        for path, clazz in samples:
+            source = fixtures_dir.joinpath(path).read_text()
+            self.assert_parse(source, clazz)
+
+        self.assert_parse('<AttrsType index="1" a="b" c="d"/>', AttrsType)
+        self.assert_parse(
+            "<ChoiceType><a>1</a><b><x>1</x><y>a</y></b><int>2</int>"
+            "<float>1.5</float><tokens>1 2</tokens></ChoiceType>",
+            ChoiceType,
+        )
+        self.assert_parse(
+            "<ExtendedType><a>1</a><any>2</any></ExtendedType>", ExtendedType
+        )
+        self.assert_parse(
+            '<NillableType xmlns:xsi="http://www.w3.org/2001/XMLSchema-instance" '
+            'xsi:nil="true"/>',
+            NillableType,
+        )
+        self.assert_parse("<p>a<span>b</span>c</p>", Paragraph)
+        self.assert_parse(
+            "<SequentialType a0='a'>1<x1>2</x1><x2>3</x2><x1>4</x1>"
+            "</SequentialType>",
+            SequentialType,
+        )
+        self.assert_parse(
+            "<TypeDuplicate><x>1</x><x>a</x></TypeDuplicate>", TypeDuplicate
+        )
+        self.assert_parse(
+            "<UnionType><element><x>1</x><y>a</y></element></UnionType>", UnionType
+        )
+
+    def test_parse_with_tuple_factory(self):
+        obj = self.parser.from_string(
+            '<TupleType text="a"><v>1</v><v>2</v></TupleType>', TupleType
+        )
+        self.assertEqual(TupleType(value=(1, 2), other=[], text="a"), obj)
+        self.assertEqual(
+            TupleType(), self.parser.from_string("<TupleType/>", TupleType)
+        )
+
+    def test_parse_with_unknown_attributes(self):
+        self.parser.config.fail_on_unknown_attributes = True
+        with self.assertRaises(ParserError) as cm:
+            self.parser.from_string('<TypeA a="b">1</TypeA>', TypeA)
+
+        self.assertEqual("Unknown attribute TypeA:a", str(cm.exception))
+
+    def test_compile_is_cached_on_the_context(self):
+        context = XmlContext()
+        parser = XmlParser(config=ParserConfig(compiled=True), context=context)
+        parser.from_path(fixtures_dir.joinpath("books/books.xml"), Books)
+
+        self.assertEqual(2, sum(1 for x in context.cache if context.build(x).compiled))
+        func = context.compile(Books, compile_binder)
+        self.assertEqual(func, context.compile(Books, compile_binder))
+
+    def test_parse_after_converter_registry_changes(self):
+        original = converter.type_converter(int)
+        for compiled in (False, True):
+            parser = XmlParser(config=ParserConfig(compiled=compiled))
+            self.assertEqual(1, parser.from_string("<TypeA>1</TypeA>", TypeA).x)
+
+            converter.register_converter(int, lambda x: int(x) * 100)
+            try:
+                result = parser.from_string("<TypeA>1</TypeA>", TypeA)
+            finally:
+                converter.register_converter(int, original)
+
+            self.assertEqual(100, result.x)
+            self.assertEqual(1, parser.from_string("<TypeA>1</TypeA>", TypeA).x)
+
+    def test_build_with_wildcards(self):
+        meta = XmlContext().build(ExtendedType)
+        self.assertEqual(GENERIC_SOURCE, BinderCompiler(meta).build())
+
+    def test_build(self):
+        meta = XmlContext().build(TupleType)
+        expected = (
+            "def bind(node, text, tail, objects):\n"
+            "    params = {}\n"
+            "    ns_map = node.ns_map\n"
+            "    items_0 = params['value'] = []\n"
+            "    items_1 = params['other'] = []\n"
+            "    attrs = node.attrs\n"
+            "    if attrs:\n"
+            "        for qname, value in attrs.items():\n"
+            "            if qname == 'text':\n"
+            "                params['text'] = var_3_deserializer(value, ns_map)\n"
+            "            else:\n"
+            "                node.bind_unknown_attr(params, qname, value)\n"
+            "    position = node.position\n"
+            "    for qname, value in objects[position:]:\n"
+            "        if qname == 'v':\n"
+            "            items_0.append(value)\n"
+            "        elif qname == 'other':\n"
+            "            items_1.append(value)\n"
+            "        elif not node.bind_object(params, qname, value):\n"
+            '            logger.warning("Unassigned parsed object %s", qname)\n'
+            "    del objects[position:]\n"
+            "    if not items_0:\n"
+            "        del params['value']\n"
+            "    else:\n"
+            "        params['value'] = tuple(items_0)\n"
+            "    if not items_1:\n"
+            "        del params['other']\n"
+            "    return params"
+        )
+        self.assertEqual(expected, BinderCompiler(meta).build())
@@ -1,3 +1,4 @@
+import io
 import json
 from typing import List
 from typing import Optional
@@ -31,6 +32,20 @@ class JsonParserTests(FactoryTestCase):
 
         self.parser = JsonParser()
 
+    def test_parse_many(self):
+        path = fixtures_dir.joinpath("books/books.json")
+        sources = [path.read_bytes(), path]
+
+        result = self.parser.parse_many(sources, Books, workers=2)
+        self.assertEqual(2, len(result))
+        self.assertEqual(result[0], result[1])
+        self.assertIsInstance(result[0], Books)
+
+    def test_prepare(self):
+        self.parser.prepare(List[Books])
+        self.assertIn(Books, self.parser.context.cache)
+        self.assertIn(BookForm, self.parser.context.cache)
+
     def test_parser(self):
         path = fixtures_dir.joinpath("books/books.json")
         books = self.parser.from_path(path, Books)
@@ -63,6 +78,28 @@ class JsonParserTests(FactoryTestCase):
             books.book[1],
         )
 
+    def test_parse_with_fields(self):
+        path = fixtures_dir.joinpath("books/books.json")
+        result = self.parser.parse(str(path), Books, fields=["book.title"])
+
+        self.assertEqual(2, len(result.book))
+        self.assertEqual("The First Book", result.book[0].title)
+        self.assertIsNone(result.book[0].author)
+        self.assertIsNone(result.book[1].price)
+
+        data = json.dumps(json.loads(path.read_text())["book"])
+        source = io.BytesIO(data.encode())
+        result = self.parser.parse(source, List[BookForm], fields=["id"])
+        self.assertEqual(["bk001", "bk002"], [x.id for x in result])
+        self.assertIsNone(result[0].title)
+
+        with self.assertRaises(ParserError) as cm:
+            self.parser.parse(str(path), fields=["book.title"])
+
+        self.assertEqual(
+            "The fields projection requires the target class", str(cm.exception)
+        )
+
     def test_parse_empty_document(self):
         self.assertEqual(BookForm(), self.parser.from_string("{}", BookForm))
         self.assertEqual([], self.parser.from_string("[]", List[BookForm]))
@@ -6,6 +6,7 @@ from tests.fixtures.books.fixtures import events
 from xsdata.exceptions import XmlHandlerError
 from xsdata.formats.dataclass.parsers.bases import RecordParser
 from xsdata.formats.dataclass.parsers.mixins import EventsHandler
+from xsdata.formats.dataclass.parsers.mixins import PathTracker
 from xsdata.formats.dataclass.parsers.mixins import XmlHandler
 
 
@@ -20,6 +21,53 @@ class XmlHandlerTests(TestCase):
         with self.assertRaises(NotImplementedError):
             handler.parse(None)
 
+        with self.assertRaises(NotImplementedError):
+            next(handler.iterparse(None, PathTracker([])))
+
+        with self.assertRaises(NotImplementedError):
+            handler.feed(b"")
+
+        with self.assertRaises(NotImplementedError):
+            handler.close()
+
+
+class PathTrackerTests(TestCase):
+    def test_start_and_end(self):
+        tracker = PathTracker([{"b"}, None])
+
+        tracker.start("a", 0)
+        tracker.start("c", 0)
+        tracker.start("d", 0)
+        self.assertEqual(3, tracker.depth)
+        self.assertEqual(1, tracker.matched)
+        self.assertFalse(tracker.end())
+        self.assertFalse(tracker.end())
+
+        tracker.start("b", 1)
+        tracker.start("any", 2)
+        self.assertEqual(3, tracker.matched)
+        self.assertEqual(2, tracker.position)
+
+        tracker.start("e", 3)
+        self.assertEqual(3, tracker.matched)
+        self.assertFalse(tracker.end())
+        self.assertTrue(tracker.end())
+        self.assertFalse(tracker.end())
+        self.assertFalse(tracker.end())
+        self.assertEqual(0, tracker.depth)
+        self.assertEqual(0, tracker.matched)
+
+    def test_pop(self):
+        tracker = PathTracker([{"b"}])
+        tracker.position = 1
+        objects = [("a", 1), ("b", 2), (None, "tail")]
+
+        self.assertEqual([2], list(tracker.pop(objects)))
+        self.assertEqual([("a", 1), (None, "tail")], objects)
+
+        objects = [("a", 1)]
+        self.assertEqual([], list(tracker.pop(objects)))
+
 
 class EventsHandlerTests(TestCase):
     def setUp(self) -> None:
@@ -35,3 +83,14 @@ class EventsHandlerTests(TestCase):
             self.parser.parse([("reverse", "")], Books)
 
         self.assertEqual("Unhandled event: `reverse`.", str(cm.exception))
+
+    def test_iterparse(self):
+        result = list(self.parser.iterparse(events, Books, "book"))
+        self.assertEqual(books.book, result)
+        self.assertEqual({"brk": "urn:books"}, self.parser.ns_map)
+
+    def test_iterparse_with_unhandled_event(self):
+        with self.assertRaises(XmlHandlerError) as cm:
+            list(self.parser.iterparse([("reverse", "")], Books, "book"))
+
+        self.assertEqual("Unhandled event: `reverse`.", str(cm.exception))
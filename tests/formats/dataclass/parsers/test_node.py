@@ -1,3 +1,4 @@
+import io
 from dataclasses import make_dataclass
 from typing import Any
 from unittest import mock
@@ -5,7 +6,10 @@ from unittest.case import TestCase
 
 from tests.fixtures.books import BookForm
 from tests.fixtures.books import Books
+from tests.fixtures.models import ChoiceType
+from tests.fixtures.models import ExtendedType
 from tests.fixtures.models import TypeA
+from tests.fixtures.models import UnionType
 from xsdata.exceptions import ParserError
 from xsdata.formats.dataclass.models.elements import XmlType
 from xsdata.formats.dataclass.models.generics import DerivedElement
@@ -51,6 +55,105 @@ class NodeParserTests(TestCase):
             str(cm.exception),
         )
 
+    def test_prepare(self):
+        self.parser.prepare(Books)
+        self.assertIn(Books, self.parser.context.cache)
+        self.assertIn(BookForm, self.parser.context.cache)
+
+    def test_feed_and_close(self):
+        class TestHandler(XmlHandler):
+            def feed(self, data: Any):
+                self.objects.append((None, data))
+
+            def close(self) -> Any:
+                return Books(book=[x[1] for x in self.objects])
+
+        self.parser.handler = TestHandler
+        self.parser.feed(1, Books)
+        self.parser.feed(2)
+        self.assertEqual(Books(book=[1, 2]), self.parser.close())
+        self.assertIsNone(self.parser.feed_handler)
+
+        with self.assertRaises(ParserError) as cm:
+            self.parser.close()
+
+        self.assertEqual("There is no active feed to close", str(cm.exception))
+
+    def test_feed_with_fail_on_converter_warnings(self):
+        parser = NodeParser(handler=XmlEventHandler)
+        parser.config.fail_on_converter_warnings = True
+
+        with self.assertRaises(ParserError) as cm:
+            parser.feed(b"<TypeA>foo</TypeA>", TypeA)
+            parser.close()
+
+        self.assertEqual(
+            "Failed to convert value `foo` to one of (<class 'int'>,)",
+            str(cm.exception),
+        )
+        self.assertIsNone(parser.feed_handler)
+
+    def test_close_when_result_type_is_wrong(self):
+        class TestHandler(XmlHandler):
+            def feed(self, data: Any):
+                pass
+
+            def close(self) -> Any:
+                return None
+
+        self.parser.handler = TestHandler
+        self.parser.feed(b"", Books)
+
+        with self.assertRaises(ParserError) as cm:
+            self.parser.close()
+
+        self.assertEqual("Failed to create target class `Books`", str(cm.exception))
+
+    def test_iterparse(self):
+        class TestHandler(XmlHandler):
+            def iterparse(self, source: Any, path: Any) -> Any:
+                yield from source
+
+        self.parser.handler = TestHandler
+        result = self.parser.iterparse([1, 2], Books, "book")
+        self.assertEqual([1, 2], list(result))
+
+    def test_iterparse_with_fail_on_converter_warnings(self):
+        parser = NodeParser(handler=XmlEventHandler)
+        parser.config.fail_on_converter_warnings = True
+
+        xml = b"""<ExtendedType><a>foo</a></ExtendedType>"""
+        with self.assertRaises(ParserError) as cm:
+            list(parser.iterparse(io.BytesIO(xml), ExtendedType, "a"))
+
+        self.assertEqual(
+            "Failed to convert value `foo` to one of (<class 'int'>,)",
+            str(cm.exception),
+        )
+
+    def test_build_path(self):
+        self.assertEqual([{"book"}], self.parser.build_path(Books, "book"))
+        self.assertEqual(
+            [{"book"}, {"author"}], self.parser.build_path(Books, "book.author")
+        )
+        self.assertEqual([None], self.parser.build_path(ExtendedType, "wildcard"))
+        self.assertEqual([None], self.parser.build_path(ChoiceType, "choice"))
+
+        actual = self.parser.build_path(UnionType, "element")
+        self.assertEqual([{"element"}], actual)
+
+        with self.assertRaises(ParserError) as cm:
+            self.parser.build_path(ExtendedType, "a.x")
+
+        self.assertEqual("Unknown element field: ExtendedType.a.x", str(cm.exception))
+
+        with self.assertRaises(ParserError) as cm:
+            self.parser.build_path(UnionType, "element.x")
+
+        self.assertEqual(
+            "Unsupported field path: UnionType.element.x", str(cm.exception)
+        )
+
     def test_start(self):
         queue = []
         objects = []
@@ -139,6 +242,7 @@ class NodeParserTests(TestCase):
         b = make_dataclass("b", fields=[], bases=(a,))
 
         parser = NodeParser()
+        parser.context.register_model(b)
         queue = []
         objects = []
 
@@ -1,5 +1,7 @@
 from unittest import mock
 
+from tests.fixtures.books import Books
+from xsdata.exceptions import ParserError
 from xsdata.formats.converter import ConverterFactory
 from xsdata.formats.dataclass.context import XmlContext
 from xsdata.formats.dataclass.parsers.utils import ParserUtils
@@ -95,3 +97,25 @@ class ParserUtilsTests(FactoryTestCase):
         ns_map["http"] = "happens"
         value = ParserUtils.parse_any_attribute("http://www.com", ns_map)
         self.assertEqual("http://www.com", value)
+
+    def test_build_projection(self):
+        context = XmlContext()
+        fields = ["book.title", "book.author", "book.title"]
+        result = ParserUtils.build_projection(context, Books, fields)
+        self.assertEqual({"book": {"title": None, "author": None}}, result)
+
+        fields = ["book.title", "book", "book.author"]
+        result = ParserUtils.build_projection(context, Books, fields)
+        self.assertEqual({"book": None}, result)
+
+        with self.assertRaises(ParserError) as cm:
+            ParserUtils.build_projection(context, Books, ["book.isbn"])
+
+        self.assertEqual("Unknown field: Books.book.isbn", str(cm.exception))
+
+        with self.assertRaises(ParserError) as cm:
+            ParserUtils.build_projection(context, Books, ["book.title.lang"])
+
+        self.assertEqual(
+            "Unsupported field path: Books.book.title.lang", str(cm.exception)
+        )
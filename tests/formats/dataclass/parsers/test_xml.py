@@ -1,15 +1,61 @@
 from unittest import mock
 
+from tests import fixtures_dir
 from tests.fixtures.books import Books
+from tests.fixtures.books.fixtures import books
+from xsdata.exceptions import ParserError
 from xsdata.formats.dataclass.models.elements import XmlType
 from xsdata.formats.dataclass.parsers.nodes import PrimitiveNode
 from xsdata.formats.dataclass.parsers.nodes import SkipNode
 from xsdata.formats.dataclass.parsers.xml import UserXmlParser
+from xsdata.formats.dataclass.parsers.xml import XmlParser
 from xsdata.models.enums import EventType
 from xsdata.utils.testing import FactoryTestCase
 from xsdata.utils.testing import XmlVarFactory
 
 
+class XmlParserTests(FactoryTestCase):
+    def setUp(self):
+        super().setUp()
+        self.parser = XmlParser()
+        self.path = fixtures_dir.joinpath("books/books.xml")
+
+    def test_parse_many(self):
+        sources = [self.path.read_bytes(), self.path, str(self.path)]
+        result = self.parser.parse_many(sources, Books, workers=2, chunk_size=2)
+        self.assertEqual([books, books, books], result)
+
+    def test_parse_with_fields(self):
+        result = self.parser.parse(str(self.path), Books, fields=["book.title"])
+
+        self.assertEqual(2, len(result.book))
+        self.assertEqual(books.book[0].title, result.book[0].title)
+        self.assertEqual(books.book[1].title, result.book[1].title)
+        self.assertIsNone(result.book[0].author)
+        self.assertIsNone(result.book[0].id)
+        self.assertIsNone(self.parser.projection)
+
+        with self.assertRaises(ParserError) as cm:
+            self.parser.parse(str(self.path), fields=["book.title"])
+
+        self.assertEqual(
+            "The fields projection requires the target class", str(cm.exception)
+        )
+
+    def test_parse_many_with_errors(self):
+        sources = [self.path.read_bytes(), b"<books><foo/></books>"]
+
+        with self.assertRaises(ParserError):
+            self.parser.parse_many(sources, Books, workers=2)
+
+        result = self.parser.parse_many(
+            sources, Books, workers=2, return_exceptions=True
+        )
+        self.assertEqual(books, result[0])
+        self.assertIsInstance(result[1], ParserError)
+        self.assertEqual("Unknown property {urn:books}books:foo", str(result[1]))
+
+
 class UserXmlParserTests(FactoryTestCase):
     def setUp(self):
         super().setUp()
@@ -0,0 +1,111 @@
+from unittest import mock
+from unittest import TestCase
+
+from tests import run_async
+from tests.fixtures.books import BookForm
+from tests.fixtures.books import Books
+from xsdata.exceptions import SerializerError
+from xsdata.exceptions import XmlWriterError
+from xsdata.formats.dataclass.serializers import AsyncJsonSerializer
+from xsdata.formats.dataclass.serializers import AsyncXmlSerializer
+from xsdata.formats.dataclass.serializers import JsonSerializer
+from xsdata.formats.dataclass.serializers import XmlSerializer
+from xsdata.formats.dataclass.serializers.config import SerializerConfig
+from xsdata.formats.dataclass.serializers.writers import LxmlEventWriter
+from xsdata.formats.dataclass.serializers.writers import LxmlStreamWriter
+from xsdata.formats.dataclass.serializers.writers import XmlDirectWriter
+from xsdata.formats.dataclass.serializers.writers import XmlEventWriter
+
+
+class AsyncOutput:
+    def __init__(self):
+        self.chunks = []
+
+    async def write(self, data):
+        self.chunks.append(data)
+
+
+class StreamOutput:
+    def __init__(self):
+        self.chunks = []
+        self.drained = 0
+
+    def write(self, data):
+        self.chunks.append(data)
+
+    async def drain(self):
+        self.drained += 1
+
+
+books = Books(
+    book=[
+        BookForm(id=f"bk{index}", author="Ψ", title="ü & <", price=1.0)
+        for index in range(50)
+    ]
+)
+
+
+class AsyncXmlSerializerTests(TestCase):
+    def test_write(self):
+        writers = (XmlEventWriter, XmlDirectWriter, LxmlEventWriter, LxmlStreamWriter)
+        for writer in writers:
+            for pretty_print in (True, False):
+                config = SerializerConfig(pretty_print=pretty_print, flush_interval=7)
+                expected = XmlSerializer(config=config, writer=writer).render_bytes(
+                    books, {"brk": "urn:books"}
+                )
+
+                output = AsyncOutput()
+                serializer = AsyncXmlSerializer(
+                    config=config, writer=writer, chunk_size=256, batch_size=16
+                )
+                run_async(serializer.write(output, books, {"brk": "urn:books"}))
+                self.assertEqual(expected, b"".join(output.chunks))
+
+                if writer is not LxmlEventWriter:
+                    self.assertGreater(len(output.chunks), 10)
+
+    def test_write_to_stream_writer(self):
+        config = SerializerConfig(encoding="ISO-8859-1")
+        serializer = AsyncXmlSerializer(config=config, chunk_size=256)
+        output = StreamOutput()
+        run_async(serializer.write(output, books))
+
+        expected = XmlSerializer(config=config).render_bytes(books)
+        self.assertIn(
+            b"<author>&#936;</author><title>\xfc &amp; &lt;</title>", expected
+        )
+        self.assertEqual(expected, b"".join(output.chunks))
+        self.assertEqual(len(output.chunks), output.drained)
+
+    @mock.patch.object(XmlSerializer, "write_object", return_value=[("reset",)])
+    def test_write_with_unknown_event(self, *args):
+        serializer = AsyncXmlSerializer()
+        with self.assertRaises(XmlWriterError) as cm:
+            run_async(serializer.write(AsyncOutput(), books))
+
+        self.assertEqual("Unhandled event: `reset`", str(cm.exception))
+
+    def test_write_with_compiled_config(self):
+        config = SerializerConfig(compiled=True)
+        serializer = AsyncXmlSerializer(config=config)
+        with self.assertRaises(SerializerError) as cm:
+            run_async(serializer.write(AsyncOutput(), books))
+
+        self.assertEqual(
+            "The compiled config is not supported by the async serializer",
+            str(cm.exception),
+        )
+
+
+class AsyncJsonSerializerTests(TestCase):
+    def test_write(self):
+        for pretty_print in (True, False):
+            config = SerializerConfig(pretty_print=pretty_print)
+            expected = JsonSerializer(config=config).render(books).encode()
+
+            output = StreamOutput()
+            serializer = AsyncJsonSerializer(config=config, chunk_size=256)
+            run_async(serializer.write(output, books))
+            self.assertEqual(expected, b"".join(output.chunks))
+            self.assertGreater(len(output.chunks), 10)
@@ -0,0 +1,158 @@
+from unittest import mock
+from unittest import TestCase
+
+from tests import fixtures_dir
+from tests.fixtures.artists import Metadata
+from tests.fixtures.books.fixtures import books
+from tests.fixtures.compound.models import Root
+from tests.fixtures.models import AttrsType
+from tests.fixtures.models import BaseB
+from tests.fixtures.models import BaseType
+from tests.fixtures.models import ChoiceType
+from tests.fixtures.models import ExtendedType
+from tests.fixtures.models import LazyType
+from tests.fixtures.models import NillableElements
+from tests.fixtures.models import NillableType
+from tests.fixtures.models import Paragraph
+from tests.fixtures.models import SequentialType
+from tests.fixtures.models import TypeA
+from tests.fixtures.models import TypeB
+from tests.fixtures.models import TypeD
+from tests.fixtures.models import UnionType
+from tests.fixtures.primer import PurchaseOrder
+from xsdata.formats.dataclass.context import XmlContext
+from xsdata.formats.dataclass.models.generics import AnyElement
+from xsdata.formats.dataclass.models.generics import DerivedElement
+from xsdata.formats.dataclass.parsers import XmlParser
+from xsdata.formats.dataclass.serializers import XmlSerializer
+from xsdata.formats.dataclass.serializers.compiler import compile_serializer
+from xsdata.formats.dataclass.serializers.compiler import SerializerCompiler
+from xsdata.formats.dataclass.serializers.config import SerializerConfig
+from xsdata.formats.dataclass.serializers.writers import LxmlEventWriter
+from xsdata.formats.dataclass.serializers.writers import LxmlStreamWriter
+from xsdata.formats.dataclass.serializers.writers import XmlDirectWriter
+from xsdata.formats.dataclass.serializers.writers import XmlEventWriter
+
+
+class SerializerCompilerTests(TestCase):
+    def test_render_matches_generic_serializer(self):
+        parser = XmlParser()
+        lazy = parser.from_string(
+            "<LazyType><a><x>1</x><y>a</y></a><b><x>2</x><y>b</y></b></LazyType>",
+            LazyType,
+        )
+        objects = [
+            books,
+            parser.from_path(fixtures_dir.joinpath("primer/sample.xml"), PurchaseOrder),
+            parser.from_path(fixtures_dir.joinpath("compound/sample.xml"), Root),
+            parser.from_path(fixtures_dir.joinpath("artists/art002.xml"), Metadata),
+            AttrsType(index=1, attrs={"a": "b", "{urn:x}c": "d"}),
+            BaseType(element=BaseB(x="1", y="2")),
+            ChoiceType(choice=[TypeA(1), 1, None, 1.5, [1, 2], AnyElement(qname="a")]),
+            ExtendedType(a=TypeA(1), any=TypeB(2, "b"), wildcard=AnyElement(qname="a")),
+            NillableType(value=None),
+            Paragraph(content=["a", AnyElement(qname="b", text="c"), "d"]),
+            SequentialType(a0="a", x0=1, x1=[2, 3, 4, None], x2=[6, 7], x3=[9]),
+            UnionType(element=TypeD(1, "a", True)),
+            DerivedElement(qname="{urn:x}a", value=TypeB(1, "b")),
+            lazy,
+        ]
+
+        writers = (XmlEventWriter, XmlDirectWriter, LxmlEventWriter, LxmlStreamWriter)
+        for writer in writers:
+            for ignore_default_attributes in (True, False):
+                for pretty_print in (True, False):
+                    config = SerializerConfig(
+                        pretty_print=pretty_print,
+                        ignore_default_attributes=ignore_default_attributes,
+                    )
+                    serializer = XmlSerializer(config=config, writer=writer)
+                    for obj in objects:
+                        config.compiled = False
+                        expected = serializer.render(obj, {"x": "urn:x"})
+                        config.compiled = True
+                        actual = serializer.render(obj, {"x": "urn:x"})
+                        self.assertEqual(expected, actual)
+
+    def test_render_nillable_elements(self):
+        objects = [
+            NillableElements(),
+            NillableElements(a=1, b=["x", None, "y"]),
+        ]
+        parser = XmlParser()
+        serializer = XmlSerializer()
+        for obj in objects:
+            serializer.config.compiled = False
+            expected = serializer.render(obj)
+            serializer.config.compiled = True
+            actual = serializer.render(obj)
+
+            self.assertEqual(expected, actual)
+            self.assertEqual(obj, parser.from_string(actual, NillableElements))
+
+    def test_render_with_schema_location(self):
+        config = SerializerConfig(
+            schema_location="urn books.xsd", no_namespace_schema_location="books.xsd"
+        )
+        serializer = XmlSerializer(config=config)
+        expected = serializer.render(books)
+
+        config.compiled = True
+        self.assertEqual(expected, serializer.render(books))
+
+    def test_compile_is_cached_on_the_context(self):
+        context = XmlContext()
+        config = SerializerConfig(compiled=True)
+        serializer = XmlSerializer(config=config, context=context)
+
+        with mock.patch.object(
+            SerializerCompiler, "compile", autospec=True, side_effect=lambda x: x
+        ) as mock_compile:
+            func = context.compile(TypeA, compile_serializer)
+            self.assertIs(func, context.compile(TypeA, compile_serializer))
+            self.assertEqual(1, mock_compile.call_count)
+
+        context.reset()
+        serializer.render(books)
+        self.assertEqual(2, sum(1 for x in context.cache if context.build(x).compiled))
+
+    def test_build(self):
+        context = XmlContext()
+        compiler = SerializerCompiler(context, context.build(TypeA))
+        expected = (
+            "def serialize(serializer, writer, obj, qname, nillable, xsi_type):\n"
+            "    if qname:\n"
+            "        namespace = split_qname(qname)[0]\n"
+            "    else:\n"
+            "        qname = meta_qname\n"
+            "        namespace = meta_namespace\n"
+            "    writer.start_tag(qname)\n"
+            "    if xsi_type:\n"
+            "        writer.add_attribute(XSI_TYPE, QName(xsi_type))\n"
+            "    if nillable:\n"
+            '        writer.add_attribute(XSI_NIL, "true")\n'
+            "    value = obj.x\n"
+            "    if value is not None:\n"
+            "        writer.set_data("
+            "(value if value.__class__ is str else encode(value, var_1)))\n"
+            "    writer.end_tag(qname)"
+        )
+        self.assertEqual(expected, compiler.build())
+        self.assertIsNotNone(compiler.scope["var_1"])
+
+        compiler = SerializerCompiler(context, context.build(TypeB))
+        self.assertIn("if value.__class__ in var_2_types:", compiler.build())
+        self.assertEqual(frozenset((str,)), compiler.scope["var_2_types"])
+
+    def test_getter(self):
+        var = XmlContext().build(TypeA).get_element_vars()[0]
+        self.assertEqual("obj.x", SerializerCompiler.getter(var))
+        self.assertEqual(
+            "getattr(obj, 'x', EMPTY_MAP)", SerializerCompiler.getter(var, "EMPTY_MAP")
+        )
+
+        var.name = "class"
+        self.assertEqual("getattr(obj, 'class')", SerializerCompiler.getter(var))
+
+        var.name = "a-b"
+        self.assertEqual("getattr(obj, 'a-b')", SerializerCompiler.getter(var))
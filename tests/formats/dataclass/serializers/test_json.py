@@ -8,7 +8,9 @@ from unittest.mock import Mock
 from tests.fixtures.books import BookForm
 from tests.fixtures.books import Books
 from tests.fixtures.datatypes import Telephone
+from tests.fixtures.models import LazyType
 from xsdata.exceptions import XmlContextError
+from xsdata.formats.dataclass.parsers import XmlParser
 from xsdata.formats.dataclass.serializers.json import DictFactory
 from xsdata.formats.dataclass.serializers.json import JsonSerializer
 from xsdata.models.datatype import XmlDate
@@ -85,6 +87,16 @@ class JsonSerializerTests(TestCase):
 
         self.assertEqual("optional", actual["use"])
 
+    def test_render_with_lazy_fields(self):
+        xml = "<LazyType><a><x>1</x><y>a</y></a><b><x>2</x><y>b</y></b></LazyType>"
+        obj = XmlParser().from_string(xml, LazyType)
+        actual = json.loads(JsonSerializer().render(obj))
+        expected = {
+            "a": {"x": 1, "y": "a"},
+            "b": [{"x": 2, "y": "b"}],
+        }
+        self.assertEqual(expected, actual)
+
     def test_convert_namedtuple(self):
         var = XmlVarFactory.create(types=(Telephone,))
         serializer = JsonSerializer(dict_factory=DictFactory.FILTER_NONE)
@@ -1,6 +1,7 @@
 from io import StringIO
 from typing import Dict
 from typing import TextIO
+from unittest import mock
 from unittest import TestCase
 from xml.sax.saxutils import XMLGenerator
 
@@ -61,6 +62,22 @@ class XmlWriterTests(TestCase):
             lines[1],
         )
 
+    def test_write_with_flush_interval(self):
+        def events():
+            yield XmlWriterEvent.START, "root"
+            for _ in range(5):
+                yield XmlWriterEvent.START, "row"
+                yield XmlWriterEvent.END, "row"
+
+            yield XmlWriterEvent.END, "root"
+
+        self.writer.config.flush_interval = 2
+        with mock.patch.object(self.writer.output, "flush") as mock_flush:
+            self.writer.write(events())
+
+        self.assertEqual(3, mock_flush.call_count)
+        self.assertEqual(0, self.writer.closed)
+
     def test_write_with_schema_location(self):
         self.writer.config.schema_location = "foo bar"
         events = iter(
@@ -1,10 +1,13 @@
 from dataclasses import make_dataclass
+from io import BytesIO
 from typing import Generator
 from unittest import TestCase
 from xml.etree.ElementTree import QName
 
 from tests.fixtures.books import BookForm
+from tests.fixtures.books import Books
 from tests.fixtures.datatypes import Telephone
+from tests.fixtures.models import LazyType
 from tests.fixtures.models import Paragraph
 from tests.fixtures.models import SequentialType
 from tests.fixtures.models import Span
@@ -14,8 +17,14 @@ from xsdata.exceptions import XmlContextError
 from xsdata.formats.dataclass.models.elements import XmlType
 from xsdata.formats.dataclass.models.generics import AnyElement
 from xsdata.formats.dataclass.models.generics import DerivedElement
+from xsdata.formats.dataclass.parsers import XmlParser
 from xsdata.formats.dataclass.serializers import XmlSerializer
+from xsdata.formats.dataclass.serializers.config import SerializerConfig
 from xsdata.formats.dataclass.serializers.mixins import XmlWriterEvent
+from xsdata.formats.dataclass.serializers.writers import LxmlEventWriter
+from xsdata.formats.dataclass.serializers.writers import LxmlStreamWriter
+from xsdata.formats.dataclass.serializers.writers import XmlDirectWriter
+from xsdata.formats.dataclass.serializers.writers import XmlEventWriter
 from xsdata.models.enums import DataType
 from xsdata.models.enums import QNames
 from xsdata.utils.testing import XmlVarFactory
@@ -25,6 +34,71 @@ class XmlSerializerTests(TestCase):
     def setUp(self) -> None:
         self.serializer = XmlSerializer()
 
+    def test_write_lazy(self):
+        xml = (
+            '<LazyType xmlns:x="xsdata">'
+            '<a x:t="x:foo" code="x:y"><x>1</x><y>a</y></a>'
+            "<b>\n  <x>2</x>\n  <y>b</y>\n</b>"
+            "<b><x>3</x><y>c</y></b>"
+            "</LazyType>"
+        )
+        obj = XmlParser().from_string(xml, LazyType)
+
+        result = list(self.serializer.write_object(obj))
+        ns_map = {"x": "xsdata"}
+        expected = [
+            (XmlWriterEvent.START, "LazyType"),
+            (XmlWriterEvent.START, "a", ns_map),
+            (XmlWriterEvent.ATTR, "{xsdata}t", "x:foo"),
+            (XmlWriterEvent.ATTR, "code", "x:y"),
+            (XmlWriterEvent.DATA, None),
+            (XmlWriterEvent.START, "x", ns_map),
+            (XmlWriterEvent.DATA, "1"),
+            (XmlWriterEvent.END, "x"),
+            (XmlWriterEvent.START, "y", ns_map),
+            (XmlWriterEvent.DATA, "a"),
+            (XmlWriterEvent.END, "y"),
+            (XmlWriterEvent.END, "a"),
+            (XmlWriterEvent.START, "b", ns_map),
+            (XmlWriterEvent.DATA, "\n  "),
+            (XmlWriterEvent.START, "x", ns_map),
+            (XmlWriterEvent.DATA, "2"),
+            (XmlWriterEvent.END, "x"),
+            (XmlWriterEvent.DATA, "\n  "),
+            (XmlWriterEvent.START, "y", ns_map),
+            (XmlWriterEvent.DATA, "b"),
+            (XmlWriterEvent.END, "y"),
+            (XmlWriterEvent.DATA, "\n"),
+            (XmlWriterEvent.END, "b"),
+            (XmlWriterEvent.START, "b", ns_map),
+            (XmlWriterEvent.DATA, None),
+            (XmlWriterEvent.START, "x", ns_map),
+            (XmlWriterEvent.DATA, "3"),
+            (XmlWriterEvent.END, "x"),
+            (XmlWriterEvent.START, "y", ns_map),
+            (XmlWriterEvent.DATA, "c"),
+            (XmlWriterEvent.END, "y"),
+            (XmlWriterEvent.END, "b"),
+            (XmlWriterEvent.END, "LazyType"),
+        ]
+        self.assertEqual(expected, result)
+
+        expected_xml = (
+            '<LazyType><a xmlns:x="xsdata" x:t="x:foo" code="x:y">'
+            "<x>1</x><y>a</y></a>"
+            '<b xmlns:x="xsdata">\n  <x>2</x>\n  <y>b</y>\n</b>'
+        )
+        for writer in (XmlEventWriter, LxmlEventWriter, XmlDirectWriter):
+            serializer = XmlSerializer(writer=writer)
+            serializer.config.xml_declaration = False
+            self.assertIn(expected_xml, serializer.render(obj))
+
+        obj.b[1].y = "d"
+        result = self.serializer.render(obj)
+        self.assertIn("<b><x>3</x><y>d</y></b>", result)
+        self.assertIsNotNone(obj.a.lazy_events)
+        self.assertIsNotNone(obj.b[0].lazy_events)
+
     def test_write_object_with_derived_element(self):
         book = BookForm(id="123")
         obj = DerivedElement(qname="item", value=book)
@@ -147,6 +221,9 @@ class XmlSerializerTests(TestCase):
         result = self.serializer.write_value([1, QName("{a}b"), 3], var, "xsdata")
         self.assertEqual(expected, list(result))
 
+        result = self.serializer.write_value(iter([1, QName("{a}b"), 3]), var, None)
+        self.assertEqual(expected, list(result))
+
         expected = [
             (XmlWriterEvent.START, "a"),
             (XmlWriterEvent.DATA, ["1", "2", "3"]),
@@ -504,13 +581,31 @@ class XmlSerializerTests(TestCase):
         self.assertIsInstance(result, Generator)
         self.assertEqual(expected, list(result))
 
+        result = self.serializer.write_value(iter(value), var, "xsdata")
+        self.assertEqual(expected, list(result))
+
+    def test_write_value_with_generator(self):
+        var = XmlVarFactory.create(xml_type=XmlType.ELEMENT, qname="a", factory=list)
+        consumed = []
+
+        def values():
+            for value in range(3):
+                consumed.append(value)
+                yield value
+
+        result = self.serializer.write_value(values(), var, "xsdata")
+        self.assertEqual((XmlWriterEvent.START, "a"), next(result))
+        self.assertEqual([0], consumed)
+        self.assertEqual(9, len(list(result)) + 1)
+        self.assertEqual([0, 1, 2], consumed)
+
     def test_next_value(self):
         obj = SequentialType(x0=1, x1=[2, 3, 4, None], x2=[6, 7], x3=[9])
         meta = self.serializer.context.build(SequentialType)
         x0 = meta.text
-        x1 = next(meta.find_children("x1"))
-        x2 = next(meta.find_children("x2"))
-        x3 = next(meta.find_children("x3"))
+        x1 = meta.find_children("x1")[0]
+        x2 = meta.find_children("x2")[0]
+        x3 = meta.find_children("x3")[0]
 
         actual = self.serializer.next_value(obj, meta)
         expected = [
@@ -526,6 +621,9 @@ class XmlSerializerTests(TestCase):
         self.assertIsInstance(actual, Generator)
         self.assertEqual(expected, list(actual))
 
+        obj = SequentialType(x0=1, x1=iter([2, 3, 4, None]), x2=iter([6, 7]), x3=[9])
+        self.assertEqual(expected, list(self.serializer.next_value(obj, meta)))
+
     def test_next_attribute(self):
         obj = SequentialType(a0="foo", a1={"b": "c", "d": "e"})
         meta = self.serializer.context.build(SequentialType)
@@ -560,6 +658,52 @@ class XmlSerializerTests(TestCase):
         self.assertIsInstance(actual, Generator)
         self.assertEqual(expected, list(actual))
 
+        obj = SequentialType(a2=iter(["a", "b"]))
+        actual = self.serializer.next_attribute(obj, meta, False, None, False)
+        self.assertEqual([("a2", ["a", "b"])], list(actual))
+
+        obj = SequentialType(a2=iter([]))
+        actual = self.serializer.next_attribute(obj, meta, False, None, False)
+        self.assertEqual([], list(actual))
+
+    def test_render_from_generators(self):
+        def make_books():
+            for index in range(3):
+                yield BookForm(author="a", title=f"{index}", price=1.0)
+
+        books = Books(book=list(make_books()))
+        writers = (XmlEventWriter, XmlDirectWriter, LxmlEventWriter, LxmlStreamWriter)
+        for writer in writers:
+            for compiled in (False, True):
+                config = SerializerConfig(compiled=compiled)
+                serializer = XmlSerializer(config=config, writer=writer)
+                expected = serializer.render(books)
+                actual = serializer.render(Books(book=make_books()))
+                self.assertEqual(expected, actual)
+
+    def test_render_bytes(self):
+        obj = BookForm(author="Ψ", title="ü & <", price=1.0)
+        for writer in (XmlEventWriter, XmlDirectWriter, LxmlEventWriter):
+            serializer = XmlSerializer(writer=writer)
+            expected = serializer.render(obj)
+            self.assertEqual(expected.encode(), serializer.render_bytes(obj))
+
+            serializer.config.encoding = "ISO-8859-1"
+            expected = serializer.render(obj)
+            self.assertIn('encoding="ISO-8859-1"', expected)
+            expected = expected.replace("Ψ", "&#936;").encode("ISO-8859-1")
+            self.assertEqual(expected, serializer.render_bytes(obj))
+
+    def test_write_to_binary_stream(self):
+        output = BytesIO()
+        output.write(b"#")
+        self.serializer.write(output, TypeA(1))
+        output.write(b"#")
+
+        expected = "#{}#".format(self.serializer.render(TypeA(1))).encode()
+        self.assertFalse(output.closed)
+        self.assertEqual(expected, output.getvalue())
+
     def test_render_mixed_content(self):
 
         obj = Paragraph()
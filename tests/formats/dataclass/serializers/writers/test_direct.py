@@ -0,0 +1,143 @@
+from io import StringIO
+from unittest import TestCase
+
+from tests import fixtures_dir
+from tests.fixtures.artists import Metadata
+from tests.fixtures.books.fixtures import books
+from tests.fixtures.compound.models import Root
+from tests.fixtures.models import ExtendedListType
+from tests.fixtures.primer import PurchaseOrder
+from xsdata.formats.dataclass.models.generics import AnyElement
+from xsdata.formats.dataclass.parsers import XmlParser
+from xsdata.formats.dataclass.serializers import XmlSerializer
+from xsdata.formats.dataclass.serializers.config import SerializerConfig
+from xsdata.formats.dataclass.serializers.mixins import XmlWriterEvent
+from xsdata.formats.dataclass.serializers.writers import XmlDirectWriter
+from xsdata.formats.dataclass.serializers.writers import XmlEventWriter
+from xsdata.formats.dataclass.serializers.writers.direct import BUFFER_SIZE
+from xsdata.formats.dataclass.serializers.writers.direct import quote_attribute
+from xsdata.models.enums import QNames
+
+
+class XmlDirectWriterTests(TestCase):
+    def setUp(self):
+        config = SerializerConfig(pretty_print=True)
+        self.serializer = XmlSerializer(config=config, writer=XmlDirectWriter)
+
+    def test_render(self):
+        actual = self.serializer.render(books)
+        expected = fixtures_dir.joinpath("books/books_auto_ns.xml").read_text()
+        self.assertEqual(expected, actual)
+
+    def test_render_with_provided_namespaces(self):
+        actual = self.serializer.render(books, {"brk": "urn:books"})
+        expected = fixtures_dir.joinpath("books/books.xml").read_text()
+        self.assertEqual(expected, actual)
+
+    def test_render_with_default_namespace_prefix(self):
+        actual = self.serializer.render(books, {None: "urn:books"})
+        expected = fixtures_dir.joinpath("books/books_default_ns.xml").read_text()
+        self.assertEqual(expected, actual)
+
+    def test_declaration_disabled(self):
+        self.serializer.config.xml_declaration = False
+        actual = self.serializer.render(books, {None: "urn:books"})
+        expected = fixtures_dir.joinpath("books/books_default_ns.xml").read_text()
+        xml_declaration, expected = expected.split("\n", 1)
+
+        self.assertEqual(expected, actual)
+
+    def test_pretty_print_false(self):
+        self.serializer.config.pretty_print = False
+        actual = self.serializer.render(books)
+        expected = fixtures_dir.joinpath("books/books_auto_ns.xml").read_text()
+
+        _, actual = actual.split("\n", 1)
+        _, expected = expected.split("\n", 1)
+        self.assertEqual(expected.replace("  ", "").replace("\n", ""), actual)
+
+    def test_render_matches_event_writer(self):
+        parser = XmlParser()
+        objects = [
+            parser.from_path(fixtures_dir.joinpath("primer/sample.xml"), PurchaseOrder),
+            parser.from_path(fixtures_dir.joinpath("compound/sample.xml"), Root),
+            parser.from_path(fixtures_dir.joinpath("artists/art002.xml"), Metadata),
+            ExtendedListType(
+                wildcard=[
+                    "text",
+                    AnyElement(
+                        qname="{urn:a}root",
+                        attributes={
+                            "{http://www.w3.org/XML/1998/namespace}lang": "en",
+                            "{urn:b}quote": "a \"b\" 'c'\n<d>",
+                            QNames.XSI_TYPE: "{urn:b}type",
+                        },
+                        children=[
+                            AnyElement(
+                                qname="unqualified", text="1 < 2 & 3 > 2", tail="t"
+                            ),
+                            AnyElement(qname="{urn:b}empty", tail=" tail "),
+                            AnyElement(
+                                qname="{urn:c}nested",
+                                text="text",
+                                children=[AnyElement(qname="{urn:a}deep", text="deep")],
+                            ),
+                        ],
+                    ),
+                ]
+            ),
+        ]
+
+        for pretty_print in (True, False):
+            for obj in objects:
+                for ns_map in (None, {None: "urn:a"}, {"x": "urn:b"}):
+                    config = SerializerConfig(pretty_print=pretty_print)
+                    serializer = XmlSerializer(config=config, writer=XmlEventWriter)
+                    expected = serializer.render(obj, ns_map)
+
+                    serializer.writer = XmlDirectWriter
+                    self.assertEqual(expected, serializer.render(obj, ns_map))
+
+    def test_flush(self):
+        output = StringIO()
+        config = SerializerConfig(flush_interval=1)
+        writer = XmlDirectWriter(config, output, {})
+        writer.start_document()
+
+        def events():
+            yield XmlWriterEvent.START, "root"
+            yield XmlWriterEvent.START, "a"
+            yield XmlWriterEvent.END, "a"
+            self.assertEqual(
+                '<?xml version="1.0" encoding="UTF-8"?>\n<root><a/>', output.getvalue()
+            )
+            yield XmlWriterEvent.END, "root"
+
+        writer.consume(events())
+        writer.end_document()
+        self.assertEqual(
+            '<?xml version="1.0" encoding="UTF-8"?>\n<root><a/></root>',
+            output.getvalue(),
+        )
+
+    def test_write_large_document(self):
+        output = StringIO()
+        writer = XmlDirectWriter(SerializerConfig(xml_declaration=False), output, {})
+        writer.start_tag("root")
+        for _ in range(BUFFER_SIZE):
+            writer.start_tag("a")
+            writer.end_tag("a")
+
+        self.assertTrue(output.getvalue().startswith("<root><a/>"))
+        self.assertLessEqual(len(writer.parts), BUFFER_SIZE)
+
+        writer.end_tag("root")
+        writer.end_document()
+        expected = "<root>{}</root>".format("<a/>" * BUFFER_SIZE)
+        self.assertEqual(expected, output.getvalue())
+
+    def test_quote_attribute(self):
+        self.assertEqual('"a"', quote_attribute("a"))
+        self.assertEqual("'\"a\"'", quote_attribute('"a"'))
+        self.assertEqual('"&quot;a&quot;\'"', quote_attribute('"a"\''))
+        self.assertEqual('"&amp;&lt;&gt;&#10;&#13;&#9;"', quote_attribute("&<>\n\r\t"))
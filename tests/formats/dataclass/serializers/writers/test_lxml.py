@@ -1,10 +1,24 @@
+from io import StringIO
 from unittest import TestCase
 
+from lxml import etree
+
 from tests import fixtures_dir
+from tests.fixtures.artists import Metadata
+from tests.fixtures.books import BookForm
 from tests.fixtures.books.fixtures import books
+from tests.fixtures.compound.models import Root
+from tests.fixtures.models import ExtendedListType
+from tests.fixtures.primer import PurchaseOrder
+from xsdata.formats.dataclass.models.generics import AnyElement
+from xsdata.formats.dataclass.parsers import XmlParser
 from xsdata.formats.dataclass.serializers import XmlSerializer
 from xsdata.formats.dataclass.serializers.config import SerializerConfig
+from xsdata.formats.dataclass.serializers.mixins import XmlWriterEvent
 from xsdata.formats.dataclass.serializers.writers import LxmlEventWriter
+from xsdata.formats.dataclass.serializers.writers import LxmlStreamWriter
+from xsdata.formats.dataclass.serializers.writers import XmlEventWriter
+from xsdata.models.enums import QNames
 
 
 class LxmlEventWriterTests(TestCase):
@@ -57,3 +71,104 @@ class LxmlEventWriterTests(TestCase):
         _, actual = actual.split("\n", 1)
         _, expected = expected.split("\n", 1)
         self.assertEqual(expected.replace("  ", "").replace("\n", ""), actual)
+
+
+def canonicalize(xml: str) -> bytes:
+    root = etree.fromstring(xml.encode())
+    return etree.tostring(root, method="c14n")
+
+
+class LxmlStreamWriterTests(TestCase):
+    def setUp(self):
+        config = SerializerConfig(pretty_print=True)
+        self.serializer = XmlSerializer(config=config, writer=LxmlStreamWriter)
+
+    def test_render(self):
+        actual = self.serializer.render(books)
+        expected = fixtures_dir.joinpath("books/books_auto_ns.xml").read_text()
+        self.assertEqual(expected, actual)
+
+    def test_render_with_provided_namespaces(self):
+        actual = self.serializer.render(books, {"brk": "urn:books"})
+        expected = fixtures_dir.joinpath("books/books.xml").read_text()
+        self.assertEqual(expected, actual)
+
+    def test_render_with_default_namespace_prefix(self):
+        actual = self.serializer.render(books, {None: "urn:books"})
+        expected = fixtures_dir.joinpath("books/books_default_ns.xml").read_text()
+        self.assertEqual(expected, actual)
+
+    def test_encoding(self):
+        obj = BookForm(author="Ψ", title="ü & <", price=1.0)
+        self.serializer.config.pretty_print = False
+        self.serializer.config.encoding = "US-ASCII"
+        actual = self.serializer.render(obj)
+
+        self.assertEqual(
+            '<?xml version="1.0" encoding="US-ASCII"?>\n'
+            '<BookForm lang="en">'
+            "<author>&#936;</author><title>&#252; &amp; &lt;</title>"
+            "<price>1.0</price></BookForm>",
+            actual,
+        )
+
+    def test_render_matches_event_writer(self):
+        parser = XmlParser()
+        objects = [
+            parser.from_path(fixtures_dir.joinpath("primer/sample.xml"), PurchaseOrder),
+            parser.from_path(fixtures_dir.joinpath("compound/sample.xml"), Root),
+            parser.from_path(fixtures_dir.joinpath("artists/art002.xml"), Metadata),
+            ExtendedListType(
+                wildcard=[
+                    "text",
+                    AnyElement(
+                        qname="{urn:a}root",
+                        attributes={
+                            "{http://www.w3.org/XML/1998/namespace}lang": "en",
+                            "{urn:b}quote": "a \"b\" 'c'\n<d>",
+                            QNames.XSI_TYPE: "{urn:b}type",
+                        },
+                        children=[
+                            AnyElement(
+                                qname="unqualified", text="1 < 2 & 3 > 2", tail="t"
+                            ),
+                            AnyElement(qname="{urn:b}empty", tail=" tail "),
+                        ],
+                    ),
+                ]
+            ),
+        ]
+
+        for pretty_print in (True, False):
+            for obj in objects:
+                for ns_map in (None, {None: "urn:a"}, {"x": "urn:b"}):
+                    config = SerializerConfig(pretty_print=pretty_print)
+                    serializer = XmlSerializer(config=config, writer=XmlEventWriter)
+                    expected = canonicalize(serializer.render(obj, ns_map))
+
+                    serializer.writer = LxmlStreamWriter
+                    actual = canonicalize(serializer.render(obj, ns_map))
+                    self.assertEqual(expected, actual)
+
+    def test_flush(self):
+        output = StringIO()
+        config = SerializerConfig(flush_interval=1)
+        writer = LxmlStreamWriter(config, output, {})
+        writer.start_document()
+
+        def events():
+            yield XmlWriterEvent.START, "root"
+            yield XmlWriterEvent.START, "a"
+            yield XmlWriterEvent.END, "a"
+            self.assertEqual(
+                '<?xml version="1.0" encoding="UTF-8"?>\n<root><a></a>',
+                output.getvalue(),
+            )
+            yield XmlWriterEvent.END, "root"
+
+        writer.consume(events())
+        writer.end_document()
+        self.assertEqual(
+            '<?xml version="1.0" encoding="UTF-8"?>\n<root><a></a></root>',
+            output.getvalue(),
+        )
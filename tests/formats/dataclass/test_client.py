@@ -1,14 +1,24 @@
+import asyncio
+import gzip
+import zlib
+from io import BytesIO
 from unittest import mock
 from unittest import TestCase
 
+from requests import HTTPError
+
+from tests import run_async
 from tests.fixtures.calculator import Add
 from tests.fixtures.calculator import CalculatorSoapAdd
 from tests.fixtures.calculator import CalculatorSoapAddInput
 from tests.fixtures.calculator import CalculatorSoapAddOutput
+from tests.fixtures.calculator.server import CalculatorServer
 from xsdata.exceptions import ClientValueError
+from xsdata.formats.dataclass.client import AsyncClient
 from xsdata.formats.dataclass.client import Client
 from xsdata.formats.dataclass.client import Config
 from xsdata.formats.dataclass.client import TransportTypes
+from xsdata.formats.dataclass.transports import DefaultAsyncTransport
 from xsdata.formats.dataclass.transports import DefaultTransport
 
 response = """
@@ -37,6 +47,7 @@ class ClientTests(TestCase):
             "soap_action": "http://tempuri.org/Add",
             "output": CalculatorSoapAddOutput,
             "transport": "http://schemas.xmlsoap.org/soap/http",
+            "compression": None,
         }
 
         self.assertEqual(expected, actual)
@@ -54,7 +65,7 @@ class ClientTests(TestCase):
         self.assertEqual(7, result.body.add_response.add_result)
 
         obj = CalculatorSoapAddInput(body=CalculatorSoapAddInput.Body(add=Add(3, 4)))
-        request = client.serializer.render(obj)
+        request = client.serializer.render_bytes(obj)
 
         mock_post.assert_called_once_with(
             "http://www.dneonline.com/calculator.asmx",
@@ -77,7 +88,7 @@ class ClientTests(TestCase):
         self.assertIsInstance(result, CalculatorSoapAddOutput)
         self.assertEqual(7, result.body.add_response.add_result)
 
-        request = client.serializer.render(obj)
+        request = client.serializer.render_bytes(obj)
 
         mock_post.assert_called_once_with(
             "http://www.dneonline.com/calculator.asmx",
@@ -121,6 +132,46 @@ class ClientTests(TestCase):
         result = client.prepare_headers({})
         self.assertEqual({"SOAPAction": "add", "content-type": "text/xml"}, result)
 
+    def test_prepare_headers_with_compression(self):
+        config = Config.from_service(CalculatorSoapAdd, compression="gzip")
+        client = Client(config=config)
+
+        result = client.prepare_headers({})
+        self.assertEqual("gzip", result["Content-Encoding"])
+        self.assertEqual("gzip, deflate", result["Accept-Encoding"])
+
+    def test_prepare_payload_with_compression(self):
+        obj = CalculatorSoapAddInput(body=CalculatorSoapAddInput.Body(add=Add(3, 4)))
+        config = Config.from_service(CalculatorSoapAdd)
+        expected = Client(config=config).prepare_payload(obj)
+
+        client = Client(config=config._replace(compression="gzip"))
+        self.assertEqual(expected, gzip.decompress(client.prepare_payload(obj)))
+
+        client = Client(config=config._replace(compression="deflate"))
+        self.assertEqual(expected, zlib.decompress(client.prepare_payload(obj)))
+
+        client = Client(config=config._replace(compression="br"))
+        with self.assertRaises(ClientValueError) as cm:
+            client.prepare_payload(obj)
+
+        self.assertEqual("Unsupported compression: `br`", str(cm.exception))
+
+    def test_send_with_compression(self):
+        params = {"Body": {"Add": {"intA": 3, "intB": 4}}}
+        with CalculatorServer(compress=True) as server:
+            config = Config.from_service(
+                CalculatorSoapAdd, location=server.url, compression="gzip"
+            )
+            for stream in (False, True):
+                transport = DefaultTransport(stream=stream)
+                with Client(config=config, transport=transport) as client:
+                    result = client.send(params)
+                    self.assertEqual(7, result.body.add_response.add_result)
+
+        headers = server.requests[0][2]
+        self.assertEqual("gzip", headers["Content-Encoding"])
+
     def test_prepare_headers_raises_error_with_unsupported_binding_transport(self):
         config = Config.from_service(CalculatorSoapAdd, transport="foobar")
         client = Client(config=config)
@@ -129,3 +180,164 @@ class ClientTests(TestCase):
             client.prepare_headers({})
 
         self.assertEqual("Unsupported binding transport: `foobar`", str(cm.exception))
+
+    def test_parse_response_with_stream(self):
+        client = Client.from_service(CalculatorSoapAdd)
+        stream = BytesIO(response.strip().encode())
+
+        result = client.parse_response(stream)
+
+        self.assertEqual(7, result.body.add_response.add_result)
+        self.assertTrue(stream.closed)
+
+    def test_send_with_stream(self):
+        with CalculatorServer() as server:
+            config = Config.from_service(CalculatorSoapAdd, location=server.url)
+            transport = DefaultTransport(stream=True)
+            with Client(config=config, transport=transport) as client:
+                for x in range(3):
+                    params = {"Body": {"Add": {"intA": x, "intB": 4}}}
+                    result = client.send(params)
+                    self.assertEqual(x + 4, result.body.add_response.add_result)
+
+        self.assertEqual(1, server.connections)
+
+    @mock.patch.object(DefaultTransport, "close")
+    def test_close(self, mock_close):
+        with Client.from_service(CalculatorSoapAdd) as client:
+            self.assertIsInstance(client, Client)
+
+        mock_close.assert_called_once_with()
+
+
+class AsyncClientTests(TestCase):
+    def test_send(self):
+        async def send(location):
+            client = AsyncClient.from_service(CalculatorSoapAdd, location=location)
+            async with client:
+                params = {"Body": {"Add": {"intA": 3, "intB": 4}}}
+                return await client.send(params, headers={"User-Agent": "xsdata"})
+
+        with CalculatorServer() as server:
+            result = run_async(send(server.url))
+
+        self.assertIsInstance(result, CalculatorSoapAddOutput)
+        self.assertEqual(7, result.body.add_response.add_result)
+
+        method, path, headers = server.requests[0]
+        self.assertEqual("POST", method)
+        self.assertEqual("/calculator.asmx", path)
+        self.assertEqual("xsdata", headers["User-Agent"])
+        self.assertEqual("text/xml", headers["content-type"])
+        self.assertEqual("http://tempuri.org/Add", headers["SOAPAction"])
+
+    def test_send_many(self):
+        async def send_many(location):
+            client = AsyncClient.from_service(CalculatorSoapAdd, location=location)
+            async with client:
+                objs = [
+                    CalculatorSoapAddInput(
+                        body=CalculatorSoapAddInput.Body(add=Add(x, 4))
+                    )
+                    for x in range(10)
+                ]
+                return await client.send_many(objs, limit=3)
+
+        with CalculatorServer(delay=0.01) as server:
+            results = run_async(send_many(server.url))
+
+        actual = [result.body.add_response.add_result for result in results]
+        self.assertEqual(list(range(4, 14)), actual)
+        self.assertEqual(3, server.connections)
+
+    def test_send_many_with_return_exceptions(self):
+        async def send_many(location, **kwargs):
+            client = AsyncClient.from_service(CalculatorSoapAdd, location=location)
+            async with client:
+                objs = [{"Body": {"Add": {"intA": 1, "intB": 2}}}] * 2
+                return await client.send_many(objs, **kwargs)
+
+        with CalculatorServer() as server:
+            location = server.url.replace("calculator.asmx", "missing")
+            results = run_async(send_many(location, return_exceptions=True))
+
+            self.assertEqual(2, len(results))
+            self.assertTrue(all(isinstance(x, HTTPError) for x in results))
+
+            with self.assertRaises(HTTPError):
+                run_async(send_many(location))
+
+    def test_send_many_cancels_pending_requests_on_error(self):
+        cancelled = []
+
+        async def send(client, obj, headers=None):
+            if obj:
+                raise HTTPError()
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.append(obj)
+                raise
+
+        async def send_many():
+            async with AsyncClient.from_service(CalculatorSoapAdd) as client:
+                return await client.send_many([0, 1, 0])
+
+        with mock.patch.object(AsyncClient, "send", send):
+            with self.assertRaises(HTTPError):
+                run_async(send_many())
+
+        self.assertEqual([0, 0], cancelled)
+
+    def test_send_with_stream_response(self):
+        stream = BytesIO(response.strip().encode())
+
+        async def post(transport, url, data, headers):
+            return stream
+
+        async def send():
+            async with AsyncClient.from_service(CalculatorSoapAdd) as client:
+                return await client.send({"Body": {"Add": {"intA": 3, "intB": 4}}})
+
+        with mock.patch.object(DefaultAsyncTransport, "post", post):
+            result = run_async(send())
+
+        self.assertEqual(7, result.body.add_response.add_result)
+        self.assertTrue(stream.closed)
+
+    def test_send_with_compression(self):
+        async def send(location):
+            client = AsyncClient.from_service(
+                CalculatorSoapAdd, location=location, compression="deflate"
+            )
+            async with client:
+                return await client.send({"Body": {"Add": {"intA": 3, "intB": 4}}})
+
+        with CalculatorServer(compress=True) as server:
+            result = run_async(send(server.url))
+
+        self.assertEqual(7, result.body.add_response.add_result)
+        self.assertEqual("deflate", server.requests[0][2]["Content-Encoding"])
+
+    def test_close(self):
+        async def send(client):
+            async with client:
+                await client.send({"Body": {"Add": {"intA": 1, "intB": 2}}})
+                self.assertEqual(1, len(client.transport.pools))
+
+        with CalculatorServer() as server:
+            client = AsyncClient.from_service(CalculatorSoapAdd, location=server.url)
+            run_async(send(client))
+
+        self.assertIsInstance(client.transport, DefaultAsyncTransport)
+        self.assertEqual({}, client.transport.pools)
+
+    def test_enter_raises_type_error(self):
+        client = AsyncClient.from_service(CalculatorSoapAdd)
+        with self.assertRaises(TypeError) as cm:
+            with client:
+                pass  # pragma: no cover
+
+        self.assertEqual(
+            "Use 'async with' to manage the AsyncClient", str(cm.exception)
+        )
@@ -1,16 +1,30 @@
 import copy
+import importlib
+import pickle
+import sys
+import tempfile
+import threading
+import time
+import types
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import make_dataclass
 from unittest import mock
 
 from tests.fixtures.artists import Artist
 from tests.fixtures.artists import BeginArea
 from tests.fixtures.books import BookForm
+from tests.fixtures.books import Books
 from tests.fixtures.books import BooksForm
 from tests.fixtures.models import BaseType
 from tests.fixtures.models import ChoiceType
 from tests.fixtures.models import UnionType
+from xsdata.exceptions import XmlContextError
 from xsdata.formats.dataclass.context import XmlContext
+from xsdata.formats.dataclass.models.builders import XmlMetaBuilder
+from xsdata.formats.dataclass.parsers.compiler import compile_binder
 from xsdata.models.enums import DataType
+from xsdata.utils import text
+from xsdata.utils.constants import return_input
 from xsdata.utils.testing import FactoryTestCase
 from xsdata.utils.testing import XmlMetaFactory
 
@@ -71,6 +85,97 @@ class XmlContextTests(FactoryTestCase):
         self.ctx.xsi_cache["{urn:books}BookForm"].append(BooksForm)
         self.assertEqual(BooksForm, self.ctx.find_type("{urn:books}BookForm"))
 
+    def test_find_with_unregistered_class(self):
+        a = make_dataclass("Unregistered", fields=[])
+        self.assertIsNone(self.ctx.find_type("Unregistered"))
+
+        self.ctx.register_model(a)
+        self.ctx.register_model(a)
+        self.assertEqual([a], self.ctx.xsi_cache["Unregistered"])
+        self.assertEqual(a, self.ctx.find_type("Unregistered"))
+        self.assertIsNone(self.ctx.find_type("Unknown"))
+
+    def test_build_xsi_cache(self):
+        self.ctx.build_xsi_cache()
+        self.assertTrue(self.ctx.xsi_indexed)
+        self.assertIn(__name__, self.ctx.xsi_modules)
+        self.assertEqual([BookForm], self.ctx.xsi_cache["{urn:books}BookForm"])
+
+        with mock.patch.dict(sys.modules, foo=types.ModuleType("foo")):
+            with mock.patch.object(XmlContext, "register_module") as mock_register:
+                self.ctx.build_xsi_cache()
+                self.ctx.find_type("Unknown")
+
+        self.assertEqual(0, mock_register.call_count)
+
+    def test_build_registers_the_model_module(self):
+        a = make_dataclass("A", fields=[], namespace={"__module__": "foo"})
+        b = make_dataclass("B", fields=[], namespace={"__module__": "foo"})
+        module = types.ModuleType("foo")
+        module.A = a
+        module.B = b
+
+        self.ctx.build_xsi_cache()
+        self.assertIsNone(self.ctx.find_type("B"))
+
+        with mock.patch.dict(sys.modules, foo=module):
+            self.ctx.build(a)
+
+        self.assertIn("foo", self.ctx.xsi_modules)
+        self.assertEqual(b, self.ctx.find_type("B"))
+
+    def test_register_module(self):
+        module = types.ModuleType(__name__)
+        a = make_dataclass("A", fields=[], namespace={"__module__": __name__})
+        b = make_dataclass("B", fields=[], namespace={"__module__": __name__, "A": a})
+        c = make_dataclass("C", fields=[], namespace={"__module__": "bar"})
+        module.B = b
+        module.C = c
+        module.D = b
+
+        self.ctx.register_module(module)
+        self.ctx.register_module(module)
+        self.assertEqual({"A": [a], "B": [b]}, self.ctx.xsi_cache)
+        self.assertEqual({__name__}, self.ctx.xsi_modules)
+
+    @mock.patch.object(importlib, "import_module", wraps=importlib.import_module)
+    def test_register_package(self, mock_import_module):
+        self.ctx.register_package("tests.fixtures.artists")
+
+        mock_import_module.assert_has_calls(
+            [
+                mock.call("tests.fixtures.artists"),
+                mock.call("tests.fixtures.artists.metadata"),
+            ]
+        )
+        self.assertEqual(
+            {"tests.fixtures.artists", "tests.fixtures.artists.metadata"},
+            self.ctx.xsi_modules,
+        )
+        self.assertFalse(self.ctx.xsi_indexed)
+        self.assertEqual(
+            [Artist], self.ctx.xsi_cache["{http://musicbrainz.org/ns/mmd-2.0#}artist"]
+        )
+
+    def test_unregister_modules(self):
+        a = make_dataclass("A", fields=[("x", int)], namespace={"__module__": "foo"})
+        module = types.ModuleType("foo")
+        module.A = a
+
+        with mock.patch.dict(sys.modules, foo=module):
+            self.ctx.register_module(module)
+            self.ctx.build_fields_index()
+
+        self.assertIn("foo", self.ctx.xsi_modules)
+        self.assertEqual([a], self.ctx.xsi_cache["A"])
+        self.assertIn(a, self.ctx.fields_names)
+
+        self.ctx.unregister_modules({"foo"})
+        self.assertNotIn("foo", self.ctx.xsi_modules)
+        self.assertNotIn("A", self.ctx.xsi_cache)
+        self.assertNotIn(a, self.ctx.fields_names)
+        self.assertNotIn(a, self.ctx.fields_index["x"])
+
     def test_find_type_by_fields(self):
         field_names = {"id", "name", "sort-name"}
         self.assertEqual(BeginArea, self.ctx.find_type_by_fields(field_names))
@@ -78,11 +183,43 @@ class XmlContextTests(FactoryTestCase):
         field_names.update({"please", "dont", "exist"})  # Test matching with more
         self.assertIsNone(self.ctx.find_type_by_fields(field_names))
 
+    def test_find_type_by_fields_with_subclasses(self):
+        field_names = {"book"}
+        self.assertEqual(Books, self.ctx.find_type_by_fields(field_names))
+        self.assertEqual([Books, BooksForm], self.ctx.fields_index["book"])
+
+    @mock.patch.object(XmlContext, "build_xsi_cache")
+    def test_build_fields_index(self, mock_build_xsi_cache):
+        a = make_dataclass("A", fields=[("x", int), ("y", int)])
+        b = make_dataclass("B", fields=[("y", int), ("z", int)])
+        c = make_dataclass("C", fields=[("x", "Unknown")])
+        d = make_dataclass("D", fields=[("y", int)], bases=(a,))
+        self.ctx.fields_pending.extend([c, a, b, d])
+
+        with mock.patch.object(XmlContext, "build") as mock_build:
+            self.ctx.build_fields_index()
+            self.assertEqual(0, mock_build.call_count)
+
+        self.assertEqual([], self.ctx.fields_pending)
+        self.assertEqual({"x"}, self.ctx.fields_names[c])
+        self.assertEqual({"x", "y"}, self.ctx.fields_names[a])
+        self.assertEqual({"y", "z"}, self.ctx.fields_names[b])
+        self.assertEqual([c, d, a], self.ctx.fields_index["x"])
+        self.assertEqual([d, a, b], self.ctx.fields_index["y"])
+        self.assertEqual([b], self.ctx.fields_index["z"])
+
+        self.assertEqual(d, self.ctx.find_type_by_fields({"x"}))
+        self.assertEqual(d, self.ctx.find_type_by_fields({"x", "y"}))
+        self.assertEqual(b, self.ctx.find_type_by_fields({"z"}))
+        self.assertIsNone(self.ctx.find_type_by_fields({"x", "z"}))
+
     def test_find_subclass(self):
         a = make_dataclass("A", fields=[])
         b = make_dataclass("B", fields=[], bases=(a,))
         c = make_dataclass("C", fields=[], bases=(a,))
-        other = make_dataclass("Other", fields=[])  # Included in the locals
+        other = make_dataclass("Other", fields=[])
+        for clazz in (a, b, c, other):
+            self.ctx.register_model(clazz)
 
         self.assertEqual(b, self.ctx.find_subclass(a, "B"))
         self.assertEqual(b, self.ctx.find_subclass(c, "B"))
@@ -105,6 +242,153 @@ class XmlContextTests(FactoryTestCase):
         self.assertFalse(self.ctx.is_derived(a(), d))
         self.assertFalse(self.ctx.is_derived(None, d))
 
+    def test_pickle(self):
+        self.ctx.build_recursive(ChoiceType)
+        self.ctx.element_name_generator = text.camel_case
+
+        ctx = pickle.loads(pickle.dumps(self.ctx))
+        self.assertEqual(0, len(ctx.cache))
+        self.assertIsNone(ctx.cache.maxsize)
+        self.assertFalse(ctx.cache.weak)
+        self.assertEqual({}, ctx.xsi_cache)
+        self.assertEqual(set(), ctx.xsi_modules)
+        self.assertFalse(ctx.xsi_indexed)
+        self.assertEqual({}, ctx.fields_index)
+        self.assertEqual({}, ctx.fields_names)
+        self.assertFalse(ctx.frozen)
+        self.assertEqual(text.camel_case, ctx.element_name_generator)
+        self.assertEqual(return_input, ctx.attribute_name_generator)
+        self.assertIsInstance(ctx.class_type, type(self.ctx.class_type))
+
+    def test_build_with_cache_dir(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            ctx = XmlContext(cache_dir=tmp_dir)
+            ctx.build_recursive(ChoiceType)
+            ctx.save_cache()
+
+            ctx = pickle.loads(pickle.dumps(ctx))
+            self.assertEqual(tmp_dir, ctx.cache_dir)
+
+            with mock.patch.object(XmlMetaBuilder, "build") as mock_build:
+                ctx.build_recursive(ChoiceType)
+
+            self.assertEqual(0, mock_build.call_count)
+            self.assertEqual(6, len(ctx.cache))
+
+            ctx = XmlContext(cache_dir=tmp_dir, element_name_generator=text.camel_case)
+            self.assertIsNone(ctx.meta_cache.get(ChoiceType))
+
+        self.assertIsNone(self.ctx.meta_cache)
+        self.ctx.save_cache()
+
+    def test_build_from_multiple_threads(self):
+        workers = 8
+        barrier = threading.Barrier(workers)
+        build = XmlMetaBuilder.build
+
+        def slow_build(*args):
+            time.sleep(0.01)
+            return build(*args)
+
+        def target():
+            barrier.wait()
+            return self.ctx.build(BookForm)
+
+        with mock.patch.object(
+            XmlMetaBuilder, "build", autospec=True, side_effect=slow_build
+        ) as mock_build:
+            with ThreadPoolExecutor(workers) as executor:
+                results = [executor.submit(target) for _ in range(workers)]
+                metas = {id(future.result()) for future in results}
+
+        self.assertEqual(1, mock_build.call_count)
+        self.assertEqual(1, len(metas))
+
+    def test_pickle_with_cache_options(self):
+        ctx = XmlContext(cache_size=10, weak_cache=True)
+        ctx.build(BookForm)
+
+        ctx = pickle.loads(pickle.dumps(ctx))
+        self.assertEqual(0, len(ctx.cache))
+        self.assertEqual(10, ctx.cache.maxsize)
+        self.assertTrue(ctx.cache.weak)
+
+    def test_build_with_cache_size(self):
+        ctx = XmlContext(cache_size=2)
+        ctx.build(BookForm)
+        ctx.build(BooksForm)
+        ctx.build(BookForm)
+        ctx.build(Books)
+
+        self.assertEqual([BookForm, Books], list(ctx.cache))
+        self.assertEqual(1, ctx.cache.hits)
+        self.assertEqual(3, ctx.cache.misses)
+        self.assertEqual(1, ctx.cache.evictions)
+
+        with self.assertRaises(XmlContextError) as cm:
+            ctx.freeze()
+
+        self.assertEqual(
+            "A context with a bounded cache can't be frozen", str(cm.exception)
+        )
+
+    def test_compile_with_cache_size(self):
+        ctx = XmlContext(cache_size=1)
+        func = ctx.compile(BookForm, compile_binder)
+        meta = ctx.build(BookForm)
+        self.assertIs(func, meta.compiled[compile_binder][1])
+
+        ctx.build(Books)
+        self.assertNotIn(BookForm, ctx.cache)
+
+        self.assertIsNot(func, ctx.compile(BookForm, compile_binder))
+        self.assertIsNot(meta, ctx.build(BookForm))
+
+    def test_freeze(self):
+        meta = self.ctx.build(BookForm)
+        self.ctx.freeze()
+
+        self.assertTrue(self.ctx.frozen)
+        self.assertTrue(self.ctx.xsi_indexed)
+        self.assertEqual([], self.ctx.fields_pending)
+        self.assertEqual(Books, self.ctx.find_type_by_fields({"book"}))
+        self.assertIsNone(self.ctx.cache.peek(Books))
+        self.assertIs(meta, self.ctx.build(BookForm))
+
+        func = self.ctx.compile(BookForm, compile_binder)
+        self.assertIs(func, meta.compiled[compile_binder][1])
+
+        self.assertEqual([], self.ctx.find_types("{urn:books}unknown"))
+        self.assertNotIn("{urn:books}unknown", self.ctx.xsi_cache)
+
+        late = make_dataclass("Late", fields=[])
+        with self.assertRaises(XmlContextError) as cm:
+            self.ctx.build(late)
+
+        self.assertEqual(
+            "The context is frozen, can't build the binding metadata of Late",
+            str(cm.exception),
+        )
+
+        with self.assertRaises(XmlContextError) as cm:
+            self.ctx.reset()
+
+        self.assertEqual("The context is frozen and can't be reset", str(cm.exception))
+
+        with self.assertRaises(XmlContextError) as cm:
+            self.ctx.register_model(BooksForm)
+
+        self.assertEqual(
+            "The context is frozen, can't register models", str(cm.exception)
+        )
+
+        with self.assertRaises(XmlContextError) as cm:
+            self.ctx.unregister_modules({"foo"})
+
+        self.assertEqual(
+            "The context is frozen, can't unregister models", str(cm.exception)
+        )
+
     def test_build_recursive(self):
         self.ctx.build_recursive(ChoiceType)
         self.assertEqual(6, len(self.ctx.cache))
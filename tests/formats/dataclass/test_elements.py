@@ -11,6 +11,7 @@ from tests.fixtures.models import TypeC
 from tests.fixtures.models import TypeD
 from tests.fixtures.models import TypeDuplicate
 from tests.fixtures.models import UnionType
+from xsdata.formats.converter import converter
 from xsdata.formats.dataclass.context import XmlContext
 from xsdata.formats.dataclass.models.elements import XmlType
 from xsdata.formats.dataclass.models.elements import XmlVar
@@ -138,6 +139,44 @@ class XmlValTests(TestCase):
         var.namespace_matches["{tns}cached"] = True
         self.assertTrue(var.match_namespace("{tns}cached"))
 
+    def test_parse_value(self):
+        var = XmlVarFactory.create(xml_type=XmlType.TEXT, name="foo", types=(int,))
+        self.assertIs(converter.build_deserializer((int,)), var.deserializer)
+        self.assertEqual(1, var.parse_value("1"))
+
+        var.default = 2
+        self.assertEqual(2, var.parse_value(None))
+
+        var = XmlVarFactory.create(
+            xml_type=XmlType.TEXT,
+            name="foo",
+            types=(int,),
+            tokens_factory=list,
+            default=lambda: [1],
+        )
+        self.assertEqual([1], var.parse_value(None))
+        self.assertEqual([1, 2], var.parse_value(" 1  2 "))
+        self.assertEqual([1, 2], var.parse_value(["1", "2"]))
+
+        var = XmlVarFactory.create(xml_type=XmlType.TEXT, name="foo", types=(QName,))
+        self.assertEqual(QName("{bar}a"), var.parse_value("x:a", {"x": "bar"}))
+
+    def test_parse_value_after_converter_registry_changes(self):
+        class MinusOneInt(int):
+            pass
+
+        var = XmlVarFactory.create(
+            xml_type=XmlType.TEXT, name="foo", types=(MinusOneInt,)
+        )
+        self.assertEqual(2, var.parse_value("2"))
+
+        converter.register_converter(MinusOneInt, lambda x: int(x) - 1)
+        self.assertEqual(1, var.parse_value("2"))
+        self.assertEqual(converter.generation, var.generation)
+
+        converter.unregister_converter(MinusOneInt)
+        self.assertEqual(2, var.parse_value("2"))
+
 
 class XmlMetaTests(TestCase):
     def setUp(self) -> None:
@@ -166,7 +205,8 @@ class XmlMetaTests(TestCase):
             "attributes={}, "
             "any_attributes=[], "
             "namespace=None, "
-            "mixed_content=False)"
+            "mixed_content=False, "
+            "children={}, compiled={})"
         )
         self.assertEqual(expected, repr(self.meta))
 
@@ -235,19 +275,29 @@ class XmlMetaTests(TestCase):
 
     def test_find_children(self):
         meta = self.context.build(TypeDuplicate)
-        self.assertIsNone(next(meta.find_children("a"), None))
+        self.assertEqual((), meta.find_children("a"))
         self.assertEqual(["x", "x1"], list(el.name for el in meta.find_children("x")))
+        self.assertEqual({"x"}, set(meta.children.keys()))
 
         meta = self.context.build(TypeB)
-        self.assertEqual("x", next(meta.find_children("x")).qname)
-        self.assertEqual("y", next(meta.find_children("y")).qname)
+        self.assertEqual("x", meta.find_children("x")[0].qname)
+        self.assertEqual("y", meta.find_children("y")[0].qname)
 
         meta = self.context.build(ChoiceType)
-        self.assertIsNone(next(meta.find_children("404"), None))
-        self.assertEqual("a", next(meta.find_children("a")).qname)
-        self.assertEqual("b", next(meta.find_children("b")).qname)
-        self.assertEqual("int", next(meta.find_children("int")).qname)
+        self.assertEqual((), meta.find_children("404"))
+        self.assertEqual("a", meta.find_children("a")[0].qname)
+        self.assertEqual("b", meta.find_children("b")[0].qname)
+        self.assertEqual("int", meta.find_children("int")[0].qname)
 
         meta = self.context.build(Paragraph)
-        self.assertEqual("content", next(meta.find_children("404")).qname)
-        self.assertTrue(next(meta.find_children("content")).is_wildcard)
+        self.assertEqual("content", meta.find_children("404")[0].qname)
+        self.assertTrue(meta.find_children("content")[0].is_wildcard)
+        self.assertEqual({}, meta.children)
+
+    def test_find_children_is_cached(self):
+        meta = self.context.build(TypeB)
+        result = meta.find_children("x")
+        self.assertIs(result, meta.find_children("x"))
+
+        meta.children["x"] = ()
+        self.assertEqual((), meta.find_children("x"))
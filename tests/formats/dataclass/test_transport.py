@@ -1,16 +1,27 @@
+import asyncio
+import gzip
+import zlib
 from unittest import mock
 from unittest import TestCase
 
 from requests import HTTPError
 from requests import Response
+from requests import Session
 
+from tests import fixtures_dir
+from tests import run_async
+from tests.fixtures.calculator.server import CalculatorServer
+from xsdata.formats.dataclass.transports import ConnectionClosedError
+from xsdata.formats.dataclass.transports import ConnectionPool
+from xsdata.formats.dataclass.transports import decode_content
+from xsdata.formats.dataclass.transports import DefaultAsyncTransport
 from xsdata.formats.dataclass.transports import DefaultTransport
 
 
 class DefaultTransportTest(TestCase):
     @mock.patch.object(Response, "content", new_callable=mock.PropertyMock)
     @mock.patch.object(Response, "raise_for_status")
-    @mock.patch("xsdata.formats.dataclass.transports.requests.get")
+    @mock.patch.object(Session, "get")
     def test_get(self, mock_get, mock_raise_for_status, mock_content):
         transport = DefaultTransport()
         params = {"a": "b"}
@@ -31,7 +42,7 @@ class DefaultTransportTest(TestCase):
 
     @mock.patch.object(Response, "content", new_callable=mock.PropertyMock)
     @mock.patch.object(Response, "raise_for_status")
-    @mock.patch("xsdata.formats.dataclass.transports.requests.post")
+    @mock.patch.object(Session, "post")
     def test_post(self, mock_post, mock_raise_for_status, mock_content):
         transport = DefaultTransport(timeout=1.0)
         data = {"a": "b"}
@@ -48,7 +59,7 @@ class DefaultTransportTest(TestCase):
         self.assertEqual(0, mock_raise_for_status.call_count)
 
         mock_post.assert_called_once_with(
-            url, data=data, headers=headers, timeout=transport.timeout
+            url, data=data, headers=headers, timeout=transport.timeout, stream=False
         )
 
     @mock.patch.object(Response, "content", new_callable=mock.PropertyMock)
@@ -70,3 +81,247 @@ class DefaultTransportTest(TestCase):
             transport.handle_response(response)
 
         self.assertEqual("401 Client Error: Nope for url: xsdata", str(cm.exception))
+
+    def test_init(self):
+        transport = DefaultTransport(timeout=(1.0, 3.0), pool_size=4, retries=2)
+        adapter = transport.session.get_adapter("https://endpoint.stub")
+
+        self.assertEqual((1.0, 3.0), transport.timeout)
+        self.assertIs(adapter, transport.session.get_adapter("http://endpoint.stub"))
+        self.assertEqual(4, adapter._pool_maxsize)
+        self.assertEqual(2, adapter.max_retries.total)
+        self.assertEqual("keep-alive", transport.session.headers["Connection"])
+
+        transport = DefaultTransport(keep_alive=False)
+        self.assertEqual("close", transport.session.headers["Connection"])
+
+    def test_post_reuses_connections(self):
+        request = fixtures_dir.joinpath("calculator/AddRQ.xml").read_bytes()
+        headers = {"content-type": "text/xml"}
+
+        with CalculatorServer() as server:
+            transport = DefaultTransport()
+            for _ in range(3):
+                result = transport.post(server.url, request, headers)
+                self.assertIn(b"<ns1:AddResult>4</ns1:AddResult>", result)
+
+            transport.close()
+
+        self.assertEqual(1, server.connections)
+
+        with CalculatorServer() as server:
+            transport = DefaultTransport(keep_alive=False)
+            for _ in range(3):
+                transport.post(server.url, request, headers)
+
+            transport.close()
+
+        self.assertEqual(3, server.connections)
+
+    def test_post_with_stream(self):
+        request = fixtures_dir.joinpath("calculator/AddRQ.xml").read_bytes()
+        headers = {"content-type": "text/xml"}
+
+        with CalculatorServer(chunked=True) as server:
+            expected = DefaultTransport().post(server.url, request, headers)
+
+            transport = DefaultTransport(stream=True)
+            for _ in range(2):
+                result = transport.post(server.url, request, headers)
+                self.assertEqual(expected, result.read())
+                result.close()
+
+            with self.assertRaises(HTTPError):
+                transport.post(f"{server.url}/missing", request, headers)
+
+            transport.close()
+
+        self.assertEqual(2, server.connections)
+
+    @mock.patch.object(Session, "close")
+    def test_close(self, mock_close):
+        DefaultTransport().close()
+        mock_close.assert_called_once_with()
+
+
+class DefaultAsyncTransportTests(TestCase):
+    def setUp(self):
+        self.request = fixtures_dir.joinpath("calculator/AddRQ.xml").read_bytes()
+        self.headers = {"content-type": "text/xml"}
+
+    def post(self, transport, url, times=1):
+        async def post():
+            try:
+                return await asyncio.gather(
+                    *(
+                        transport.post(url, self.request, self.headers)
+                        for _ in range(times)
+                    )
+                )
+            finally:
+                await transport.close()
+
+        return run_async(post())
+
+    def test_post_reuses_connections(self):
+        transport = DefaultAsyncTransport()
+        with CalculatorServer() as server:
+
+            async def post():
+                try:
+                    return [
+                        await transport.post(server.url, self.request, self.headers)
+                        for _ in range(3)
+                    ]
+                finally:
+                    await transport.close()
+
+            results = run_async(post())
+
+        self.assertEqual(3, len(results))
+        self.assertIn(b"<ns1:AddResult>4</ns1:AddResult>", results[0])
+        self.assertEqual(1, server.connections)
+        self.assertEqual({}, transport.pools)
+
+        method, path, headers = server.requests[0]
+        self.assertEqual("POST", method)
+        self.assertEqual("/calculator.asmx", path)
+        self.assertEqual("text/xml", headers["content-type"])
+        self.assertEqual(str(len(self.request)), headers["Content-Length"])
+
+    def test_post_with_pool_size(self):
+        transport = DefaultAsyncTransport(pool_size=2)
+        with CalculatorServer(delay=0.01) as server:
+            results = self.post(transport, server.url, times=6)
+
+        self.assertEqual(6, len(results))
+        self.assertEqual(2, server.connections)
+
+    def test_post_timeout_excludes_the_pool_wait(self):
+        transport = DefaultAsyncTransport(timeout=0.5, pool_size=2)
+        with CalculatorServer(delay=0.25) as server:
+            results = self.post(transport, server.url, times=8)
+
+        self.assertEqual(8, len(results))
+        self.assertEqual(2, server.connections)
+
+    def test_post_host_header(self):
+        transport = DefaultAsyncTransport()
+        with CalculatorServer() as server:
+            host, port = server.server_address[:2]
+            self.post(transport, server.url.replace("://", "://user:secret@"))
+
+        self.assertEqual(f"{host}:{port}", server.requests[0][2]["Host"])
+        self.assertNotIn("secret", str(server.requests))
+
+    def test_post_with_closed_connections(self):
+        transport = DefaultAsyncTransport()
+        with CalculatorServer(keep_alive=False) as server:
+            self.post(transport, server.url)
+            self.post(transport, server.url)
+
+        self.assertEqual(2, server.connections)
+
+        with CalculatorServer(keep_alive=False, announce_close=False) as server:
+
+            async def post():
+                try:
+                    for _ in range(3):
+                        await transport.post(server.url, self.request, self.headers)
+                finally:
+                    await transport.close()
+
+            run_async(post())
+
+        self.assertEqual(3, server.connections)
+
+    @mock.patch.object(asyncio, "open_connection")
+    @mock.patch.object(ConnectionPool, "exchange")
+    def test_dispatch_retries_only_closed_idle_connections(
+        self, mock_exchange, mock_open_connection
+    ):
+        async def open_connection(*args, **kwargs):
+            return "new", "new"
+
+        async def dispatch(error):
+            pool = ConnectionPool("localhost", 80, False, 1)
+            pool.idle.append((mock.Mock(at_eof=mock.Mock(return_value=False)), None))
+            mock_exchange.side_effect = [error, (200, "OK", b"a")]
+            return await pool.dispatch(b"request")
+
+        mock_open_connection.side_effect = open_connection
+        result = run_async(dispatch(ConnectionClosedError()))
+        self.assertEqual((200, "OK", b"a"), result)
+        self.assertEqual("new", mock_exchange.call_args[0][0])
+
+        mock_open_connection.reset_mock()
+        with self.assertRaises(ConnectionResetError):
+            run_async(dispatch(ConnectionResetError()))
+
+        self.assertEqual(0, mock_open_connection.call_count)
+
+    def test_post_with_chunked_response(self):
+        transport = DefaultAsyncTransport()
+        with CalculatorServer() as server:
+            expected = self.post(transport, server.url)
+
+        with CalculatorServer(chunked=True) as server:
+            self.assertEqual(expected, self.post(transport, server.url))
+
+    def test_post_raises_http_error(self):
+        transport = DefaultAsyncTransport()
+        with CalculatorServer() as server:
+            url = server.url.replace("calculator.asmx", "missing")
+            with self.assertRaises(HTTPError) as cm:
+                self.post(transport, url)
+
+        self.assertEqual(
+            f"404 Client Error: Not Found for url: {url}", str(cm.exception)
+        )
+
+    def test_post_with_timeout(self):
+        transport = DefaultAsyncTransport(timeout=0.05)
+        with CalculatorServer(delay=0.5) as server:
+            with self.assertRaises(asyncio.TimeoutError):
+                self.post(transport, server.url)
+
+    def test_get(self):
+        transport = DefaultAsyncTransport()
+        with CalculatorServer() as server:
+            url = server.url + "?a=b"
+
+            async def get():
+                try:
+                    return await transport.get(url, {"c": "d e"}, {})
+                finally:
+                    await transport.close()
+
+            result = run_async(get())
+
+        self.assertEqual(b"/calculator.asmx?a=b&c=d+e", result)
+        self.assertNotIn("Content-Length", server.requests[0][2])
+
+    def test_handle_response(self):
+        transport = DefaultAsyncTransport()
+        self.assertEqual(b"a", transport.handle_response("url", 200, "OK", b"a"))
+        self.assertEqual(b"a", transport.handle_response("url", 500, "Error", b"a"))
+
+        with self.assertRaises(HTTPError) as cm:
+            transport.handle_response("xsdata", 503, "Nope", b"")
+
+        self.assertEqual("503 Server Error: Nope for url: xsdata", str(cm.exception))
+
+
+class DecodeContentTests(TestCase):
+    def test_decode_content(self):
+        content = b"<a>foo</a>"
+        raw = zlib.compressobj(wbits=-zlib.MAX_WBITS)
+        raw_deflate = raw.compress(content) + raw.flush()
+
+        self.assertEqual(content, decode_content(content, ""))
+        self.assertEqual(content, decode_content(content, "identity"))
+        self.assertEqual(content, decode_content(gzip.compress(content), "GZIP"))
+        self.assertEqual(content, decode_content(gzip.compress(content), "x-gzip"))
+        self.assertEqual(content, decode_content(zlib.compress(content), "deflate"))
+        self.assertEqual(content, decode_content(raw_deflate, "deflate"))
+        self.assertEqual(b"", decode_content(b"", "gzip"))
@@ -99,6 +99,75 @@ class ConverterFactoryTests(TestCase):
         self.assertEqual(2, converter.deserialize("3", [MinusOneInt]))
         converter.unregister_converter(MinusOneInt)
 
+    def test_find_converter(self):
+        class A:
+            pass
+
+        class MinusOneInt(int):
+            pass
+
+        self.assertIsNone(converter.find_converter(A))
+        self.assertIs(converter.registry[int], converter.find_converter(MinusOneInt))
+        self.assertIs(converter.registry[str], converter.find_converter(str))
+
+    def test_build_deserializer(self):
+        func = converter.build_deserializer([int, bool])
+        self.assertIs(func, converter.build_deserializer((int, bool)))
+        self.assertIsNot(func, converter.build_deserializer((bool, int)))
+
+        self.assertFalse(func("false"))
+        self.assertEqual(1, func("1"))
+
+        with warnings.catch_warnings(record=True) as w:
+            self.assertEqual("a", func("a"))
+
+        self.assertEqual(
+            "Failed to convert value `a` to one of (<class 'int'>, <class 'bool'>)",
+            str(w[-1].message),
+        )
+
+        func = converter.build_deserializer([QName])
+        self.assertEqual(QName("{bar}a"), func("x:a", {"x": "bar"}))
+
+        func = converter.build_deserializer([date], format="%d %B %Y")
+        self.assertEqual(date(2021, 1, 31), func("31 January 2021"))
+
+    def test_build_deserializer_with_proxy_converter(self):
+        class MinusOneInt(int):
+            pass
+
+        converter.register_converter(MinusOneInt, lambda x: int(x) - 1)
+        func = converter.build_deserializer([MinusOneInt])
+        self.assertEqual(1, func("2"))
+
+        with warnings.catch_warnings(record=True) as w:
+            self.assertEqual("a", func("a"))
+
+        self.assertEqual(1, len(w))
+        converter.unregister_converter(MinusOneInt)
+
+    def test_build_deserializer_with_unknown_type(self):
+        class A:
+            pass
+
+        func = converter.build_deserializer([A])
+        with warnings.catch_warnings(record=True) as w:
+            self.assertEqual("a", func("a"))
+
+        self.assertEqual(f"No converter registered for `{A}`", str(w[0].message))
+
+    def test_build_deserializer_cache_is_reset_on_registry_changes(self):
+        class MinusOneInt(int):
+            pass
+
+        self.assertEqual(2, converter.build_deserializer([MinusOneInt])("2"))
+
+        converter.register_converter(MinusOneInt, lambda x: int(x) - 1)
+        self.assertEqual(1, converter.build_deserializer([MinusOneInt])("2"))
+
+        converter.unregister_converter(MinusOneInt)
+        self.assertEqual(2, converter.build_deserializer([MinusOneInt])("2"))
+
 
 class StrConverterTests(TestCase):
     def setUp(self):
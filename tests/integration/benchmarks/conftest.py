@@ -4,8 +4,10 @@ from tests.fixtures.books import Books
 from xsdata.formats.dataclass.context import XmlContext
 from xsdata.formats.dataclass.parsers import JsonParser
 from xsdata.formats.dataclass.parsers import XmlParser
+from xsdata.formats.dataclass.parsers.config import ParserConfig
 from xsdata.formats.dataclass.serializers import JsonSerializer
 from xsdata.formats.dataclass.serializers import XmlSerializer
+from xsdata.formats.dataclass.serializers.config import SerializerConfig
 from xsdata.models.datatype import XmlDate
 
 xsdata_temp_dir.mkdir(parents=True, exist_ok=True)
@@ -43,8 +45,9 @@ def make_books(how_many: int):
     )
 
 
-def parse(source, handler):
-    parser = XmlParser(context=context, handler=handler)
+def parse(source, handler, compiled=False):
+    config = ParserConfig(compiled=compiled)
+    parser = XmlParser(config=config, context=context, handler=handler)
     parser.from_bytes(source, Books)
 
 
@@ -53,9 +56,10 @@ def parse_json(source):
     parser.from_bytes(source, Books)
 
 
-def write(size, obj, writer):
+def write(size, obj, writer, compiled=False):
     with xsdata_temp_dir.joinpath(f"benchmark_{size}.xml").open("w") as f:
-        serializer = XmlSerializer(writer=writer, context=context)
+        config = SerializerConfig(compiled=compiled)
+        serializer = XmlSerializer(config=config, writer=writer, context=context)
         serializer.write(f, obj)
 
 
@@ -74,8 +78,12 @@ if __name__ == "__main__":
 
     components = [
         "LxmlEventHandler",
+        "LxmlTargetHandler",
         "XmlEventHandler",
+        "XmlExpatHandler",
         "LxmlEventWriter",
+        "LxmlStreamWriter",
+        "XmlDirectWriter",
         "XmlEventWriter",
         "JsonParser",
         "JsonSerializer",
@@ -0,0 +1,41 @@
+import pytest
+
+from tests import run_async
+from tests.fixtures.calculator import CalculatorSoapAdd
+from tests.fixtures.calculator.server import CalculatorServer
+from xsdata.formats.dataclass.client import AsyncClient
+from xsdata.formats.dataclass.client import Client
+
+numbers = [10, 100]
+delay = 0.01
+
+
+def send(location, objs):
+    with Client.from_service(CalculatorSoapAdd, location=location) as client:
+        for obj in objs:
+            client.send(obj)
+
+
+async def send_many(location, objs, limit):
+    async with AsyncClient.from_service(CalculatorSoapAdd, location=location) as client:
+        await client.send_many(objs, limit=limit)
+
+
+def make_params(how_many: int):
+    return [{"Body": {"Add": {"intA": x, "intB": 1}}} for x in range(how_many)]
+
+
+@pytest.mark.benchmark(group="Client")
+@pytest.mark.parametrize("number", numbers)
+def test_client_send(benchmark, number):
+    with CalculatorServer(delay=delay) as server:
+        benchmark(send, server.url, make_params(number))
+
+
+@pytest.mark.benchmark(group="Client")
+@pytest.mark.parametrize("number", numbers)
+@pytest.mark.parametrize("limit", [1, 10])
+def test_async_client_send_many(benchmark, number, limit):
+    with CalculatorServer(delay=delay) as server:
+        params = make_params(number)
+        benchmark(lambda: run_async(send_many(server.url, params, limit)))
@@ -0,0 +1,41 @@
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from tests.fixtures.books import Books
+from tests.integration.benchmarks.conftest import make_books
+from xsdata.formats.dataclass.context import XmlContext
+from xsdata.formats.dataclass.parsers import XmlParser
+from xsdata.formats.dataclass.serializers import XmlSerializer
+
+threads = [1, 4, 16]
+tasks = 32
+books = make_books(20)
+source = XmlSerializer().render(books)
+
+
+def roundtrip(context: XmlContext):
+    obj = XmlParser(context=context).from_string(source, Books)
+    XmlSerializer(context=context).render(obj)
+
+
+def stress(context: XmlContext, workers: int):
+    with ThreadPoolExecutor(workers) as executor:
+        for future in [executor.submit(roundtrip, context) for _ in range(tasks)]:
+            future.result()
+
+
+@pytest.mark.benchmark(disable_gc=True, group="Shared context (cold)")
+@pytest.mark.parametrize("workers", threads)
+def test_shared_cold_context(benchmark, workers):
+    benchmark.pedantic(stress, setup=lambda: ((XmlContext(), workers), {}), rounds=10)
+
+
+@pytest.mark.benchmark(disable_gc=True, group="Shared context (frozen)")
+@pytest.mark.parametrize("workers", threads)
+def test_shared_frozen_context(benchmark, workers):
+    context = XmlContext()
+    roundtrip(context)
+    context.freeze()
+
+    benchmark(stress, context, workers)
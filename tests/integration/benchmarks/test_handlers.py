@@ -32,9 +32,24 @@ def test_serialize(benchmark, writer, number):
     benchmark(write, number, fixtures[number], getattr(writers, writer))
 
 
+@pytest.mark.benchmark(disable_gc=True, group="Serialize (compiled)")
+@pytest.mark.parametrize("number", numbers)
+@pytest.mark.parametrize("writer", writers_list)
+def test_serialize_compiled(benchmark, writer, number):
+    benchmark(write, number, fixtures[number], getattr(writers, writer), True)
+
+
 @pytest.mark.benchmark(disable_gc=True, group="Parse")
 @pytest.mark.parametrize("number", numbers)
 @pytest.mark.parametrize("handler", readers_list)
 def test_parse(benchmark, handler, number):
     src = xsdata_temp_dir.joinpath(f"benchmark_{number}.xml").read_bytes()
     benchmark(parse, src, getattr(readers, handler))
+
+
+@pytest.mark.benchmark(disable_gc=True, group="Parse (compiled)")
+@pytest.mark.parametrize("number", numbers)
+@pytest.mark.parametrize("handler", readers_list)
+def test_parse_compiled(benchmark, handler, number):
+    src = xsdata_temp_dir.joinpath(f"benchmark_{number}.xml").read_bytes()
+    benchmark(parse, src, getattr(readers, handler), True)
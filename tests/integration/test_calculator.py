@@ -35,7 +35,7 @@ class CalculatorServiceTests(TestCase):
     @mock.patch.object(DefaultTransport, "post")
     def test_client(self, mock_most):
         url = "http://www.dneonline.com/calculator.asmx"
-        request = fixtures_dir.joinpath("calculator/AddRQ.xml").read_text()
+        request = fixtures_dir.joinpath("calculator/AddRQ.xml").read_bytes()
         response = fixtures_dir.joinpath("calculator/AddRS.xml").read_bytes()
         headers = {"content-type": "text/xml", "SOAPAction": "http://tempuri.org/Add"}
         mock_most.return_value = response
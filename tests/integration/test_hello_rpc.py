@@ -38,7 +38,7 @@ class HelloRpcServiceTests(TestCase):
     @mock.patch.object(DefaultTransport, "post")
     def test_client(self, mock_most):
         url = "http://localhost:9999/ws/hello"
-        request = fixtures_dir.joinpath("hello/HelloRQ.xml").read_text()
+        request = fixtures_dir.joinpath("hello/HelloRQ.xml").read_bytes()
         response = fixtures_dir.joinpath("hello/HelloRS.xml").read_bytes()
         headers = {"content-type": "text/xml"}
         mock_most.return_value = response
@@ -62,7 +62,7 @@ class HelloRpcServiceTests(TestCase):
     @mock.patch.object(DefaultTransport, "post")
     def test_client_with_soap_fault(self, mock_most):
         url = "http://localhost:9999/ws/hello"
-        request = fixtures_dir.joinpath("hello/HelloRQ.xml").read_text()
+        request = fixtures_dir.joinpath("hello/HelloRQ.xml").read_bytes()
         response = fixtures_dir.joinpath("hello/HelloRS_SoapFault.xml").read_bytes()
         headers = {"content-type": "text/xml"}
         mock_most.return_value = response
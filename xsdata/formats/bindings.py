@@ -1,7 +1,11 @@
 import abc
+import functools
 import io
+import multiprocessing
 import pathlib
 from typing import Any
+from typing import Iterable
+from typing import List
 from typing import Optional
 from typing import Type
 from typing import TypeVar
@@ -28,7 +32,79 @@ class AbstractParser(abc.ABC):
         """Parse the input bytes array return the resulting object tree."""
         return self.parse(io.BytesIO(source), clazz)
 
+    def parse_many(
+        self,
+        sources: Iterable[Any],
+        clazz: Optional[Type[T]] = None,
+        workers: Optional[int] = None,
+        chunk_size: Optional[int] = None,
+        return_exceptions: bool = False,
+    ) -> List[Any]:
+        """
+        Parse the input sources in a pool of worker processes and return the
+        resulting object trees in the same order.
+
+        The parser is copied to every worker once, the workers prepare
+        the binding metadata of the target class before they receive
+        any sources. The sources can be bytes, file paths or any other
+        picklable input the parse method accepts.
+
+        :param sources: The input sources
+        :param clazz: The target class type, auto located if omitted.
+        :param workers: The number of worker processes, defaults to the
+            number of cpus
+        :param chunk_size: The number of sources sent to a worker per
+            task, by default it's calculated from the number of sources
+        :param return_exceptions: Return the failures in place of the
+            results instead of aborting the whole batch.
+        """
+        func = functools.partial(
+            _parse_worker, clazz=clazz, return_exceptions=return_exceptions
+        )
+        with multiprocessing.Pool(workers, _init_worker, (self, clazz)) as pool:
+            return pool.map(func, sources, chunk_size)
+
+    def prepare(self, clazz: Type):  # noqa: B027
+        """
+        Prepare the parser for the given target class type.
+
+        An optional hook, the parsers that need no preparation inherit
+        this no-op.
+        """
+
     @abc.abstractmethod
     def parse(self, source: Any, clazz: Optional[Type[T]] = None) -> T:
         """Parse the input stream or filename and return the resulting object
         tree."""
+
+
+_worker_parser: Optional[AbstractParser] = None
+
+
+def _init_worker(parser: AbstractParser, clazz: Optional[Type]):
+    """Store the parser of the current worker process and prepare it for the
+    target class type."""
+    global _worker_parser
+
+    _worker_parser = parser
+    if clazz is not None:
+        parser.prepare(clazz)
+
+
+def _parse_worker(source: Any, clazz: Optional[Type], return_exceptions: bool) -> Any:
+    """Parse the given source with the parser of the current worker process."""
+    assert _worker_parser is not None
+
+    try:
+        if isinstance(source, bytes):
+            return _worker_parser.from_bytes(source, clazz)
+
+        if isinstance(source, pathlib.Path):
+            return _worker_parser.from_path(source, clazz)
+
+        return _worker_parser.parse(source, clazz)
+    except Exception as e:
+        if return_exceptions:
+            return e
+
+        raise
@@ -60,10 +60,12 @@ class Converter(abc.ABC):
 
 
 class ConverterFactory:
-    __slots__ = ("registry",)
+    __slots__ = ("registry", "deserializers", "generation")
 
     def __init__(self):
         self.registry: Dict[Type, Converter] = {}
+        self.deserializers: Dict[Tuple, Callable] = {}
+        self.generation = 0
 
     def deserialize(self, value: Any, types: Sequence[Type], **kwargs: Any) -> Any:
         """
@@ -85,6 +87,89 @@ class ConverterFactory:
         )
         return value
 
+    def build_deserializer(
+        self, types: Sequence[Type], format: Optional[str] = None
+    ) -> Callable[[Any, Optional[Dict]], Any]:
+        """
+        Build a deserialize function specialized for the given types and
+        format.
+
+        The converters are resolved once, for a single type with a
+        proxy converter the function calls directly the factory. The
+        results are cached until a converter is registered or removed,
+        every registry change increases the factory ``generation``, the
+        holders of the functions compare it to rebuild them.
+
+        The function accepts the value and the namespace prefix-URI map
+        and behaves exactly like :meth:`deserialize`.
+        """
+        key = (tuple(types), format)
+        func = self.deserializers.get(key)
+        if func is None:
+            func = self._build_deserializer(key[0], format)
+            self.deserializers[key] = func
+
+        return func
+
+    def _build_deserializer(
+        self, types: Tuple[Type, ...], format: Optional[str]
+    ) -> Callable[[Any, Optional[Dict]], Any]:
+        def deserialize_generic(value: Any, ns_map: Optional[Dict] = None) -> Any:
+            return self.deserialize(value, types, ns_map=ns_map, format=format)
+
+        instances = []
+        for data_type in types:
+            instance = self.find_converter(data_type)
+            if instance is None:
+                # Leave the unknown types warnings for the generic path
+                return deserialize_generic
+
+            instances.append((data_type, instance))
+
+        def fail(value: Any) -> Any:
+            warnings.warn(
+                f"Failed to convert value `{value}` to one of {types}",
+                ConverterWarning,
+            )
+            return value
+
+        if len(instances) == 1:
+            data_type, instance = instances[0]
+
+            if type(instance) is ProxyConverter:
+                factory = instance.factory
+
+                def deserialize_proxy(value: Any, ns_map: Optional[Dict] = None) -> Any:
+                    try:
+                        return factory(value)
+                    except ValueError:
+                        return fail(value)
+
+                return deserialize_proxy
+
+            def deserialize_single(value: Any, ns_map: Optional[Dict] = None) -> Any:
+                try:
+                    return instance.deserialize(
+                        value, data_type=data_type, ns_map=ns_map, format=format
+                    )
+                except ConverterError:
+                    return fail(value)
+
+            return deserialize_single
+
+        def deserialize_many(value: Any, ns_map: Optional[Dict] = None) -> Any:
+            for data_type, instance in instances:
+                try:
+                    return instance.deserialize(
+                        value, data_type=data_type, ns_map=ns_map, format=format
+                    )
+                except ConverterError:
+                    pass
+
+            return fail(value)
+
+        return deserialize_many
+
     def serialize(self, value: Any, **kwargs: Any) -> Any:
         """
         Convert the given value to string, ignore None values.
@@ -142,6 +227,9 @@ class ConverterFactory:
         else:
             self.registry[data_type] = ProxyConverter(func)
 
+        self.deserializers.clear()
+        self.generation += 1
+
     def unregister_converter(self, data_type: Type):
         """
         Unregister the converter for the given data type.
@@ -149,6 +237,8 @@ class ConverterFactory:
         :raises KeyError: if the data type is not registered.
         """
         self.registry.pop(data_type)
+        self.deserializers.clear()
+        self.generation += 1
 
     def type_converter(self, datatype: Type) -> Converter:
         """
@@ -158,7 +248,20 @@ class ConverterFactory:
         converters, fall back to str and issue a warning if there are
         not matches.
         """
+        instance = self.find_converter(datatype)
+        if instance is not None:
+            return instance
 
+        warnings.warn(f"No converter registered for `{datatype}`", ConverterWarning)
+        return self.registry[str]
+
+    def find_converter(self, datatype: Type) -> Optional[Converter]:
+        """
+        Find a registered converter for the given data type or any of its
+        bases, except object.
+
+        :return: The converter instance or None if there are no matches.
+        """
         try:
             # Quick in and out, without checking the whole mro.
             return self.registry[datatype]
@@ -170,8 +273,7 @@ class ConverterFactory:
             if mro in self.registry:
                 return self.registry[mro]
 
-        warnings.warn(f"No converter registered for `{datatype}`", ConverterWarning)
-        return self.registry[str]
+        return None
 
     def value_converter(self, value: Any) -> Converter:
         """Get a suitable converter for the given value."""
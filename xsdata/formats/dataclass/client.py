@@ -1,7 +1,12 @@
+import asyncio
+import gzip
+import zlib
 from dataclasses import dataclass
 from dataclasses import field
 from typing import Any
 from typing import Dict
+from typing import Iterable
+from typing import List
 from typing import NamedTuple
 from typing import Optional
 from typing import Type
@@ -10,6 +15,8 @@ from xsdata.exceptions import ClientValueError
 from xsdata.formats.dataclass.parsers import XmlParser
 from xsdata.formats.dataclass.parsers.json import DictConverter
 from xsdata.formats.dataclass.serializers import XmlSerializer
+from xsdata.formats.dataclass.transports import AsyncTransport
+from xsdata.formats.dataclass.transports import DefaultAsyncTransport
 from xsdata.formats.dataclass.transports import DefaultTransport
 from xsdata.formats.dataclass.transports import Transport
 
@@ -24,6 +31,7 @@ class Config(NamedTuple):
     :param soap_action: soap action
     :param input: input object type
     :param output: output object type
+    :param compression: request and response content encoding
     """
 
     style: str
@@ -32,6 +40,7 @@ class Config(NamedTuple):
     soap_action: str
     input: Type
     output: Type
+    compression: Optional[str] = None
 
     @classmethod
     def from_service(cls, obj: Any, **kwargs: Any) -> "Config":
@@ -45,9 +54,18 @@ class TransportTypes:
     SOAP = "http://schemas.xmlsoap.org/soap/http"
 
 
+class CompressionTypes:
+    GZIP = "gzip"
+    DEFLATE = "deflate"
+
+
 @dataclass
 class Client:
     """
+    The transport connections are reused by the next requests, they are
+    released when the client is closed, or when it's used as a context
+    manager.
+
     :param config: service configuration
     :param transport: transport instance to handle requests
     :param parser: xml parser instance to handle xml response parsing
@@ -87,7 +105,25 @@ class Client:
         data = self.prepare_payload(obj)
         headers = self.prepare_headers(headers or {})
         response = self.transport.post(self.config.location, data=data, headers=headers)
-        return self.parser.from_bytes(response, self.config.output)
+        return self.parse_response(response)
+
+    def parse_response(self, response: Any) -> Any:
+        """
+        Parse the transport response according to the service
+        configuration.
+
+        The file-like responses are parsed while they are read and they
+        are closed afterwards.
+
+        :param response: The response content or a binary file-like object
+        """
+        if isinstance(response, bytes):
+            return self.parser.from_bytes(response, self.config.output)
+
+        try:
+            return self.parser.parse(response, self.config.output)
+        finally:
+            response.close()
 
     def prepare_headers(self, headers: Dict) -> Dict:
         """
@@ -107,14 +143,20 @@ class Client:
                 f"Unsupported binding transport: `{self.config.transport}`"
             )
 
+        if self.config.compression:
+            result["Content-Encoding"] = self.config.compression
+            result["Accept-Encoding"] = "gzip, deflate"
+
         return result
 
     def prepare_payload(self, obj: Any) -> Any:
         """
-        Prepare and serialize payload to be sent.
+        Prepare and serialize payload to be sent, the payload is encoded
+        with the serializer configuration encoding and compressed
+        according to the service configuration.
 
         :raises ClientValueError: If the config input type doesn't match the given
-            input.
+            input or the compression is unsupported.
         """
         if isinstance(obj, Dict):
             obj = self.dict_converter.convert(obj, self.config.input)
@@ -126,4 +168,116 @@ class Client:
                 f"got `{type(obj).__name__}`"
             )
 
-        return self.serializer.render(obj)
+        return self.compress(self.serializer.render_bytes(obj))
+
+    def compress(self, data: bytes) -> bytes:
+        """
+        Compress the payload according to the service configuration.
+
+        :raises ClientValueError: If the compression is unsupported.
+        """
+        compression = self.config.compression
+        if not compression:
+            return data
+        if compression == CompressionTypes.GZIP:
+            return gzip.compress(data)
+        if compression == CompressionTypes.DEFLATE:
+            return zlib.compress(data)
+
+        raise ClientValueError(f"Unsupported compression: `{compression}`")
+
+    def close(self):
+        """Close the transport connections."""
+        self.transport.close()
+
+    def __enter__(self) -> "Client":
+        return self
+
+    def __exit__(self, *args: Any):
+        self.close()
+
+
+@dataclass
+class AsyncClient(Client):
+    """
+    Asyncio client, the transport connections are released when the
+    client is closed, or when it's used as an async context manager.
+
+    :param config: service configuration
+    :param transport: async transport instance to handle requests
+    :param parser: xml parser instance to handle xml response parsing
+    :param serializer: xml serializer instance to handle xml response parsing
+    """
+
+    transport: AsyncTransport = field(  # type: ignore
+        default_factory=DefaultAsyncTransport
+    )
+
+    async def send(self, obj: Any, headers: Optional[Dict] = None) -> Any:
+        """
+        Send a request and parse the response according to the service
+        configuration.
+
+        >>> async with AsyncClient.from_service(CalculatorSoapAdd) as client:
+        >>>     res = await client.send(params)
+
+        :param obj: a params dictionary or the input type instance
+        :param headers: a dictionary of any additional headers.
+        """
+        data = self.prepare_payload(obj)
+        headers = self.prepare_headers(headers or {})
+        response = await self.transport.post(
+            self.config.location, data=data, headers=headers
+        )
+        return self.parse_response(response)
+
+    async def send_many(
+        self,
+        objs: Iterable[Any],
+        headers: Optional[Dict] = None,
+        limit: int = 10,
+        return_exceptions: bool = False,
+    ) -> List[Any]:
+        """
+        Send the requests concurrently and return the parsed responses in
+        the same order.
+
+        >>> params = [{"body": {"add": {"int_a": x, "int_b": 4}}} for x in range(100)]
+        >>> res = await client.send_many(params, limit=20)
+
+        :param objs: the params dictionaries or the input type instances
+        :param headers: a dictionary of any additional headers.
+        :param limit: the maximum number of requests in flight
+        :param return_exceptions: return the failures in place of the
+            responses instead of raising the first one, the pending
+            requests are cancelled before raising
+        """
+        semaphore = asyncio.Semaphore(limit)
+
+        async def send(obj: Any) -> Any:
+            async with semaphore:
+                return await self.send(obj, headers)
+
+        tasks = [asyncio.ensure_future(send(obj)) for obj in objs]
+        try:
+            return await asyncio.gather(*tasks, return_exceptions=return_exceptions)
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+
+            await asyncio.gather(*tasks, return_exceptions=True)
+            raise
+
+    async def close(self):
+        """Close the transport connections."""
+        await self.transport.close()
+
+    def __enter__(self) -> "AsyncClient":
+        """The connections can only be released from a running event loop."""
+        raise TypeError(f"Use 'async with' to manage the {type(self).__name__}")
+
+    async def __aenter__(self) -> "AsyncClient":
+        return self
+
+    async def __aexit__(self, *args: Any):
+        await self.close()
@@ -1,19 +1,29 @@
+import importlib
+import pkgutil
 import sys
+import threading
 from collections import defaultdict
 from typing import Any
 from typing import Callable
 from typing import Dict
+from typing import FrozenSet
+from typing import Iterable
 from typing import List
 from typing import Optional
 from typing import Set
 from typing import Type
 
+from xsdata import __version__
 from xsdata.exceptions import XmlContextError
 from xsdata.formats.bindings import T
+from xsdata.formats.converter import converter
 from xsdata.formats.dataclass.compat import class_types
 from xsdata.formats.dataclass.models.builders import XmlMetaBuilder
+from xsdata.formats.dataclass.models.cache import XmlMetaCache
+from xsdata.formats.dataclass.models.cache import XmlMetaStore
 from xsdata.formats.dataclass.models.elements import XmlMeta
 from xsdata.models.enums import DataType
+from xsdata.utils.constants import EMPTY_MAP
 from xsdata.utils.constants import return_input
 
 
@@ -24,15 +34,36 @@ class XmlContext:
     :param element_name_generator: Default element name generator
     :param attribute_name_generator: Default attribute name generator
     :param class_type: Default class type `dataclasses`
+    :param cache_dir: Persist the binding metadata in the given directory,
+        see :meth:`save_cache`
+    :param cache_size: The max number of models to keep the binding metadata,
+        the least recently used are evicted, unbounded if omitted
+    :param weak_cache: Don't keep the models alive, the binding metadata are
+        attached to the classes as ``__xsdata_meta__`` and dropped when the
+        classes are garbage collected
+
+    The context is safe to share between threads, the lookups are lock
+    free and every model is built and published exactly once. After the
+    warm-up, :meth:`freeze` stops all further modifications.
     """
 
     __slots__ = (
         "element_name_generator",
         "attribute_name_generator",
         "class_type",
+        "cache_dir",
+        "cache_size",
+        "weak_cache",
+        "meta_cache",
         "cache",
         "xsi_cache",
-        "sys_modules",
+        "xsi_modules",
+        "xsi_indexed",
+        "fields_index",
+        "fields_names",
+        "fields_pending",
+        "lock",
+        "frozen",
     )
 
     def __init__(
@@ -40,20 +71,118 @@ class XmlContext:
         element_name_generator: Callable = return_input,
         attribute_name_generator: Callable = return_input,
         class_type: str = "dataclasses",
+        cache_dir: Optional[str] = None,
+        cache_size: Optional[int] = None,
+        weak_cache: bool = False,
     ):
 
         self.element_name_generator = element_name_generator
         self.attribute_name_generator = attribute_name_generator
         self.class_type = class_types.get_type(class_type)
+        self.cache_dir = cache_dir
+        self.cache_size = cache_size
+        self.weak_cache = weak_cache
+        self.meta_cache = self.build_meta_cache()
 
-        self.cache: Dict[Type, XmlMeta] = {}
+        self.cache = XmlMetaStore(cache_size, weak_cache)
         self.xsi_cache: Dict[str, List[Type]] = defaultdict(list)
-        self.sys_modules = 0
+        self.xsi_modules: Set[str] = set()
+        self.xsi_indexed = False
+        self.fields_index: Dict[str, List[Type]] = defaultdict(list)
+        self.fields_names: Dict[Type, FrozenSet[str]] = {}
+        self.fields_pending: List[Type] = []
+        self.lock = threading.RLock()
+        self.frozen = False
+
+    def __getstate__(self) -> Dict:
+        """Pickle only the options, the binding metadata are rebuilt on
+        demand."""
+        return {
+            "element_name_generator": self.element_name_generator,
+            "attribute_name_generator": self.attribute_name_generator,
+            "class_type": self.class_type,
+            "cache_dir": self.cache_dir,
+            "cache_size": self.cache_size,
+            "weak_cache": self.weak_cache,
+        }
+
+    def __setstate__(self, state: Dict):
+        for key, value in state.items():
+            setattr(self, key, value)
+
+        self.meta_cache = self.build_meta_cache()
+        self.cache = XmlMetaStore(self.cache_size, self.weak_cache)
+        self.xsi_cache = defaultdict(list)
+        self.xsi_modules = set()
+        self.xsi_indexed = False
+        self.fields_index = defaultdict(list)
+        self.fields_names = {}
+        self.fields_pending = []
+        self.lock = threading.RLock()
+        self.frozen = False
+
+    def build_meta_cache(self) -> Optional[XmlMetaCache]:
+        """Create the persistent metadata cache if the cache directory is
+        set, the key covers all the options that affect the metadata."""
+        if not self.cache_dir:
+            return None
+
+        generators = (self.element_name_generator, self.attribute_name_generator)
+        key = "|".join(
+            [__version__, type(self.class_type).__qualname__]
+            + [f"{func.__module__}.{func.__qualname__}" for func in generators]
+        )
+        return XmlMetaCache(self.cache_dir, key)
+
+    def save_cache(self):
+        """
+        Write the new binding metadata to the cache directory.
+
+        The stored metadata are loaded on demand per top level package
+        by any context with the same cache directory and options, the
+        entries of modified modules are rebuilt.
+        """
+        if self.meta_cache:
+            with self.lock:
+                self.meta_cache.save()
+
+    def freeze(self):
+        """
+        Make the context read-only.
+
+        The models of all the imported modules are indexed one last
+        time, by their xsi:type and their fields for the json target
+        lookups. Afterwards the context never builds new metadata or
+        registers new models. Lookups for models that were never built
+        before raise an error, so warm up the context first.
+
+        The compiled functions are the only exception, they depend on
+        the registered converters and they are still added to the
+        binding metadata on first use, under the context lock.
+
+        A bounded cache can't be frozen, the evicted entries would
+        never be built again.
+        """
+        if self.cache_size is not None:
+            raise XmlContextError("A context with a bounded cache can't be frozen")
+
+        with self.lock:
+            self.build_xsi_cache()
+            self.build_fields_index()
+            self.frozen = True
 
     def reset(self):
-        self.cache.clear()
-        self.xsi_cache.clear()
-        self.sys_modules = 0
+        with self.lock:
+            if self.frozen:
+                raise XmlContextError("The context is frozen and can't be reset")
+
+            self.cache.clear()
+            self.xsi_cache.clear()
+            self.xsi_modules.clear()
+            self.xsi_indexed = False
+            self.fields_index.clear()
+            self.fields_names.clear()
+            self.fields_pending.clear()
 
     def fetch(
         self,
@@ -79,34 +208,140 @@ class XmlContext:
         return self.build(subclass, parent_ns) if subclass else meta
 
     def build_xsi_cache(self):
-        """Index all imported dataclasses by their xsi:type qualified name."""
-
-        if len(sys.modules) == self.sys_modules:
+        """
+        Index the models of all the imported modules by their xsi:type
+        qualified name, once per context.
+
+        The modules that are imported afterwards are never scanned,
+        their models are indexed when the binding metadata of any model
+        of the same module are built, or explicitly with
+        :meth:`register_package`. Classes outside of any module, e.g.
+        local classes, are only indexed with :meth:`register_model`.
+        """
+        if self.xsi_indexed:
             return
 
-        self.xsi_cache.clear()
+        with self.lock:
+            if not self.xsi_indexed:
+                for module in list(sys.modules.values()):
+                    self.register_module(module)
+
+                self.xsi_indexed = True
+
+    def register_module(self, module: Any):
+        """
+        Index the models defined in the given module, including the inner
+        models, the module is indexed only once.
+
+        :param module: A python module
+        """
+        name = getattr(module, "__name__", None)
+        if not isinstance(name, str) or name in self.xsi_modules:
+            return
 
         name_generator = self.element_name_generator
-        for clazz in self.get_subclasses(object):
-            if self.class_type.is_model(clazz):
-                qname = XmlMetaBuilder.build_target_qname(clazz, name_generator)
+        seen: Set[Type] = set()
+
+        def index(values: Iterable[Any]):
+            for clazz in values:
+                if (
+                    isinstance(clazz, type)
+                    and clazz not in seen
+                    and clazz.__module__ == name
+                ):
+                    seen.add(clazz)
+                    if self.class_type.is_model(clazz):
+                        qname = XmlMetaBuilder.build_target_qname(clazz, name_generator)
+                        self.xsi_cache[qname].append(clazz)
+                        self.fields_pending.append(clazz)
+                        index(list(vars(clazz).values()))
+
+        with self.lock:
+            if self.frozen:
+                raise XmlContextError("The context is frozen, can't register models")
+
+            if name not in self.xsi_modules:
+                self.xsi_modules.add(name)
+                index(list(getattr(module, "__dict__", EMPTY_MAP).values()))
+
+    def register_model(self, clazz: Type):
+        """
+        Index the given model and the models of its module.
+
+        The index keeps the model alive, even with a weak cache, until
+        its module is unregistered.
+
+        :param clazz: A dataclass type
+        """
+        with self.lock:
+            if self.frozen:
+                raise XmlContextError("The context is frozen, can't register models")
+
+            self.register_module(sys.modules.get(clazz.__module__))
+
+            qname = XmlMetaBuilder.build_target_qname(
+                clazz, self.element_name_generator
+            )
+            if clazz not in self.xsi_cache.get(qname, ()):
                 self.xsi_cache[qname].append(clazz)
+                self.fields_pending.append(clazz)
+
+    def unregister_modules(self, names: Set[str]):
+        """
+        Drop the models of the given modules from the indexes.
+
+        The modules are never unregistered automatically, call it after
+        unloading modules, so their models can be garbage collected.
+
+        :param names: The module names
+        """
+        if self.frozen:
+            raise XmlContextError("The context is frozen, can't unregister models")
+
+        def keep(types: List[Type]) -> List[Type]:
+            return [clazz for clazz in types if clazz.__module__ not in names]
+
+        with self.lock:
+            self.xsi_modules.difference_update(names)
+            for index in (self.xsi_cache, self.fields_index):
+                for key, types in list(index.items()):
+                    types = keep(types)
+                    if types:
+                        index[key] = types
+                    else:
+                        del index[key]
+
+            self.fields_pending = keep(self.fields_pending)
+            for clazz in list(self.fields_names):
+                if clazz.__module__ in names:
+                    del self.fields_names[clazz]
+
+    def register_package(self, name: str):
+        """
+        Import the given package with all of its modules and index their
+        models.
+
+        :param name: The package name, e.g. `myapp.models`
+        """
+        package = importlib.import_module(name)
+        self.register_module(package)
 
-        self.sys_modules = len(sys.modules)
+        paths = getattr(package, "__path__", [])
+        for module_info in pkgutil.walk_packages(paths, f"{name}."):
+            self.register_module(importlib.import_module(module_info.name))
 
     def find_types(self, qname: str) -> List[Type[T]]:
         """
         Find all classes that match the given xsi:type qname.
 
         - Ignores native schema types, xs:string, xs:float, xs:int, ...
-        - Rebuild cache if new modules were imported since last run
+        - Index the imported modules on the first lookup
 
         :param qname: Qualified name
         """
         if not DataType.from_qname(qname):
             self.build_xsi_cache()
-            if qname in self.xsi_cache:
-                return self.xsi_cache[qname]
+            return self.xsi_cache.get(qname, [])
 
         return []
 
@@ -125,17 +360,83 @@ class XmlContext:
         Find a dataclass from all the imported modules that matches the given
         list of field names.
 
+        The candidates are looked up in the fields index by the rarest
+        field name and the first match wins. Subclasses are indexed
+        ahead of their base classes, like the class hierarchy scan of
+        the previous versions. The models that can't be built are never
+        matched, in a frozen context the binding metadata are not
+        verified.
+
         :param field_names: A unique list of field names
         """
 
-        self.build_xsi_cache()
-        for types in self.xsi_cache.values():
-            for clazz in types:
-                if self.local_names_match(field_names, clazz):
-                    return clazz
+        self.build_fields_index()
+        if not field_names:
+            return next(iter(self.fields_names), None)
+
+        postings = []
+        for name in field_names:
+            candidates = self.fields_index.get(name)
+            if not candidates:
+                return None
+
+            postings.append(candidates)
+
+        # Verify the candidates of the rarest field name
+        for clazz in min(postings, key=len):
+            if not field_names.issubset(self.fields_names[clazz]):
+                continue
+
+            if self.frozen:
+                return clazz
+
+            try:
+                self.build(clazz)
+                return clazz
+            except (XmlContextError, NameError, TypeError):
+                continue
 
         return None
 
+    def build_fields_index(self):
+        """
+        Index the models of the newly registered modules by their fields
+        local names.
+
+        The names are read from the class fields, the binding metadata
+        are only built for the matched models on lookup.
+        """
+        self.build_xsi_cache()
+        if self.frozen or not self.fields_pending:
+            return
+
+        with self.lock:
+            builder = XmlMetaBuilder(
+                class_type=self.class_type,
+                element_name_generator=self.element_name_generator,
+                attribute_name_generator=self.attribute_name_generator,
+            )
+            for clazz in self.fields_pending:
+                try:
+                    names = frozenset(builder.build_local_names(clazz))
+                except XmlContextError:
+                    continue
+
+                self.fields_names[clazz] = names
+                for name in names:
+                    candidates = self.fields_index[name]
+                    index = next(
+                        (
+                            i
+                            for i, candidate in enumerate(candidates)
+                            if issubclass(clazz, candidate)
+                        ),
+                        len(candidates),
+                    )
+                    candidates.insert(index, clazz)
+
+            self.fields_pending.clear()
+
     def find_subclass(self, clazz: Type, qname: str) -> Optional[Type]:
         """
         Compare all classes that match the given xsi:type qname and return the
@@ -170,14 +471,70 @@ class XmlContext:
         :param parent_ns: The inherited parent namespace
         """
 
-        if clazz not in self.cache:
+        meta = self.cache.get(clazz)
+        if meta is None:
+            with self.lock:
+                meta = self.cache.peek(clazz)
+                if meta is None:
+                    meta = self.build_meta(clazz, parent_ns)
+                    self.cache.add(meta)
+                    if clazz.__module__ not in self.xsi_modules:
+                        self.register_module(sys.modules.get(clazz.__module__))
+
+        return meta
+
+    def build_meta(self, clazz: Type, parent_ns: Optional[str]) -> XmlMeta:
+        """Load from the persistent cache or build the binding metadata of the
+        given class, the context lock must be held."""
+        if self.frozen:
+            raise XmlContextError(
+                f"The context is frozen, can't build the binding metadata "
+                f"of {clazz.__qualname__}"
+            )
+
+        meta = self.meta_cache.get(clazz) if self.meta_cache else None
+        if meta is None:
             builder = XmlMetaBuilder(
                 class_type=self.class_type,
                 element_name_generator=self.element_name_generator,
                 attribute_name_generator=self.attribute_name_generator,
             )
-            self.cache[clazz] = builder.build(clazz, parent_ns)
-        return self.cache[clazz]
+            meta = builder.build(clazz, parent_ns)
+            if self.meta_cache:
+                self.meta_cache.add(meta)
+
+        return meta
+
+    def compile(
+        self,
+        clazz: Type,
+        compiler: Callable[["XmlContext", XmlMeta], Callable],
+        parent_ns: Optional[str] = None,
+    ) -> Callable:
+        """
+        Fetch from cache or compile a specialized function for the given
+        class with the given compiler.
+
+        The compiled functions are stored with the class binding
+        metadata and they are dropped together, they are compiled again
+        after a converter is registered or removed. A frozen context
+        still compiles the functions of the models it has built.
+
+        :param clazz: A dataclass type
+        :param compiler: The function that builds the specialized function
+            from the context and the class binding metadata
+        :param parent_ns: The inherited parent namespace
+        """
+        meta = self.build(clazz, parent_ns)
+        entry = meta.compiled.get(compiler)
+        if entry is None or entry[0] != converter.generation:
+            with self.lock:
+                entry = meta.compiled.get(compiler)
+                if entry is None or entry[0] != converter.generation:
+                    entry = (converter.generation, compiler(self, meta))
+                    meta.compiled[compiler] = entry
+
+        return entry[1]
 
     def build_recursive(self, clazz: Type, parent_ns: Optional[str] = None):
         """Build the binding metadata for the given class and all of its
@@ -140,6 +140,39 @@ class XmlMetaBuilder:
             if var is not None:
                 yield var
 
+    def build_local_names(self, clazz: Type) -> Set[str]:
+        """
+        Return the local names of the given dataclass fields, without
+        building the binding metadata and resolving the type hints.
+
+        :param clazz: A dataclass type
+        """
+        meta = clazz.Meta if "Meta" in clazz.__dict__ else None
+        element_name_generator = getattr(
+            meta, "element_name_generator", self.element_name_generator
+        )
+        attribute_name_generator = getattr(
+            meta, "attribute_name_generator", self.attribute_name_generator
+        )
+        default_xml_type = self.default_xml_type(clazz)
+
+        result = set()
+        for field in self.class_type.get_fields(clazz):
+            xml_type = field.metadata.get("type", default_xml_type)
+            if xml_type == XmlType.IGNORE:
+                continue
+
+            local_name = field.metadata.get("name")
+            if not local_name:
+                if xml_type == XmlType.ATTRIBUTE:
+                    local_name = attribute_name_generator(field.name)
+                else:
+                    local_name = element_name_generator(field.name)
+
+            result.add(local_name)
+
+        return result
+
     @classmethod
     def find_globalns(cls, clazz: Type, name: str) -> Optional[Dict]:
         for base in clazz.__mro__:
@@ -249,6 +282,7 @@ class XmlVarBuilder:
         nillable = metadata.get("nillable", False)
         format_str = metadata.get("format", None)
         sequential = metadata.get("sequential", False)
+        lazy = metadata.get("lazy", False)
 
         origin, sub_origin, types = self.analyze_types(type_hint, globalns)
 
@@ -268,6 +302,11 @@ class XmlVarBuilder:
 
         any_type = self.is_any_type(types, xml_type)
         clazz = first(tp for tp in types if self.class_type.is_model(tp))
+        if lazy and (clazz is None or len(types) > 1 or tokens):
+            raise XmlContextError(
+                f"Lazy fields must be a single class element: {type_hint}"
+            )
+
         namespaces = self.resolve_namespaces(xml_type, namespace)
         default_namespace = self.default_namespace(namespaces)
         qname = build_qname(default_namespace, local_name)
@@ -301,6 +340,7 @@ class XmlVarBuilder:
             namespaces=namespaces,
             xml_type=xml_type,
             derived=False,
+            lazy=lazy,
         )
 
     def build_choices(
@@ -0,0 +1,376 @@
+import os
+import pickle
+import sys
+import tempfile
+import weakref
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any
+from typing import Dict
+from typing import Iterator
+from typing import List
+from typing import Optional
+from typing import Set
+from typing import Tuple
+from typing import Type
+
+from xsdata.formats.dataclass.models.elements import XmlMeta
+from xsdata.logger import logger
+
+Stamp = Tuple[Tuple[str, int, int], ...]
+
+
+class XmlMetaStore:
+    """
+    In-memory storage for the binding metadata of the models.
+
+    The store is unbounded by default, with a max size the least
+    recently used entries are evicted. With weak references the entries
+    don't keep the classes alive, the metadata are attached to the class
+    itself and the entry is dropped when the class is garbage collected,
+    e.g. after its module is unloaded.
+
+    In weak mode the store sets the ``__xsdata_meta__`` attribute on
+    the model classes, a weak dictionary with the metadata per store.
+
+    The store supports the read and write operations of a dictionary
+    keyed by the model classes, ``store[clazz]`` raises a KeyError for
+    missing entries.
+
+    The counters are not synchronized, under heavy concurrency they are
+    only approximate.
+
+    :param maxsize: The max number of entries, unbounded if omitted
+    :param weak: Use weak references for the classes
+    :ivar entries: The metadata per class, or per class weak reference
+    :ivar hits: The number of successful lookups
+    :ivar misses: The number of failed lookups
+    :ivar evictions: The number of evicted entries
+    """
+
+    __slots__ = (
+        "maxsize",
+        "weak",
+        "entries",
+        "hits",
+        "misses",
+        "evictions",
+        "__weakref__",
+    )
+
+    attr_name = "__xsdata_meta__"
+
+    def __init__(self, maxsize: Optional[int] = None, weak: bool = False):
+        if maxsize is not None and maxsize < 1:
+            raise ValueError(f"Invalid cache max size: {maxsize}")
+
+        self.maxsize = maxsize
+        self.weak = weak
+        self.entries: Dict[Any, Optional[XmlMeta]] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def __contains__(self, clazz: Type) -> bool:
+        return self.peek(clazz) is not None
+
+    def __iter__(self) -> Iterator[Type]:
+        for key in list(self.entries):
+            clazz = key() if self.weak else key
+            if clazz is not None:
+                yield clazz
+
+    def __getitem__(self, clazz: Type) -> XmlMeta:
+        meta = self.peek(clazz)
+        if meta is None:
+            raise KeyError(clazz)
+
+        return meta
+
+    def __setitem__(self, clazz: Type, meta: XmlMeta):
+        if meta.clazz is not clazz:
+            raise ValueError(f"The metadata don't belong to {clazz.__qualname__}")
+
+        self.add(meta)
+
+    def __delitem__(self, clazz: Type):
+        if self.peek(clazz) is None:
+            raise KeyError(clazz)
+
+        key = self.key(clazz)
+        self.entries.pop(key, None)
+        self.detach(key)
+
+    def keys(self) -> List[Type]:
+        return list(self)
+
+    def values(self) -> List[XmlMeta]:
+        return [meta for _, meta in self.items()]
+
+    def items(self) -> List[Tuple[Type, XmlMeta]]:
+        result = []
+        for clazz in self:
+            meta = self.peek(clazz)
+            if meta is not None:
+                result.append((clazz, meta))
+
+        return result
+
+    def get(self, clazz: Type, default: Optional[XmlMeta] = None) -> Optional[XmlMeta]:
+        """
+        Return the metadata of the given class and mark the entry as the
+        most recently used.
+
+        :param clazz: A model class type
+        :param default: The return value for missing entries
+        """
+        meta = self.peek(clazz)
+        if meta is None:
+            self.misses += 1
+            return default
+
+        self.hits += 1
+        if self.maxsize is not None:
+            try:
+                self.entries.move_to_end(self.key(clazz))  # type: ignore
+            except KeyError:
+                pass  # Evicted by another thread
+
+        return meta
+
+    def peek(self, clazz: Type) -> Optional[XmlMeta]:
+        """
+        Return the metadata of the given class without updating the
+        counters or the entries order.
+
+        :param clazz: A model class type
+        """
+        if not self.weak:
+            return self.entries.get(clazz)
+
+        metas = clazz.__dict__.get(self.attr_name)
+        return metas.get(self) if metas is not None else None
+
+    def add(self, meta: XmlMeta):
+        """
+        Add the metadata of a model and evict the least recently used
+        entries if the store is full.
+
+        :param meta: The model binding metadata
+        """
+        clazz = meta.clazz
+        if self.weak:
+            metas = clazz.__dict__.get(self.attr_name)
+            if metas is None:
+                metas = weakref.WeakKeyDictionary()
+                setattr(clazz, self.attr_name, metas)
+
+            metas[self] = meta
+            self.entries[weakref.ref(clazz, self.collect)] = None
+        else:
+            self.entries[clazz] = meta
+
+        if self.maxsize is not None:
+            while len(self.entries) > self.maxsize:
+                key, _ = self.entries.popitem(last=False)  # type: ignore
+                self.detach(key)
+                self.evictions += 1
+
+    def clear(self):
+        """Remove all entries, the counters are not reset."""
+        for key in list(self.entries):
+            self.detach(key)
+
+        self.entries.clear()
+
+    def key(self, clazz: Type) -> Any:
+        return weakref.ref(clazz) if self.weak else clazz
+
+    def detach(self, key: Any):
+        """Remove the metadata attached to the class of the given weak
+        reference."""
+        clazz = key() if self.weak else None
+        if clazz is not None:
+            metas = clazz.__dict__.get(self.attr_name)
+            if metas is not None:
+                metas.pop(self, None)
+
+    def collect(self, ref: weakref.ref):
+        """Drop the entry of a garbage collected class."""
+        self.entries.pop(ref, None)
+
+
+class XmlMetaCache:
+    """
+    Persistent storage for the binding metadata of the models.
+
+    The metadata are stored in one pickle file per top level package,
+    every entry is stamped with the modification time and size of the
+    source files of the class and its bases. Entries with a different
+    stamp are stale and the cache files are ignored entirely if the
+    key doesn't match, e.g. a new xsdata version.
+
+    :param directory: The cache files directory
+    :param key: The xsdata version and context options fingerprint
+    :ivar packages: The loaded entries per package name
+    :ivar dirty: The package names with new entries
+    :ivar stamps: The source file stamps per module name
+    """
+
+    __slots__ = ("directory", "key", "packages", "dirty", "stamps")
+
+    def __init__(self, directory: str, key: str):
+        self.directory = Path(directory)
+        self.key = key
+        self.packages: Dict[str, Dict[str, Tuple[Stamp, Any]]] = {}
+        self.dirty: Set[str] = set()
+        self.stamps: Dict[str, Optional[Tuple[str, int, int]]] = {}
+
+    def get(self, clazz: Type) -> Optional[XmlMeta]:
+        """
+        Return the stored binding metadata of the given class if they are
+        still fresh.
+
+        :param clazz: A model class type
+        """
+        package = self.package_name(clazz)
+        if package is None:
+            return None
+
+        entries = self.load(package)
+        name = self.entry_name(clazz)
+        entry = entries.get(name)
+        if entry is None:
+            return None
+
+        stamp, meta = entry
+        if stamp != self.stamp(clazz):
+            del entries[name]
+            return None
+
+        if isinstance(meta, bytes):
+            try:
+                meta = pickle.loads(meta)
+            except Exception:
+                meta = None
+
+            if meta is None or meta.clazz is not clazz:
+                del entries[name]
+                return None
+
+            entries[name] = (stamp, meta)
+
+        return meta
+
+    def add(self, meta: XmlMeta):
+        """
+        Add the binding metadata of a model, the entry is stored on the next
+        save.
+
+        :param meta: The model binding metadata
+        """
+        package = self.package_name(meta.clazz)
+        if package is not None:
+            entries = self.load(package)
+            entries[self.entry_name(meta.clazz)] = (self.stamp(meta.clazz), meta)
+            self.dirty.add(package)
+
+    def save(self):
+        """
+        Write the packages with new entries to the cache directory.
+
+        The entries that can't be pickled, e.g. fields with a lambda
+        default factory, are skipped.
+        """
+        self.directory.mkdir(parents=True, exist_ok=True)
+        for package in self.dirty:
+            entries = {}
+            for name, (stamp, meta) in self.packages[package].items():
+                if not isinstance(meta, bytes):
+                    try:
+                        meta = pickle.dumps(meta, pickle.HIGHEST_PROTOCOL)
+                    except Exception as e:
+                        logger.debug("Skip caching %s: %s", name, e)
+                        continue
+
+                entries[name] = (stamp, meta)
+
+            data = pickle.dumps({"key": self.key, "entries": entries})
+            fd, tmp = tempfile.mkstemp(dir=str(self.directory))
+            with os.fdopen(fd, "wb") as fp:
+                fp.write(data)
+
+            os.replace(tmp, str(self.file_path(package)))
+
+        self.dirty.clear()
+
+    def load(self, package: str) -> Dict[str, Tuple[Stamp, Any]]:
+        """
+        Load once and return the stored entries of the given package.
+
+        :param package: The top level package name
+        """
+        entries = self.packages.get(package)
+        if entries is None:
+            entries = {}
+            try:
+                data = pickle.loads(self.file_path(package).read_bytes())
+                if data["key"] == self.key:
+                    entries = data["entries"]
+            except FileNotFoundError:
+                pass
+            except Exception as e:
+                logger.debug("Ignore cache file of %s: %s", package, e)
+
+            self.packages[package] = entries
+
+        return entries
+
+    def file_path(self, package: str) -> Path:
+        return self.directory.joinpath(f"{package}.pickle")
+
+    def stamp(self, clazz: Type) -> Stamp:
+        """Return the stamps of the source files of the given class and its
+        bases."""
+        result = []
+        for base in clazz.__mro__:
+            module = base.__module__
+            if module not in self.stamps:
+                path = getattr(sys.modules.get(module), "__file__", None)
+                if path:
+                    stat = os.stat(path)
+                    self.stamps[module] = (path, stat.st_mtime_ns, stat.st_size)
+                else:
+                    self.stamps[module] = None
+
+            stamp = self.stamps[module]
+            if stamp and stamp not in result:
+                result.append(stamp)
+
+        return tuple(result)
+
+    @classmethod
+    def package_name(cls, clazz: Type) -> Optional[str]:
+        """
+        Return the top level package name of the given class.
+
+        The classes of the main script and the classes that can't be
+        imported by their qualified name are excluded, e.g. local or
+        dynamically created classes.
+        """
+        module = clazz.__module__
+        obj = sys.modules.get(module)
+        if module == "__main__" or not getattr(obj, "__file__", None):
+            return None
+
+        for name in clazz.__qualname__.split("."):
+            obj = getattr(obj, name, None)
+
+        return module.split(".", 1)[0] if obj is clazz else None
+
+    @classmethod
+    def entry_name(cls, clazz: Type) -> str:
+        return f"{clazz.__module__}.{clazz.__qualname__}"
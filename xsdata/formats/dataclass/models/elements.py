@@ -74,6 +74,9 @@ class XmlVar(MetaMixin):
     :param namespaces: List of the supported namespaces
     :param elements: Mapping of qname-repeatable elements
     :param wildcards: List of repeatable wildcards
+    :param lazy: Defer the binding of the field value until first access
+    :ivar deserializer: Value deserialize function for the field types
+        and format
     """
 
     __slots__ = (
@@ -96,6 +99,7 @@ class XmlVar(MetaMixin):
         "namespaces",
         "elements",
         "wildcards",
+        "lazy",
         # Calculated
         "tokens",
         "list_element",
@@ -108,6 +112,8 @@ class XmlVar(MetaMixin):
         "namespace_matches",
         "is_clazz_union",
         "local_name",
+        "generation",
+        "deserializer",
     )
 
     def __init__(
@@ -132,6 +138,7 @@ class XmlVar(MetaMixin):
         namespaces: Sequence[str],
         elements: Mapping[str, "XmlVar"],
         wildcards: Sequence["XmlVar"],
+        lazy: bool,
         **kwargs: Any,
     ):
         self.index = index
@@ -153,6 +160,7 @@ class XmlVar(MetaMixin):
         self.namespaces = namespaces
         self.elements = elements
         self.wildcards = wildcards
+        self.lazy = lazy
 
         self.factory = factory
         self.tokens_factory = tokens_factory
@@ -161,6 +169,8 @@ class XmlVar(MetaMixin):
 
         self.is_clazz_union = self.clazz and len(types) > 1
         self.local_name = local_name(qname)
+        self.generation = converter.generation
+        self.deserializer = converter.build_deserializer(types, format)
 
         self.is_text = False
         self.is_element = False
@@ -182,6 +192,23 @@ class XmlVar(MetaMixin):
         else:
             self.is_text = True
 
+    def __getstate__(self) -> Dict:
+        """Pickle the metadata without the deserialize function, it's rebuilt
+        on unpickling."""
+        return {name: getattr(self, name) for name in self.__slots__[:-2]}
+
+    def __setstate__(self, state: Dict):
+        for key, value in state.items():
+            setattr(self, key, value)
+
+        self.build_deserializer()
+
+    def build_deserializer(self) -> Callable:
+        """Rebuild the deserialize function with the current converters."""
+        self.generation = converter.generation
+        self.deserializer = converter.build_deserializer(self.types, self.format)
+        return self.deserializer
+
     @property
     def element_types(self) -> Set[Type]:
         return {tp for element in self.elements.values() for tp in element.types}
@@ -223,6 +250,31 @@ class XmlVar(MetaMixin):
 
         return None
 
+    def parse_value(self, value: Any, ns_map: Optional[Dict] = None) -> Any:
+        """
+        Convert the given xml string value or list of values to the field
+        python type(s) with the prebuilt deserializer.
+
+        :param value: The text or attribute value
+        :param ns_map: Namespace prefix-URI map
+        """
+        if value is None:
+            if callable(self.default):
+                return self.default() if self.tokens else None
+
+            return self.default
+
+        deserializer = self.deserializer
+        if self.generation != converter.generation:
+            deserializer = self.build_deserializer()
+
+        if self.tokens:
+            assert self.tokens_factory is not None
+            value = value if collections.is_array(value) else value.split()
+            return self.tokens_factory(deserializer(val, ns_map) for val in value)
+
+        return deserializer(value, ns_map)
+
     def is_optional(self, value: Any) -> bool:
         """Return whether this var instance is not required and the given value
         matches the default one."""
@@ -311,6 +363,8 @@ class XmlMeta(MetaMixin):
         # Calculated
         "namespace",
         "mixed_content",
+        "children",
+        "compiled",
     )
 
     def __init__(
@@ -339,6 +393,18 @@ class XmlMeta(MetaMixin):
         self.attributes = attributes
         self.any_attributes = any_attributes
         self.mixed_content = any(wildcard.mixed for wildcard in self.wildcards)
+        self.children: Dict[str, Tuple[XmlVar, ...]] = {}
+        self.compiled: Dict[Callable, Tuple[int, Callable]] = {}
+
+    def __getstate__(self) -> Dict:
+        """Pickle the metadata without the compiled functions."""
+        return {name: getattr(self, name) for name in self.__slots__[:-1]}
+
+    def __setstate__(self, state: Dict):
+        for key, value in state.items():
+            setattr(self, key, value)
+
+        self.compiled = {}
 
     @property
     def element_types(self) -> Set[Type]:
@@ -401,7 +467,24 @@ class XmlMeta(MetaMixin):
 
         return None
 
-    def find_children(self, qname: str) -> Iterator[XmlVar]:
+    def find_children(self, qname: str) -> Tuple[XmlVar, ...]:
+        """
+        Return the ordered candidate vars for the given child qualified name.
+
+        The results are resolved once per qualified name and cached,
+        the parser looks up the candidates for every child element. The
+        unknown names and the names that only match a wildcard are not
+        cached, they are unbounded.
+        """
+        children = self.children.get(qname)
+        if children is None:
+            children = tuple(self._find_children(qname))
+            if any(not var.is_wildcard for var in children):
+                self.children[qname] = children
+
+        return children
+
+    def _find_children(self, qname: str) -> Iterator[XmlVar]:
         elements = self.elements.get(qname)
         if elements:
             yield from elements
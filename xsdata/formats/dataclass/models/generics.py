@@ -1,9 +1,12 @@
 from dataclasses import dataclass
 from dataclasses import field
+from typing import Any
+from typing import Callable
 from typing import Dict
 from typing import Generic
 from typing import List
 from typing import Optional
+from typing import Type
 from typing import TypeVar
 
 from xsdata.formats.dataclass.models.elements import XmlType
@@ -49,3 +52,83 @@ class DerivedElement(Generic[T]):
     qname: str
     value: T
     type: Optional[str] = None
+
+
+class LazyElement:
+    """
+    Generic proxy for the values of lazy fields.
+
+    The proxy keeps the recorded parser events of the element and binds
+    them to the field type on the first attribute access, after that
+    all the attribute operations are forwarded to the bound object.
+
+    The proxy attributes are prefixed to avoid conflicts with the
+    fields of the bound object.
+
+    The proxy passes the ``isinstance`` checks of the bound object
+    class without binding it, but ``type()`` still returns the proxy
+    class. Copies and pickles of the proxy are made from the bound
+    object, they don't keep the recorded events and the parser context.
+
+    :param lazy_clazz: The class type of the bound object, the field type
+        or the xsi:type subclass
+    :param lazy_events: The recorded parser events of the element,
+        None after the value is bound
+    :param lazy_factory: The events to object factory
+    """
+
+    __slots__ = ("lazy_clazz", "lazy_events", "lazy_factory", "lazy_obj")
+
+    def __init__(
+        self,
+        lazy_clazz: Type,
+        lazy_events: List,
+        lazy_factory: Callable[[List], Any],
+    ):
+        self.lazy_clazz = lazy_clazz
+        self.lazy_events: Optional[List] = lazy_events
+        self.lazy_factory = lazy_factory
+        self.lazy_obj: Any = None
+
+    def lazy_value(self) -> Any:
+        """Bind the recorded events on the first call and return the field
+        value."""
+        if self.lazy_events is not None:
+            self.lazy_obj = self.lazy_factory(self.lazy_events)
+            self.lazy_events = None
+
+        return self.lazy_obj
+
+    @property  # type: ignore
+    def __class__(self) -> Type:
+        if self.lazy_events is None:
+            return self.lazy_obj.__class__
+
+        return self.lazy_clazz
+
+    def __getattr__(self, name: str) -> Any:
+        if name.startswith("__"):
+            raise AttributeError(name)
+
+        return getattr(self.lazy_value(), name)
+
+    def __reduce_ex__(self, protocol: Any) -> Any:
+        return self.lazy_value().__reduce_ex__(protocol)
+
+    def __setattr__(self, name: str, value: Any):
+        if name in LazyElement.__slots__:
+            object.__setattr__(self, name, value)
+        else:
+            setattr(self.lazy_value(), name, value)
+
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, LazyElement):
+            other = other.lazy_value()
+
+        return self.lazy_value() == other
+
+    def __repr__(self) -> str:
+        if self.lazy_events is None:
+            return repr(self.lazy_obj)
+
+        return f"{LazyElement.__qualname__}({self.lazy_clazz.__qualname__})"
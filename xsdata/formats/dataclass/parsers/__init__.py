@@ -1,6 +1,15 @@
+from xsdata.formats.dataclass.parsers.aio import AsyncJsonParser
+from xsdata.formats.dataclass.parsers.aio import AsyncXmlParser
 from xsdata.formats.dataclass.parsers.json import JsonParser
 from xsdata.formats.dataclass.parsers.tree import TreeParser
 from xsdata.formats.dataclass.parsers.xml import UserXmlParser
 from xsdata.formats.dataclass.parsers.xml import XmlParser
 
-__all__ = ["JsonParser", "XmlParser", "UserXmlParser", "TreeParser"]
+__all__ = [
+    "AsyncJsonParser",
+    "AsyncXmlParser",
+    "JsonParser",
+    "XmlParser",
+    "UserXmlParser",
+    "TreeParser",
+]
@@ -0,0 +1,137 @@
+import asyncio
+import json
+from dataclasses import dataclass
+from dataclasses import field
+from io import BytesIO
+from typing import Any
+from typing import AsyncIterator
+from typing import Callable
+from typing import List
+from typing import Optional
+from typing import Type
+
+from xsdata.formats.bindings import T
+from xsdata.formats.dataclass.context import XmlContext
+from xsdata.formats.dataclass.parsers.config import ParserConfig
+from xsdata.formats.dataclass.parsers.handlers import default_handler
+from xsdata.formats.dataclass.parsers.json import JsonParser
+from xsdata.formats.dataclass.parsers.mixins import XmlHandler
+from xsdata.formats.dataclass.parsers.xml import XmlParser
+
+CHUNK_SIZE = 16384
+
+
+@dataclass
+class AsyncXmlParser:
+    """
+    Asyncio xml parser for dataclasses.
+
+    The chunks of the async source are fed to an incremental
+    :class:`~xsdata.formats.dataclass.parsers.XmlParser` as soon as
+    they are received. The large chunks are split, the parser yields
+    control to the event loop after every ``chunk_size`` of input.
+
+    Every parse uses its own parser instance, the instance is safe to
+    share between concurrent tasks.
+
+    :param config: Parser configuration
+    :param context: Model context provider
+    :param handler: Override default XmlHandler
+    :param chunk_size: The maximum input size to parse before yielding
+        control to the event loop
+    """
+
+    config: ParserConfig = field(default_factory=ParserConfig)
+    context: XmlContext = field(default_factory=XmlContext)
+    handler: Type[XmlHandler] = field(default=default_handler())
+    chunk_size: int = field(default=CHUNK_SIZE)
+
+    async def parse(self, source: Any, clazz: Optional[Type[T]] = None) -> T:
+        """
+        Parse the async source and return the resulting object tree.
+
+        Example::
+
+            async with session.get(url) as response:
+                books = await parser.parse(response.content, Books)
+
+        :param source: An async iterable of bytes or strings, or an
+            object with an async ``read(size)`` method, e.g.
+            :class:`asyncio.StreamReader`
+        :param clazz: The root class type, auto located if omitted.
+        :raises ParserError: If the document is not well-formed or the
+            root object failed to bind.
+        """
+        parser = XmlParser(
+            config=self.config, context=self.context, handler=self.handler
+        )
+        async for chunk in read_chunks(source, self.chunk_size):
+            parser.feed(chunk, clazz)
+            await asyncio.sleep(0)
+
+        if parser.feed_handler is None:
+            parser.feed(b"", clazz)
+
+        return parser.close()
+
+
+@dataclass
+class AsyncJsonParser:
+    """
+    Asyncio json parser for dataclasses.
+
+    The json module can't decode incrementally, the chunks of the
+    async source are collected without blocking the event loop and
+    the document is decoded and bound after the last chunk.
+
+    :param config: Parser configuration
+    :param context: Model context provider
+    :param load_factory: Replace the default json.load call with another
+        implementation
+    :param chunk_size: The chunk size to read from sources with an async
+        ``read(size)`` method
+    """
+
+    config: ParserConfig = field(default_factory=ParserConfig)
+    context: XmlContext = field(default_factory=XmlContext)
+    load_factory: Callable = field(default=json.load)
+    chunk_size: int = field(default=CHUNK_SIZE)
+
+    async def parse(self, source: Any, clazz: Optional[Type[T]] = None) -> T:
+        """
+        Parse the async source and return the resulting object tree.
+
+        :param source: An async iterable of bytes or strings, or an
+            object with an async ``read(size)`` method
+        :param clazz: The root class type, auto located if omitted.
+        """
+        chunks: List[bytes] = []
+        async for chunk in read_chunks(source, self.chunk_size):
+            chunks.append(chunk.encode() if isinstance(chunk, str) else chunk)
+
+        parser = JsonParser(
+            config=self.config, context=self.context, load_factory=self.load_factory
+        )
+        return parser.parse(BytesIO(b"".join(chunks)), clazz)
+
+
+async def read_chunks(source: Any, size: int) -> AsyncIterator[Any]:
+    """
+    Read the async source and yield its chunks, the chunks larger than
+    the given size are split.
+
+    :param source: An async iterable or an object with an async
+        ``read(size)`` method
+    :param size: The maximum chunk size
+    """
+    if hasattr(source, "read"):
+        while True:
+            chunk = await source.read(size)
+            if not chunk:
+                return
+
+            yield chunk
+    else:
+        async for chunk in source:
+            for index in range(0, len(chunk), size):
+                yield chunk[index : index + size]
@@ -1,11 +1,15 @@
 import copy
 import warnings
+from contextlib import contextmanager
 from dataclasses import dataclass
 from dataclasses import field
 from typing import Any
 from typing import Dict
+from typing import Iterable
+from typing import Iterator
 from typing import List
 from typing import Optional
+from typing import Set
 from typing import Tuple
 from typing import Type
 
@@ -15,6 +19,7 @@ from xsdata.formats.bindings import T
 from xsdata.formats.dataclass.context import XmlContext
 from xsdata.formats.dataclass.parsers.config import ParserConfig
 from xsdata.formats.dataclass.parsers.mixins import EventsHandler
+from xsdata.formats.dataclass.parsers.mixins import PathTracker
 from xsdata.formats.dataclass.parsers.mixins import PushParser
 from xsdata.formats.dataclass.parsers.mixins import XmlHandler
 from xsdata.formats.dataclass.parsers.mixins import XmlNode
@@ -33,33 +38,202 @@ class NodeParser(PushParser):
     :param context: Model context provider
     :param handler: Override default XmlHandler
     :ivar ms_map: Namespace registry of parsed prefix-URI mappings
+    :ivar projection: The field names projection of the active parse
     """
 
     config: ParserConfig = field(default_factory=ParserConfig)
     context: XmlContext = field(default_factory=XmlContext)
     handler: Type[XmlHandler] = field(default=EventsHandler)
     ns_map: Dict = field(init=False, default_factory=dict)
+    feed_handler: Optional[XmlHandler] = field(init=False, default=None)
+    projection: Optional[Dict] = field(init=False, default=None)
 
-    def parse(self, source: Any, clazz: Optional[Type[T]] = None) -> T:
-        """Parse the input stream or filename and return the resulting object
-        tree."""
+    def parse(
+        self,
+        source: Any,
+        clazz: Optional[Type[T]] = None,
+        fields: Optional[Iterable[str]] = None,
+    ) -> T:
+        """
+        Parse the input stream or filename and return the resulting object
+        tree.
+
+        The fields projection limits the binding to the given dot
+        separated field paths, the rest of the elements are skipped
+        and the fields are left to their defaults.
+
+        :param source: The xml source
+        :param clazz: The root class type, auto located if omitted.
+        :param fields: The field paths to bind, requires the root class
+        :raises ParserError: If the fields are given without the root
+            class or any field path is invalid.
+        """
+        if fields is not None:
+            if clazz is None:
+                raise ParserError("The fields projection requires the target class")
+
+            self.projection = ParserUtils.build_projection(self.context, clazz, fields)
+
+        handler = self.handler(clazz=clazz, parser=self)
+
+        try:
+            with self.capture_errors():
+                result = handler.parse(source)
+        finally:
+            self.projection = None
+
+        return self.verify_result(result, clazz)
+
+    def feed(self, data: Any, clazz: Optional[Type[T]] = None):
+        """
+        Feed the parser with the next chunk of an xml document.
+
+        The elements are bound as soon as they are complete, call
+        :meth:`close` after the last chunk to get the resulting object.
+
+        Example::
+
+            for chunk in response.iter_content(8192):
+                parser.feed(chunk, Books)
+
+            books = parser.close()
+
+        :param data: The bytes or string chunk
+        :param clazz: The root class type, only the first call of a
+            feed initializes the handler, auto located if omitted.
+        """
+        if self.feed_handler is None:
+            self.feed_handler = self.handler(clazz=clazz, parser=self)
+
+        try:
+            with self.capture_errors():
+                self.feed_handler.feed(data)
+        except Exception:
+            self.feed_handler = None
+            raise
+
+    def close(self) -> Any:
+        """
+        Terminate the active feed and return the resulting object tree.
+
+        :raises ParserError: If there is no active feed or the root
+            object failed to bind.
+        """
+        handler = self.feed_handler
+        if handler is None:
+            raise ParserError("There is no active feed to close")
+
+        self.feed_handler = None
+        with self.capture_errors():
+            result = handler.close()
+
+        return self.verify_result(result, handler.clazz)
+
+    def prepare(self, clazz: Type):
+        """Build the binding metadata of the given class and all of its
+        dependencies."""
+        self.context.build_recursive(clazz)
+
+    def iterparse(self, source: Any, clazz: Type, path: str) -> Iterator[Any]:
+        """
+        Parse the input stream or filename and yield the objects of the given
+        field path as soon as they are bound.
+
+        The yielded objects are removed from the object tree and the
+        handler releases their xml elements, the memory footprint stays
+        flat regardless of the document size.
+
+        Example::
+
+            for book in parser.iterparse("books.xml", Books, "book"):
+                ...
+
+        :param source: The xml source
+        :param clazz: The root class type
+        :param path: The dot separated field names from the root class
+            to the target field
+        """
+        tracker = PathTracker(self.build_path(clazz, path))
         handler = self.handler(clazz=clazz, parser=self)
+        iterator = handler.iterparse(source, tracker)
+
+        while True:
+            with self.capture_errors():
+                obj = next(iterator, StopIteration)
+
+            if obj is StopIteration:
+                return
+
+            yield obj
 
+    @contextmanager
+    def capture_errors(self) -> Iterator[None]:
+        """
+        Context manager to apply the converter warnings config and raise
+        syntax and converter errors as parser errors.
+
+        :raises ParserError: If the document is not well-formed or a
+            converter warning occurred and the config is strict.
+        """
         with warnings.catch_warnings():
             if self.config.fail_on_converter_warnings:
                 warnings.filterwarnings("error", category=ConverterWarning)
 
             try:
-                result = handler.parse(source)
+                yield
             except (ConverterWarning, SyntaxError) as e:
                 raise ParserError(e)
 
+    @classmethod
+    def verify_result(cls, result: Any, clazz: Optional[Type[T]]) -> T:
+        """
+        Verify the root object was bound and return it.
+
+        :raises ParserError: If the result is None
+        """
         if result is not None:
             return result
 
         target_class = clazz.__name__ if clazz else ""
         raise ParserError(f"Failed to create target class `{target_class}`")
 
+    def build_path(self, clazz: Type, path: str) -> List[Optional[Set[str]]]:
+        """
+        Convert the dot separated field names to the list of qualified names
+        per depth, starting from the root class.
+
+        Wildcard fields are converted to None as they match any element.
+
+        :param clazz: The root class type
+        :param path: The dot separated field names
+        :raises ParserError: If a field is unknown or it's not an element
+            or the path goes through a field with no single class type.
+        """
+        result: List[Optional[Set[str]]] = []
+        meta = self.context.build(clazz)
+        names = path.split(".")
+        for index, name in enumerate(names, start=1):
+            var = next((x for x in meta.get_element_vars() if x.name == name), None)
+            if var is None or var.is_text:
+                raise ParserError(f"Unknown element field: {clazz.__qualname__}.{path}")
+
+            if var.is_wildcard or var.wildcards:
+                result.append(None)
+            elif var.elements:
+                result.append(set(var.elements.keys()))
+            else:
+                result.append({var.qname})
+
+            if index < len(names):
+                if var.clazz is None or var.is_clazz_union:
+                    raise ParserError(
+                        f"Unsupported field path: {clazz.__qualname__}.{path}"
+                    )
+
+                meta = self.context.fetch(var.clazz, meta.namespace)
+
+        return result
+
     def start(
         self,
         clazz: Optional[Type],
@@ -120,6 +294,7 @@ class NodeParser(PushParser):
                 derived_factory=derived_factory,
                 xsi_type=xsi_type if derived_factory else None,
                 xsi_nil=xsi_nil,
+                projection=self.projection,
             )
 
         queue.append(child)
@@ -0,0 +1,206 @@
+from typing import Any
+from typing import Callable
+from typing import Dict
+from typing import Iterator
+from typing import List
+from typing import Set
+from typing import Tuple
+
+from xsdata.formats.dataclass.models.elements import XmlMeta
+from xsdata.formats.dataclass.models.elements import XmlVar
+from xsdata.logger import logger
+
+GENERIC_SOURCE = """def bind(node, text, tail, objects):
+    params = {}
+    node.bind_attrs(params)
+    node.bind_content(params, text, tail, objects)
+    return params"""
+
+
+class BinderCompiler:
+    """
+    Generate the source of a specialized function that collects the
+    constructor keyword arguments of a model from an
+    :class:`~xsdata.formats.dataclass.parsers.nodes.ElementNode`.
+
+    The attribute names and converters, the child element names and the
+    list fields are resolved once from the binding metadata. The list
+    fields are initialized once and converted to their factory at the
+    end. The unknown attributes and child elements fall back to the
+    generic node methods. Models with wildcard fields, including mixed
+    content, are bound entirely with the generic node methods.
+
+    :param meta: The model binding metadata
+    :ivar lines: The generated source lines
+    :ivar scope: The generated function globals
+    """
+
+    __slots__ = ("meta", "lines", "scope", "lists")
+
+    def __init__(self, meta: XmlMeta):
+        self.meta = meta
+        self.lines: List[str] = []
+        self.scope: Dict[str, Any] = {"logger": logger}
+        self.lists: Dict[str, str] = {}
+
+    def compile(self) -> Callable:
+        """Generate, execute and return the specialized function."""
+        source = self.build()
+        name = f"<bind {self.meta.clazz.__qualname__}>"
+        exec(compile(source, name, "exec"), self.scope)  # nosec
+        return self.scope["bind"]
+
+    def build(self) -> str:
+        """Generate the source of the specialized function."""
+        if self.meta.wildcards:
+            return GENERIC_SOURCE
+
+        self.lines = []
+        self.add(0, "def bind(node, text, tail, objects):")
+        self.add(1, "params = {}")
+        self.add(1, "ns_map = node.ns_map")
+
+        list_vars = self.list_vars()
+        self.lists = {var.name: f"items_{i}" for i, var in enumerate(list_vars)}
+        for var in list_vars:
+            self.add(1, f"{self.items(var)} = params[{var.name!r}] = []")
+
+        self.build_attrs()
+        self.build_objects()
+        self.build_text()
+
+        for var in list_vars:
+            items = self.items(var)
+            self.add(1, f"if not {items}:")
+            self.add(2, f"del params[{var.name!r}]")
+            if var.factory is tuple:
+                self.add(1, "else:")
+                self.add(2, f"params[{var.name!r}] = tuple({items})")
+
+        self.add(1, "return params")
+        return "\n".join(self.lines)
+
+    def build_attrs(self):
+        """Generate the code that binds the known attributes with their
+        converters and delegates the rest to the node."""
+        self.add(1, "attrs = node.attrs")
+        self.add(1, "if attrs:")
+        self.add(2, "for qname, value in attrs.items():")
+
+        keyword = "if"
+        for qname, var in self.meta.attributes.items():
+            self.add(3, f"{keyword} qname == {qname!r}:")
+            if var.init:
+                self.add(4, f"params[{var.name!r}] = {self.parse(var, 'value')}")
+            else:
+                self.add(4, "pass")
+            keyword = "elif"
+
+        if keyword == "elif":
+            self.add(3, "else:")
+            self.add(4, "node.bind_unknown_attr(params, qname, value)")
+        else:
+            self.add(3, "node.bind_unknown_attr(params, qname, value)")
+
+    def build_objects(self):
+        """Generate the code that assigns the child objects to the candidate
+        vars in the same order as the generic node methods."""
+        self.add(1, "position = node.position")
+        self.add(1, "for qname, value in objects[position:]:")
+
+        keyword = "if"
+        for qname in self.child_names():
+            self.add(2, f"{keyword} qname == {qname!r}:")
+            self.build_object(3, self.meta.find_children(qname))
+            keyword = "elif"
+
+        self.add(2, f"{keyword} not node.bind_object(params, qname, value):")
+        self.add(3, 'logger.warning("Unassigned parsed object %s", qname)')
+        self.add(1, "del objects[position:]")
+
+    def build_object(self, level: int, candidates: Tuple[XmlVar, ...]):
+        """Generate the assignment chain of a child element name, the first
+        candidate var that accepts the value wins."""
+        keyword = "if"
+        for var in candidates:
+            if not var.init:
+                line = "pass"
+            elif var.list_element:
+                line = f"{self.items(var)}.append(value)"
+            else:
+                self.add(level, f"{keyword} {var.name!r} not in params:")
+                self.add(level + 1, f"params[{var.name!r}] = value")
+                keyword = "elif"
+                continue
+
+            if keyword == "if":
+                self.add(level, line)
+            else:
+                self.add(level, "else:")
+                self.add(level + 1, line)
+            return
+
+        self.add(level, "else:")
+        self.add(level + 1, 'logger.warning("Unassigned parsed object %s", qname)')
+
+    def build_text(self):
+        """Generate the code that converts and binds the text content."""
+        var = self.meta.text
+        if not var or not var.init:
+            return
+
+        self.add(1, "if text is not None or node.xsi_nil:")
+        self.add(2, "if node.xsi_nil and not text:")
+        self.add(3, f"params[{var.name!r}] = None")
+        self.add(2, "else:")
+        self.add(3, f"params[{var.name!r}] = {self.parse(var, 'text')}")
+
+    def parse(self, var: XmlVar, value: str) -> str:
+        """Return the expression that converts the given string value, the
+        tokens are converted with the var parse method."""
+        name = f"var_{var.index}"
+        self.scope[name] = var
+        if var.tokens:
+            return f"{name}.parse_value({value}, ns_map)"
+
+        self.scope[f"{name}_deserializer"] = var.build_deserializer()
+        return f"{name}_deserializer({value}, ns_map)"
+
+    def child_names(self) -> Iterator[str]:
+        """Yield the known qualified names of the child elements."""
+        seen: Set[str] = set()
+        for qname in self.meta.elements:
+            seen.add(qname)
+            yield qname
+
+        for choice in self.meta.choices:
+            for qname in choice.elements:
+                if qname not in seen:
+                    seen.add(qname)
+                    yield qname
+
+    def list_vars(self) -> List[XmlVar]:
+        """Return the list element and compound vars."""
+        return [
+            var
+            for var in self.meta.get_element_vars()
+            if var.init and var.list_element and (var.is_element or var.is_elements)
+        ]
+
+    def add(self, level: int, line: str):
+        self.lines.append("    " * level + line)
+
+    def items(self, var: XmlVar) -> str:
+        """Return the local list name of the given var, the choices share
+        the list of their compound var."""
+        return self.lists[var.name]
+
+
+def compile_binder(context: Any, meta: XmlMeta) -> Callable:
+    """
+    Compile the specialized bind function of the given model.
+
+    :param context: The models context instance
+    :param meta: The model binding metadata
+    """
+    return BinderCompiler(meta).compile()
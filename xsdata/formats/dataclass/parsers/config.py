@@ -24,6 +24,8 @@ class ParserConfig:
         or fail with exception
     :param fail_on_converter_warnings: Turn converter warnings to
         exceptions
+    :param compiled: Bind the models with specialized functions compiled
+        once per class
     """
 
     __slots__ = (
@@ -33,6 +35,7 @@ class ParserConfig:
         "fail_on_unknown_properties",
         "fail_on_unknown_attributes",
         "fail_on_converter_warnings",
+        "compiled",
     )
 
     def __init__(
@@ -43,6 +46,7 @@ class ParserConfig:
         fail_on_unknown_properties: bool = True,
         fail_on_unknown_attributes: bool = False,
         fail_on_converter_warnings: bool = False,
+        compiled: bool = False,
     ):
         self.base_url = base_url
         self.process_xinclude = process_xinclude
@@ -50,3 +54,4 @@ class ParserConfig:
         self.fail_on_unknown_properties = fail_on_unknown_properties
         self.fail_on_unknown_attributes = fail_on_unknown_attributes
         self.fail_on_converter_warnings = fail_on_converter_warnings
+        self.compiled = compiled
@@ -1,10 +1,12 @@
 from typing import Type
 
 from xsdata.formats.dataclass.parsers.handlers.native import XmlEventHandler
+from xsdata.formats.dataclass.parsers.handlers.native import XmlExpatHandler
 from xsdata.formats.dataclass.parsers.mixins import XmlHandler
 
 try:
     from xsdata.formats.dataclass.parsers.handlers.lxml import LxmlEventHandler
+    from xsdata.formats.dataclass.parsers.handlers.lxml import LxmlTargetHandler
 
     def default_handler() -> Type[XmlHandler]:
         return LxmlEventHandler
@@ -18,6 +20,8 @@ except ImportError:  # pragma: no cover
 
 __all__ = [
     "LxmlEventHandler",
+    "LxmlTargetHandler",
     "XmlEventHandler",
+    "XmlExpatHandler",
     "default_handler",
 ]
@@ -1,9 +1,19 @@
+import errno
+import os
 from typing import Any
+from typing import Dict
 from typing import Iterable
+from typing import Iterator
+from typing import List
+from typing import Optional
+from typing import Tuple
+from typing import Type
 
 from lxml import etree
 
 from xsdata.exceptions import XmlHandlerError
+from xsdata.formats.dataclass.parsers.mixins import PathTracker
+from xsdata.formats.dataclass.parsers.mixins import PushParser
 from xsdata.formats.dataclass.parsers.mixins import XmlHandler
 from xsdata.models.enums import EventType
 
@@ -18,7 +28,12 @@ class LxmlEventHandler(XmlHandler):
     :param clazz: The target binding model, auto located if omitted.
     """
 
-    __slots__ = ()
+    __slots__ = ("pull_parser", "pending")
+
+    def __init__(self, parser: PushParser, clazz: Optional[Type]):
+        super().__init__(parser, clazz)
+        self.pull_parser: Optional[etree.XMLPullParser] = None
+        self.pending: List = []
 
     def parse(self, source: Any) -> Any:
         """
@@ -34,17 +49,108 @@ class LxmlEventHandler(XmlHandler):
         When config process_xinclude is enabled the handler will parse
         the whole document and then walk down the element tree.
         """
+        return self.process_context(self.create_context(source))
+
+    def iterparse(self, source: Any, path: PathTracker) -> Iterator[Any]:
+        """
+        Parse an XML document from a system identifier or an InputSource or
+        directly from an lxml Element or Tree and yield the objects that
+        match the given path as soon as they are bound.
 
-        if isinstance(source, (etree._ElementTree, etree._Element)):
-            ctx = etree.iterwalk(source, EVENTS)
-        elif self.parser.config.process_xinclude:
+        When the source is a system identifier or an InputSource the
+        handler will also remove the matched elements and their previous
+        siblings from the document tree, to keep the memory footprint
+        flat regardless of the document size.
+        """
+        streaming = not self.is_tree(source) and not self.parser.config.process_xinclude
+        for event, element in self.create_context(source):
+            if event == EventType.START:
+                path.start(element.tag, len(self.objects))
+                self.parser.start(
+                    self.clazz,
+                    self.queue,
+                    self.objects,
+                    element.tag,
+                    element.attrib,
+                    element.nsmap,
+                )
+            elif event == EventType.END:
+                self.parser.end(
+                    self.queue,
+                    self.objects,
+                    element.tag,
+                    element.text,
+                    element.tail,
+                )
+                element.clear()
+
+                if path.end():
+                    yield from path.pop(self.objects)
+
+                    if streaming:
+                        while element.getprevious() is not None:
+                            del element.getparent()[0]
+
+            elif event == EventType.START_NS:
+                prefix, uri = element
+                self.parser.register_namespace(prefix or None, uri)
+            else:
+                raise XmlHandlerError(f"Unhandled event: `{event}`.")
+
+    def feed(self, data: Any):
+        """
+        Feed the handler with the next chunk of an XML document based on
+        the :class:`lxml.etree.XMLPullParser` api.
+
+        The events are pushed to the main parser as soon as they are
+        available. The parser will ignore comments and recover from
+        errors, xinclude processing is not supported.
+
+        :param data: The bytes or string chunk
+        """
+        if self.pull_parser is None:
+            self.pull_parser = etree.XMLPullParser(
+                EVENTS, recover=True, remove_comments=True
+            )
+
+        self.pull_parser.feed(data)
+
+        # Hold back the last end event, its tail might be incomplete
+        events = self.pending
+        events.extend(self.pull_parser.read_events())
+        if events and events[-1][0] == EventType.END:
+            self.pending = [events.pop()]
+        else:
+            self.pending = []
+
+        self.process_context(events)
+
+    def close(self) -> Any:
+        """Terminate the feed, flush the remaining events and return the
+        resulting object."""
+        if self.pull_parser is None:
+            return None
+
+        self.pull_parser.close()
+        self.pending.extend(self.pull_parser.read_events())
+        return self.process_context(self.pending)
+
+    def create_context(self, source: Any) -> Iterable:
+        """Create the events iterator for the given source."""
+        if self.is_tree(source):
+            return etree.iterwalk(source, EVENTS)
+
+        if self.parser.config.process_xinclude:
             tree = etree.parse(source, base_url=self.parser.config.base_url)  # nosec
             tree.xinclude()
-            ctx = etree.iterwalk(tree, EVENTS)
-        else:
-            ctx = etree.iterparse(source, EVENTS, recover=True, remove_comments=True)
+            return etree.iterwalk(tree, EVENTS)
+
+        return etree.iterparse(source, EVENTS, recover=True, remove_comments=True)
 
-        return self.process_context(ctx)
+    @classmethod
+    def is_tree(cls, source: Any) -> bool:
+        """Return whether the given source is an lxml Element or Tree."""
+        return isinstance(source, (etree._ElementTree, etree._Element))
 
     def process_context(self, context: Iterable) -> Any:
         """Iterate context and push the events to main parser."""
@@ -74,3 +180,182 @@ class LxmlEventHandler(XmlHandler):
                 raise XmlHandlerError(f"Unhandled event: `{event}`.")
 
         return self.objects[-1][1] if self.objects else None
+
+
+class LxmlTargetHandler(LxmlEventHandler):
+    """
+    Content handler based on the :class:`lxml.etree.XMLParser` target api.
+
+    The lxml parser pushes the events directly to the handler callbacks
+    without building an element tree, the namespace prefix-URI maps are
+    updated incrementally.
+
+    Element or Tree sources, xinclude processing and iterparse fall
+    back to the :class:`lxml.etree.iterparse` api.
+
+    :param parser: The parser instance to feed with events
+    :param clazz: The target binding model, auto located if omitted.
+    """
+
+    __slots__ = ("target_parser", "ns_maps", "names", "buffer", "texts", "closing")
+
+    def __init__(self, parser: PushParser, clazz: Optional[Type]):
+        super().__init__(parser, clazz)
+        self.target_parser: Optional[etree.XMLParser] = None
+        self.ns_maps: List[Dict] = [{}]
+        self.names: List[str] = []
+        self.buffer: List[str] = []
+        self.texts: List[Optional[str]] = []
+        self.closing: Optional[Tuple[str, Optional[str]]] = None
+
+    def parse(self, source: Any) -> Any:
+        """
+        Parse an XML document from a system identifier or an InputSource or
+        directly from an lxml Element or Tree.
+
+        When source is a system identifier or an InputSource the parser
+        will ignore comments and recover from errors, except for the
+        errors reading the source.
+
+        :raises OSError: If the source can't be read
+        """
+        if self.is_tree(source) or self.parser.config.process_xinclude:
+            return super().parse(source)
+
+        parser = self.create_parser()
+        result = etree.parse(source, parser, base_url=self.parser.config.base_url)
+
+        for error in parser.error_log:
+            if error.domain == etree.ErrorDomains.IO:
+                if error.type == etree.ErrorTypes.IO_ENOENT:
+                    raise FileNotFoundError(
+                        errno.ENOENT, os.strerror(errno.ENOENT), source
+                    )
+
+                raise OSError(f"Error reading {source}: {error.message}")
+
+        return result
+
+    def feed(self, data: Any):
+        """
+        Feed the handler with the next chunk of an XML document.
+
+        :param data: The bytes or string chunk
+        """
+        if self.target_parser is None:
+            self.target_parser = self.create_parser()
+
+        self.target_parser.feed(data)
+
+    def close(self) -> Any:
+        """
+        Terminate the feed or the target parsing and return the resulting
+        object.
+
+        Closing the feed parser triggers again this method as the target
+        close callback, which pushes the last end event to the main
+        parser. The elements of a truncated document that are still
+        open are closed as well, like the iterparse recovery does.
+
+        The target parser calls this method even after a callback
+        error, which is raised again unless this method fails too.
+        """
+        if self.target_parser is not None:
+            target_parser = self.target_parser
+            self.target_parser = None
+            return target_parser.close()
+
+        closing = self.closing
+        if len(self.queue) != len(self.names) + (closing is not None):
+            return None  # A callback failed, the queue is out of sync
+
+        while self.names:
+            self.end(self.names[-1])
+
+        closing = self.closing
+        if closing:
+            self.closing = None
+            self.parser.end(self.queue, self.objects, closing[0], closing[1], None)
+
+        return self.objects[-1][1] if self.objects else None
+
+    def create_parser(self) -> etree.XMLParser:
+        """Create an lxml parser that ignores comments, recovers from errors
+        and uses the handler as target."""
+        return etree.XMLParser(target=self, recover=True, remove_comments=True)
+
+    def start(self, qname: str, attrs: Dict, ns_map: Dict):
+        """
+        Target start element callback.
+
+        Flush the pending text, as the previous sibling tail or the
+        parent text and push the start event to the main parser.
+
+        :param qname: Qualified name
+        :param attrs: Attribute key-value map
+        :param ns_map: The new namespace prefix-URI declarations
+        """
+        buffer = self.buffer
+        if buffer:
+            text: Optional[str] = "".join(buffer)
+            buffer.clear()
+        else:
+            text = None
+
+        closing = self.closing
+        if closing:
+            self.closing = None
+            self.parser.end(self.queue, self.objects, closing[0], closing[1], text)
+        elif self.texts:
+            self.texts[-1] = text
+
+        parent_ns_map = self.ns_maps[-1]
+        if ns_map:
+            parent_ns_map = parent_ns_map.copy()
+            for prefix, uri in ns_map.items():
+                prefix = prefix or None
+                parent_ns_map[prefix] = uri
+                self.parser.register_namespace(prefix, uri)
+
+        self.ns_maps.append(parent_ns_map)
+        self.names.append(qname)
+        self.parser.start(
+            self.clazz,
+            self.queue,
+            self.objects,
+            qname,
+            attrs or {},
+            parent_ns_map,
+        )
+        self.texts.append(None)
+
+    def end(self, qname: str):
+        """
+        Target end element callback.
+
+        The end event is pushed to the main parser on the next event,
+        when the element tail is complete.
+
+        :param qname: Qualified name
+        """
+        buffer = self.buffer
+        if buffer:
+            text: Optional[str] = "".join(buffer)
+            buffer.clear()
+        else:
+            text = None
+
+        closing = self.closing
+        if closing:
+            self.parser.end(self.queue, self.objects, closing[0], closing[1], text)
+            text = self.texts.pop()
+        else:
+            self.texts.pop()
+
+        self.ns_maps.pop()
+        self.names.pop()
+        self.closing = (qname, text)
+
+    def data(self, data: str):
+        """Target character data callback."""
+        self.buffer.append(data)
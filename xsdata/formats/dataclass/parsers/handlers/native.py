@@ -3,18 +3,23 @@ from typing import Any
 from typing import Dict
 from typing import Iterable
 from typing import Iterator
+from typing import List
 from typing import Optional
 from typing import Tuple
+from typing import Type
 from urllib.parse import urljoin
 from xml.etree import ElementInclude as xinclude
 from xml.etree import ElementTree as etree
+from xml.parsers import expat
 
 from xsdata.exceptions import XmlHandlerError
+from xsdata.formats.dataclass.parsers.mixins import PathTracker
+from xsdata.formats.dataclass.parsers.mixins import PushParser
 from xsdata.formats.dataclass.parsers.mixins import XmlHandler
 from xsdata.models.enums import EventType
 from xsdata.utils import namespaces
 
-EVENTS = (EventType.START, EventType.END, EventType.START_NS)
+EVENTS: Tuple[Any, ...] = (EventType.START, EventType.END, EventType.START_NS)
 
 
 class XmlEventHandler(XmlHandler):
@@ -25,7 +30,12 @@ class XmlEventHandler(XmlHandler):
     :param clazz: The target binding model, auto located if omitted.
     """
 
-    __slots__ = ()
+    __slots__ = ("pull_parser", "pending")
+
+    def __init__(self, parser: PushParser, clazz: Optional[Type]):
+        super().__init__(parser, clazz)
+        self.pull_parser: Optional[etree.XMLPullParser] = None
+        self.pending: List = []
 
     def parse(self, source: Any) -> Any:
         """
@@ -41,23 +51,115 @@ class XmlEventHandler(XmlHandler):
         When config process_xinclude is enabled the handler will parse
         the whole document and then walk down the element tree.
         """
+        return self.process_context(self.create_context(source))
+
+    def iterparse(self, source: Any, path: PathTracker) -> Iterator[Any]:
+        """
+        Parse an XML document from a system identifier or an InputSource or
+        directly from an xml Element or ElementTree and yield the objects that
+        match the given path as soon as they are bound.
+
+        When the source is a system identifier or an InputSource the
+        handler will also remove the matched elements and their previous
+        siblings from the document tree, to keep the memory footprint
+        flat regardless of the document size.
+        """
+        streaming = not self.is_tree(source) and not self.parser.config.process_xinclude
+        elements: List = []
+        ns_map: Dict = {}
+        for event, element in self.create_context(source):
+            if event == EventType.START:
+                path.start(element.tag, len(self.objects))
+                self.parser.start(
+                    self.clazz,
+                    self.queue,
+                    self.objects,
+                    element.tag,
+                    element.attrib,
+                    self.merge_parent_namespaces(ns_map),
+                )
+                elements.append(element)
+                ns_map = {}
+            elif event == EventType.END:
+                self.parser.end(
+                    self.queue,
+                    self.objects,
+                    element.tag,
+                    element.text,
+                    element.tail,
+                )
+                element.clear()
+                elements.pop()
+
+                if path.end():
+                    yield from path.pop(self.objects)
+
+                    if streaming and elements:
+                        del elements[-1][:]
 
+            elif event == EventType.START_NS:
+                prefix, uri = element
+                ns_map[prefix or None] = uri
+            else:
+                raise XmlHandlerError(f"Unhandled event: `{event}`.")
+
+    def feed(self, data: Any):
+        """
+        Feed the handler with the next chunk of an XML document based on
+        the :class:`xml.etree.ElementTree.XMLPullParser` api.
+
+        The events are pushed to the main parser as soon as they are
+        available, xinclude processing is not supported.
+
+        :param data: The bytes or string chunk
+        """
+        if self.pull_parser is None:
+            self.pull_parser = etree.XMLPullParser(EVENTS)
+
+        self.pull_parser.feed(data)
+
+        # Hold back the last end event, its tail might be incomplete
+        events = self.pending
+        events.extend(self.pull_parser.read_events())
+        if events and events[-1][0] == EventType.END:
+            self.pending = [events.pop()]
+        else:
+            self.pending = []
+
+        self.process_context(events)
+
+    def close(self) -> Any:
+        """Terminate the feed, flush the remaining events and return the
+        resulting object."""
+        if self.pull_parser is None:
+            return None
+
+        self.pull_parser.close()
+        self.pending.extend(self.pull_parser.read_events())
+        return self.process_context(self.pending)
+
+    def create_context(self, source: Any) -> Iterable:
+        """Create the events iterator for the given source."""
         if isinstance(source, etree.ElementTree):
             source = source.getroot()
 
         if isinstance(source, etree.Element):
-            ctx = iterwalk(source, {})
-        elif self.parser.config.process_xinclude:
+            return iterwalk(source, {})
+
+        if self.parser.config.process_xinclude:
             root = etree.parse(source).getroot()  # nosec
             base_url = get_base_url(self.parser.config.base_url, source)
             loader = functools.partial(xinclude_loader, base_url=base_url)
 
             xinclude.include(root, loader=loader)
-            ctx = iterwalk(root, {})
-        else:
-            ctx = etree.iterparse(source, EVENTS)  # nosec
+            return iterwalk(root, {})
+
+        return etree.iterparse(source, EVENTS)  # nosec
 
-        return self.process_context(ctx)
+    @classmethod
+    def is_tree(cls, source: Any) -> bool:
+        """Return whether the given source is an xml Element or ElementTree."""
+        return isinstance(source, (etree.ElementTree, etree.Element))
 
     def process_context(self, context: Iterable) -> Any:
         """Iterate context and push the events to main parser."""
@@ -91,6 +193,207 @@ class XmlEventHandler(XmlHandler):
         return self.objects[-1][1] if self.objects else None
 
 
+class XmlExpatHandler(XmlEventHandler):
+    """
+    Content handler based on the :mod:`xml.parsers.expat` callbacks api.
+
+    The expat parser pushes the events directly to the handler
+    callbacks without building an element tree, the namespace prefix-
+    URI maps are updated incrementally.
+
+    Element or ElementTree sources, xinclude processing and iterparse
+    fall back to the :func:`xml.etree.ElementTree.iterparse` api.
+
+    :param parser: The parser instance to feed with events
+    :param clazz: The target binding model, auto located if omitted.
+    """
+
+    __slots__ = (
+        "expat_parser",
+        "names",
+        "ns_maps",
+        "ns_declarations",
+        "buffer",
+        "texts",
+        "closing",
+    )
+
+    def __init__(self, parser: PushParser, clazz: Optional[Type]):
+        super().__init__(parser, clazz)
+        self.expat_parser: Optional[Any] = None
+        self.names: Dict[str, str] = {}
+        self.ns_maps: List[Dict] = [{}]
+        self.ns_declarations: Dict = {}
+        self.buffer: List[str] = []
+        self.texts: List[Optional[str]] = []
+        self.closing: Optional[Tuple[str, Optional[str]]] = None
+
+    def parse(self, source: Any) -> Any:
+        """
+        Parse an XML document from a system identifier or an InputSource or
+        directly from an xml Element or ElementTree.
+
+        When source is a system identifier or an InputSource the parser
+        will ignore comments.
+        """
+        if self.is_tree(source) or self.parser.config.process_xinclude:
+            return super().parse(source)
+
+        if hasattr(source, "read"):
+            self.parse_file(source)
+        else:
+            with open(source, "rb") as fp:
+                self.parse_file(fp)
+
+        return self.close()
+
+    def parse_file(self, fp: Any):
+        """Feed the handler with the contents of the given file object in
+        chunks of 64KiB."""
+        read = fp.read
+        while True:
+            data = read(65536)
+            if not data:
+                break
+
+            self.feed(data)
+
+    def feed(self, data: Any):
+        """
+        Feed the handler with the next chunk of an XML document.
+
+        :param data: The bytes or string chunk
+        """
+        if self.expat_parser is None:
+            self.expat_parser = self.create_parser()
+
+        try:
+            self.expat_parser.Parse(data, False)
+        except expat.ExpatError as e:
+            raise parse_error(e)
+
+    def close(self) -> Any:
+        """Terminate the feed, push the last end event to the main parser
+        and return the resulting object."""
+        if self.expat_parser is not None:
+            expat_parser = self.expat_parser
+            self.expat_parser = None
+            try:
+                expat_parser.Parse(b"", True)
+            except expat.ExpatError as e:
+                raise parse_error(e)
+
+        closing = self.closing
+        if closing:
+            self.closing = None
+            self.parser.end(self.queue, self.objects, closing[0], closing[1], None)
+
+        return self.objects[-1][1] if self.objects else None
+
+    def create_parser(self) -> Any:
+        """Create an expat parser with namespace processing and the handler
+        callbacks."""
+        parser = expat.ParserCreate(namespace_separator="}")
+        parser.buffer_text = True
+        parser.StartNamespaceDeclHandler = self.start_ns
+        parser.StartElementHandler = self.start
+        parser.EndElementHandler = self.end
+        parser.CharacterDataHandler = self.buffer.append
+        return parser
+
+    def start_ns(self, prefix: Optional[str], uri: str):
+        """
+        Expat namespace declaration callback.
+
+        :param prefix: Namespace prefix
+        :param uri: Namespace uri
+        """
+        self.ns_declarations[prefix] = uri or ""
+
+    def start(self, name: str, attrs: Dict):
+        """
+        Expat start element callback.
+
+        Flush the pending text, as the previous sibling tail or the
+        parent text and push the start event to the main parser.
+
+        :param name: The expat element name
+        :param attrs: The expat attributes key-value map
+        """
+        buffer = self.buffer
+        if buffer:
+            text: Optional[str] = "".join(buffer)
+            buffer.clear()
+        else:
+            text = None
+
+        closing = self.closing
+        if closing:
+            self.closing = None
+            self.parser.end(self.queue, self.objects, closing[0], closing[1], text)
+        elif self.texts:
+            self.texts[-1] = text
+
+        ns_map = self.ns_maps[-1]
+        if self.ns_declarations:
+            ns_map = ns_map.copy()
+            for prefix, uri in self.ns_declarations.items():
+                ns_map[prefix] = uri
+                self.parser.register_namespace(prefix, uri)
+
+            self.ns_declarations = {}
+
+        self.ns_maps.append(ns_map)
+        if attrs:
+            attrs = {self.qname(key): value for key, value in attrs.items()}
+
+        self.parser.start(
+            self.clazz,
+            self.queue,
+            self.objects,
+            self.names.get(name) or self.qname(name),
+            attrs,
+            ns_map,
+        )
+        self.texts.append(None)
+
+    def end(self, name: str):
+        """
+        Expat end element callback.
+
+        The end event is pushed to the main parser on the next event,
+        when the element tail is complete.
+
+        :param name: The expat element name
+        """
+        buffer = self.buffer
+        if buffer:
+            text: Optional[str] = "".join(buffer)
+            buffer.clear()
+        else:
+            text = None
+
+        closing = self.closing
+        if closing:
+            self.parser.end(self.queue, self.objects, closing[0], closing[1], text)
+            text = self.texts.pop()
+        else:
+            self.texts.pop()
+
+        self.ns_maps.pop()
+        self.closing = (self.names.get(name) or self.qname(name), text)
+
+    def qname(self, name: str) -> str:
+        """Convert and cache the expat `uri}local` name to the qualified
+        `{uri}local` name."""
+        try:
+            return self.names[name]
+        except KeyError:
+            qname = f"{{{name}" if "}" in name else name
+            self.names[name] = qname
+            return qname
+
+
 def iterwalk(element: etree.Element, ns_map: Dict) -> Iterator[Tuple[str, Any]]:
     """
     Walk over the element tree structure and emit start-ns/start/end events.
@@ -127,3 +430,12 @@ def xinclude_loader(
     """Custom loader for xinclude to support base_url argument that doesn't
     exist for python < 3.9."""
     return xinclude.default_loader(urljoin(base_url or "", href), parse, encoding)
+
+
+def parse_error(error: expat.ExpatError) -> etree.ParseError:
+    """Convert the expat error to an :class:`xml.etree.ElementTree.ParseError`
+    like the ElementTree parser."""
+    result = etree.ParseError(str(error))
+    result.code = error.code
+    result.position = error.lineno, error.offset
+    return result
@@ -41,9 +41,34 @@ class JsonParser(AbstractParser):
     context: XmlContext = field(default_factory=XmlContext)
     load_factory: Callable = field(default=json.load)
 
-    def parse(self, source: Any, clazz: Optional[Type[T]] = None) -> T:
-        """Parse the input stream or filename and return the resulting object
-        tree."""
+    def parse(
+        self,
+        source: Any,
+        clazz: Optional[Type[T]] = None,
+        fields: Optional[Iterable[str]] = None,
+    ) -> T:
+        """
+        Parse the input stream or filename and return the resulting object
+        tree.
+
+        The fields projection limits the binding to the given dot
+        separated field paths, the rest of the properties are skipped
+        and the fields are left to their defaults.
+
+        :param source: The json source
+        :param clazz: The root class type, auto located if omitted.
+        :param fields: The field paths to bind, requires the root class
+        :raises ParserError: If the fields are given without the root
+            class or any field path is invalid.
+        """
+
+        projection = None
+        if fields is not None:
+            if clazz is None:
+                raise ParserError("The fields projection requires the target class")
+
+            root = get_args(clazz)[0] if get_origin(clazz) is List else clazz
+            projection = ParserUtils.build_projection(self.context, root, fields)
 
         data = self.load_json(source)
         tp = self.verify_type(clazz, data)
@@ -54,12 +79,22 @@ class JsonParser(AbstractParser):
 
             try:
                 if not isinstance(data, list):
-                    return self.bind_dataclass(data, tp)
+                    return self.bind_dataclass(data, tp, projection)
 
-                return [self.bind_dataclass(obj, tp) for obj in data]  # type: ignore
+                return [
+                    self.bind_dataclass(obj, tp, projection) for obj in data
+                ]  # type: ignore
             except ConverterWarning as e:
                 raise ParserError(e)
 
+    def prepare(self, clazz: Type):
+        """Build the binding metadata of the given class and all of its
+        dependencies."""
+        if get_origin(clazz) is List:
+            clazz = get_args(clazz)[0]
+
+        self.context.build_recursive(clazz)
+
     def load_json(self, source: Any) -> Union[Dict, List]:
         if not hasattr(source, "read"):
             with open(source, "rb") as fp:
@@ -106,11 +141,20 @@ class JsonParser(AbstractParser):
 
         raise ParserError(f"Unable to locate model with properties({list(keys)})")
 
-    def bind_dataclass(self, data: Dict, clazz: Type[T]) -> T:
-        """Recursively build the given model from the input dict data."""
+    def bind_dataclass(
+        self, data: Dict, clazz: Type[T], projection: Optional[Dict] = None
+    ) -> T:
+        """
+        Recursively build the given model from the input dict data.
+
+        :param data: The input dict data
+        :param clazz: The target class type
+        :param projection: The field names to bind and their nested
+            projections, bind all fields if omitted.
+        """
 
         if set(data.keys()) == self.context.class_type.derived_keys:
-            return self.bind_derived_dataclass(data, clazz)
+            return self.bind_derived_dataclass(data, clazz, projection)
 
         meta = self.context.build(clazz)
         xml_vars = meta.get_all_vars()
@@ -124,14 +168,21 @@ class JsonParser(AbstractParser):
                 raise ParserError(f"Unknown property {clazz.__qualname__}.{key}")
 
             if var and var.init:
-                params[var.name] = self.bind_value(meta, var, value)
+                if projection is None:
+                    params[var.name] = self.bind_value(meta, var, value)
+                elif var.name in projection:
+                    params[var.name] = self.bind_value(
+                        meta, var, value, projection=projection[var.name]
+                    )
 
         try:
             return self.config.class_factory(clazz, params)
         except TypeError as e:
             raise ParserError(e)
 
-    def bind_derived_dataclass(self, data: Dict, clazz: Type[T]) -> Any:
+    def bind_derived_dataclass(
+        self, data: Dict, clazz: Type[T], projection: Optional[Dict] = None
+    ) -> Any:
         qname = data["qname"]
         xsi_type = data["type"]
         params = data["value"]
@@ -149,9 +200,9 @@ class JsonParser(AbstractParser):
                     f"with properties({list(params.keys())})"
                 )
 
-            value = self.bind_dataclass(params, real_clazz)
+            value = self.bind_dataclass(params, real_clazz, projection)
         else:
-            value = self.bind_dataclass(params, clazz)
+            value = self.bind_dataclass(params, clazz, projection)
 
         return generic(qname=qname, type=xsi_type, value=value)
 
@@ -192,7 +243,12 @@ class JsonParser(AbstractParser):
             return None
 
     def bind_value(
-        self, meta: XmlMeta, var: XmlVar, value: Any, recursive: bool = False
+        self,
+        meta: XmlMeta,
+        var: XmlVar,
+        value: Any,
+        recursive: bool = False,
+        projection: Optional[Dict] = None,
     ) -> Any:
         """Main entry point for binding values."""
 
@@ -203,7 +259,9 @@ class JsonParser(AbstractParser):
         # Repeating element, recursively bind the values
         if not recursive and var.list_element and isinstance(value, list):
             assert var.factory is not None
-            return var.factory(self.bind_value(meta, var, val, True) for val in value)
+            return var.factory(
+                self.bind_value(meta, var, val, True, projection) for val in value
+            )
 
         # If not dict this is an text or tokens value.
         if not isinstance(value, dict):
@@ -216,10 +274,10 @@ class JsonParser(AbstractParser):
 
         if keys == self.context.class_type.derived_keys:
             # Bind data to AnyElement dataclass
-            return self.bind_derived_value(meta, var, value)
+            return self.bind_derived_value(meta, var, value, projection)
 
         # Bind data to a user defined dataclass
-        return self.bind_complex_type(meta, var, value)
+        return self.bind_complex_type(meta, var, value, projection)
 
     def bind_text(self, meta: XmlMeta, var: XmlVar, value: Any) -> Any:
         """Bind text/tokens value entrypoint."""
@@ -241,16 +299,15 @@ class JsonParser(AbstractParser):
             return value
 
         # Convert value according to the field types
-        return ParserUtils.parse_value(
-            value=value,
-            types=var.types,
-            default=var.default,
-            ns_map=EMPTY_MAP,
-            tokens_factory=var.tokens_factory,
-            format=var.format,
-        )
-
-    def bind_complex_type(self, meta: XmlMeta, var: XmlVar, data: Dict) -> Any:
+        return var.parse_value(value, EMPTY_MAP)
+
+    def bind_complex_type(
+        self,
+        meta: XmlMeta,
+        var: XmlVar,
+        data: Dict,
+        projection: Optional[Dict] = None,
+    ) -> Any:
         """Bind data to a user defined dataclass."""
 
         if var.is_clazz_union:
@@ -271,9 +328,15 @@ class JsonParser(AbstractParser):
             subclasses.add(var.clazz)
             return self.bind_best_dataclass(data, subclasses)
 
-        return self.bind_dataclass(data, var.clazz)
+        return self.bind_dataclass(data, var.clazz, projection)
 
-    def bind_derived_value(self, meta: XmlMeta, var: XmlVar, data: Dict) -> T:
+    def bind_derived_value(
+        self,
+        meta: XmlMeta,
+        var: XmlVar,
+        data: Dict,
+        projection: Optional[Dict] = None,
+    ) -> T:
         """Bind derived element entry point."""
 
         qname = data["qname"]
@@ -292,7 +355,7 @@ class JsonParser(AbstractParser):
         if not isinstance(params, dict):
             value = self.bind_text(meta, var, params)
         elif var.clazz:
-            value = self.bind_complex_type(meta, var, params)
+            value = self.bind_complex_type(meta, var, params, projection)
         elif xsi_type:
             clazz: Optional[Type] = self.context.find_type(xsi_type)
 
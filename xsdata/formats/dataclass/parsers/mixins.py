@@ -1,8 +1,11 @@
 import abc
 from typing import Any
 from typing import Dict
+from typing import Iterator
 from typing import List
 from typing import Optional
+from typing import Sequence
+from typing import Set
 from typing import Tuple
 from typing import Type
 
@@ -108,6 +111,62 @@ class XmlNode(abc.ABC):
         """
 
 
+class PathTracker:
+    """
+    Track the open xml elements against a path of qualified names.
+
+    The path doesn't include the root element, every entry is the set of
+    the qualified names allowed in that depth, None matches any element.
+
+    :param path: A list of qualified names per depth
+    :ivar depth: The number of open elements
+    :ivar matched: The number of open elements that match the path
+    :ivar position: The objects position of the last matched element
+    """
+
+    __slots__ = ("path", "depth", "matched", "position")
+
+    def __init__(self, path: Sequence[Optional[Set[str]]]):
+        self.path = path
+        self.depth = 0
+        self.matched = 0
+        self.position = 0
+
+    def start(self, qname: str, position: int):
+        """
+        Start element notification receiver.
+
+        :param qname: Qualified name
+        :param position: The current objects position
+        """
+        depth = self.depth
+        if self.matched == depth and depth <= len(self.path):
+            qnames = self.path[depth - 1] if depth else None
+            if qnames is None or qname in qnames:
+                self.matched += 1
+                self.position = position
+
+        self.depth += 1
+
+    def end(self) -> bool:
+        """
+        End element notification receiver.
+
+        :return: Whether the ending element matches the full path.
+        """
+        self.depth -= 1
+        if self.matched > self.depth:
+            self.matched -= 1
+            return self.depth == len(self.path)
+
+        return False
+
+    def pop(self, objects: List) -> Iterator[Any]:
+        """Remove and yield the last matched object, if it was bound."""
+        if len(objects) > self.position:
+            yield objects.pop(self.position)[1]
+
+
 class XmlHandler:
     """
     Abstract content handler.
@@ -128,6 +187,20 @@ class XmlHandler:
         """Parse an XML document from a system identifier or an InputSource."""
         raise NotImplementedError("This method must be implemented!")
 
+    def iterparse(self, source: Any, path: PathTracker) -> Iterator[Any]:
+        """Parse an XML document from a system identifier or an InputSource and
+        yield the objects that match the given path as soon as they are
+        bound."""
+        raise NotImplementedError("This method must be implemented!")
+
+    def feed(self, data: Any):
+        """Feed the handler with the next chunk of an XML document."""
+        raise NotImplementedError("This method must be implemented!")
+
+    def close(self) -> Any:
+        """Terminate the feed and return the resulting object."""
+        raise NotImplementedError("This method must be implemented!")
+
     def merge_parent_namespaces(self, ns_map: Dict) -> Dict:
         """
         Merge and return the given prefix-URI map with the parent node.
@@ -188,3 +261,31 @@ class EventsHandler(XmlHandler):
                 raise XmlHandlerError(f"Unhandled event: `{event}`.")
 
         return self.objects[-1][1] if self.objects else None
+
+    def iterparse(self, source: List[Tuple], path: PathTracker) -> Iterator[Any]:
+        """Forward the pre-recorded events to the main parser and yield the
+        objects that match the given path as soon as they are bound."""
+
+        for event, *args in source:
+            if event == EventType.START:
+                qname, attrs, ns_map = args
+                path.start(qname, len(self.objects))
+                self.parser.start(
+                    self.clazz,
+                    self.queue,
+                    self.objects,
+                    qname,
+                    attrs,
+                    ns_map,
+                )
+            elif event == EventType.END:
+                qname, text, tail = args
+                self.parser.end(self.queue, self.objects, qname, text, tail)
+
+                if path.end():
+                    yield from path.pop(self.objects)
+            elif event == EventType.START_NS:
+                prefix, uri = args
+                self.parser.register_namespace(prefix or None, uri)
+            else:
+                raise XmlHandlerError(f"Unhandled event: `{event}`.")
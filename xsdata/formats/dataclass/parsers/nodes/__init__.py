@@ -1,4 +1,5 @@
 from xsdata.formats.dataclass.parsers.nodes.element import ElementNode
+from xsdata.formats.dataclass.parsers.nodes.lazy import LazyNode
 from xsdata.formats.dataclass.parsers.nodes.primitive import PrimitiveNode
 from xsdata.formats.dataclass.parsers.nodes.skip import SkipNode
 from xsdata.formats.dataclass.parsers.nodes.standard import StandardNode
@@ -7,6 +8,7 @@ from xsdata.formats.dataclass.parsers.nodes.wildcard import WildcardNode
 
 __all__ = [
     "ElementNode",
+    "LazyNode",
     "PrimitiveNode",
     "SkipNode",
     "StandardNode",
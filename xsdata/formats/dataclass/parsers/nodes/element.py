@@ -11,6 +11,7 @@ from xsdata.formats.dataclass.context import XmlContext
 from xsdata.formats.dataclass.models.elements import XmlMeta
 from xsdata.formats.dataclass.models.elements import XmlVar
 from xsdata.formats.dataclass.parsers import nodes
+from xsdata.formats.dataclass.parsers.compiler import compile_binder
 from xsdata.formats.dataclass.parsers.config import ParserConfig
 from xsdata.formats.dataclass.parsers.mixins import XmlNode
 from xsdata.formats.dataclass.parsers.utils import ParserUtils
@@ -34,6 +35,8 @@ class ElementNode(XmlNode):
     :param derived_factory: Derived element factory
     :param xsi_type: The xml type substitution
     :param xsi_nil: The xml type substitution
+    :param projection: The field names to bind and their nested
+        projections, bind all fields if omitted.
     """
 
     __slots__ = (
@@ -47,6 +50,7 @@ class ElementNode(XmlNode):
         "derived_factory",
         "xsi_type",
         "xsi_nil",
+        "projection",
         "assigned",
         "tail_processed",
     )
@@ -63,6 +67,7 @@ class ElementNode(XmlNode):
         derived_factory: Optional[Type] = None,
         xsi_type: Optional[str] = None,
         xsi_nil: Optional[bool] = None,
+        projection: Optional[Dict] = None,
     ):
         self.meta = meta
         self.attrs = attrs
@@ -74,6 +79,7 @@ class ElementNode(XmlNode):
         self.derived_factory = derived_factory
         self.xsi_type = xsi_type
         self.xsi_nil = xsi_nil
+        self.projection = projection
         self.assigned: Set[int] = set()
         self.tail_processed: bool = False
 
@@ -83,9 +89,14 @@ class ElementNode(XmlNode):
 
         obj: Any = None
         if not self.xsi_nil or self.meta.nillable:
-            params: Dict = {}
-            self.bind_attrs(params)
-            self.bind_content(params, text, tail, objects)
+            if self.config.compiled and self.projection is None:
+                binder = self.context.compile(self.meta.clazz, compile_binder)
+                params = binder(self, text, tail, objects)
+            else:
+                params = {}
+                self.bind_attrs(params)
+                self.bind_content(params, text, tail, objects)
+
             obj = self.config.class_factory(self.meta.clazz, params)
 
         if self.derived_factory:
@@ -104,6 +115,9 @@ class ElementNode(XmlNode):
         self, params: Dict, text: Optional[str], tail: Optional[str], objects: List[Any]
     ):
         wild_var = self.meta.find_any_wildcard()
+        if wild_var and not self.is_projected(wild_var):
+            wild_var = None
+
         if wild_var and wild_var.mixed:
             self.bind_mixed_objects(params, wild_var, objects)
             bind_text = False
@@ -130,27 +144,24 @@ class ElementNode(XmlNode):
         for qname, value in self.attrs.items():
             var = self.meta.find_attribute(qname)
             if var and var.name not in params:
-                self.bind_attr(params, var, value)
+                if self.is_projected(var):
+                    self.bind_attr(params, var, value)
             else:
-                var = self.meta.find_any_attributes(qname)
-                if var:
-                    self.bind_any_attr(params, var, qname, value)
-                else:
-                    if self.config.fail_on_unknown_attributes:
-                        raise ParserError(
-                            f"Unknown attribute {self.meta.qname}:{qname}"
-                        )
+                self.bind_unknown_attr(params, qname, value)
+
+    def bind_unknown_attr(self, params: Dict, qname: str, value: Any):
+        """Bind the given attribute to the wildcard attributes var or fail
+        if the configuration doesn't allow unknown attributes."""
+        var = self.meta.find_any_attributes(qname)
+        if var:
+            if self.is_projected(var):
+                self.bind_any_attr(params, var, qname, value)
+        elif self.config.fail_on_unknown_attributes:
+            raise ParserError(f"Unknown attribute {self.meta.qname}:{qname}")
 
     def bind_attr(self, params: Dict, var: XmlVar, value: Any):
         if var.init:
-            params[var.name] = ParserUtils.parse_value(
-                value=value,
-                types=var.types,
-                default=var.default,
-                ns_map=self.ns_map,
-                tokens_factory=var.tokens_factory,
-                format=var.format,
-            )
+            params[var.name] = var.parse_value(value, self.ns_map)
 
     def bind_any_attr(self, params: Dict, var: XmlVar, qname: str, value: Any):
         if var.name not in params:
@@ -273,18 +284,14 @@ class ElementNode(XmlNode):
         if not var or (text is None and not self.xsi_nil):
             return False
 
+        if not self.is_projected(var):
+            return True
+
         if var.init:
             if self.xsi_nil and not text:
                 params[var.name] = None
             else:
-                params[var.name] = ParserUtils.parse_value(
-                    value=text,
-                    types=var.types,
-                    default=var.default,
-                    ns_map=self.ns_map,
-                    tokens_factory=var.tokens_factory,
-                    format=var.format,
-                )
+                params[var.name] = var.parse_value(text, self.ns_map)
         return True
 
     def bind_wild_text(
@@ -329,7 +336,12 @@ class ElementNode(XmlNode):
         return True
 
     def child(self, qname: str, attrs: Dict, ns_map: Dict, position: int) -> XmlNode:
+        skipped = False
         for var in self.meta.find_children(qname):
+            if not self.is_projected(var):
+                skipped = True
+                continue
+
             unique = 0 if not var.is_element or var.list_element else var.index
             if not unique or unique not in self.assigned:
                 node = self.build_node(var, attrs, ns_map, position)
@@ -340,7 +352,7 @@ class ElementNode(XmlNode):
 
                     return node
 
-        if self.config.fail_on_unknown_properties:
+        if not skipped and self.config.fail_on_unknown_properties:
             raise ParserError(f"Unknown property {self.meta.qname}:{qname}")
 
         return nodes.SkipNode()
@@ -363,6 +375,16 @@ class ElementNode(XmlNode):
         derived_factory = self.context.class_type.derived_element
 
         if var.clazz:
+            if var.lazy:
+                return nodes.LazyNode(
+                    clazz=var.clazz,
+                    attrs=attrs,
+                    ns_map=ns_map,
+                    namespace=self.meta.namespace,
+                    config=self.config,
+                    context=self.context,
+                )
+
             return self.build_element_node(
                 var.clazz,
                 attrs,
@@ -371,6 +393,7 @@ class ElementNode(XmlNode):
                 derived_factory if var.derived else None,
                 xsi_type,
                 xsi_nil,
+                self.projection[var.name] if self.projection else None,
             )
 
         if not var.any_type and not var.is_wildcard:
@@ -419,6 +442,7 @@ class ElementNode(XmlNode):
         derived_factory: Optional[Type] = None,
         xsi_type: Optional[str] = None,
         xsi_nil: Optional[bool] = None,
+        projection: Optional[Dict] = None,
     ) -> Optional[XmlNode]:
 
         meta = self.context.fetch(clazz, self.meta.namespace, xsi_type)
@@ -437,4 +461,9 @@ class ElementNode(XmlNode):
             xsi_type=xsi_type,
             xsi_nil=xsi_nil,
             mixed=self.meta.mixed_content,
+            projection=projection,
         )
+
+    def is_projected(self, var: XmlVar) -> bool:
+        """Return whether the given var is included in the node projection."""
+        return self.projection is None or var.name in self.projection
@@ -0,0 +1,127 @@
+from typing import Any
+from typing import Dict
+from typing import List
+from typing import Optional
+from typing import Type
+
+from xsdata.formats.dataclass.context import XmlContext
+from xsdata.formats.dataclass.models.generics import LazyElement
+from xsdata.formats.dataclass.parsers import nodes
+from xsdata.formats.dataclass.parsers.config import ParserConfig
+from xsdata.formats.dataclass.parsers.mixins import XmlNode
+from xsdata.formats.dataclass.parsers.utils import ParserUtils
+from xsdata.models.enums import EventType
+
+
+class LazyNode(XmlNode):
+    """
+    XmlNode for lazy fields.
+
+    The node and its children record the element events instead of
+    building any objects. The resulting object is a
+    :class:`~xsdata.formats.dataclass.models.generics.LazyElement`
+    proxy that replays the recorded events on first access.
+
+    :param clazz: The field class type
+    :param attrs: Key-value attribute mapping, copied as the handlers
+        might clear the attributes after the element end
+    :param ns_map: Namespace prefix-URI map
+    :param namespace: The parent namespace
+    :param config: Parser configuration
+    :param context: Model context provider
+    :param events: The shared recorded events of the lazy element,
+        only the children nodes receive them.
+    """
+
+    __slots__ = (
+        "clazz",
+        "attrs",
+        "ns_map",
+        "namespace",
+        "config",
+        "context",
+        "events",
+        "nested",
+    )
+
+    def __init__(
+        self,
+        clazz: Type,
+        attrs: Dict,
+        ns_map: Dict,
+        namespace: Optional[str],
+        config: ParserConfig,
+        context: XmlContext,
+        events: Optional[List] = None,
+    ):
+        self.clazz = clazz
+        self.attrs = dict(attrs)
+        self.ns_map = ns_map
+        self.namespace = namespace
+        self.config = config
+        self.context = context
+        self.nested = events is not None
+        self.events: List = [] if events is None else events
+
+    def bind(
+        self, qname: str, text: Optional[str], tail: Optional[str], objects: List
+    ) -> bool:
+        if self.nested:
+            self.events.append((EventType.END, qname, text, tail))
+            return False
+
+        # The tail belongs to the parent element
+        self.events.insert(0, (EventType.START, qname, self.attrs, self.ns_map))
+        self.events.append((EventType.END, qname, text, None))
+
+        clazz = self.clazz
+        xsi_type = ParserUtils.xsi_type(self.attrs, self.ns_map)
+        if xsi_type:
+            clazz = self.context.fetch(clazz, self.namespace, xsi_type).clazz
+
+        obj = LazyElement(clazz, self.events, self.build)
+        objects.append((qname, obj))
+
+        return True
+
+    def child(self, qname: str, attrs: Dict, ns_map: Dict, position: int) -> XmlNode:
+        node = LazyNode(
+            clazz=self.clazz,
+            attrs=attrs,
+            ns_map=ns_map,
+            namespace=self.namespace,
+            config=self.config,
+            context=self.context,
+            events=self.events,
+        )
+        self.events.append((EventType.START, qname, node.attrs, ns_map))
+
+        return node
+
+    def build(self, events: List) -> Any:
+        """Replay the recorded events of the lazy element and return the
+        resulting object."""
+        xsi_type = ParserUtils.xsi_type(self.attrs, self.ns_map)
+        meta = self.context.fetch(self.clazz, self.namespace, xsi_type)
+        queue: List[XmlNode] = [
+            nodes.ElementNode(
+                meta=meta,
+                attrs=self.attrs,
+                ns_map=self.ns_map,
+                config=self.config,
+                context=self.context,
+                position=0,
+                xsi_nil=ParserUtils.xsi_nil(self.attrs),
+            )
+        ]
+        objects: List = []
+
+        for event, *args in events[1:]:
+            if event == EventType.START:
+                qname, attrs, ns_map = args
+                queue.append(queue[-1].child(qname, attrs, ns_map, len(objects)))
+            else:
+                qname, text, tail = args
+                queue.pop().bind(qname, text, tail, objects)
+
+        return objects[-1][1]
@@ -6,7 +6,6 @@ from typing import Type
 from xsdata.exceptions import XmlContextError
 from xsdata.formats.dataclass.models.elements import XmlVar
 from xsdata.formats.dataclass.parsers.mixins import XmlNode
-from xsdata.formats.dataclass.parsers.utils import ParserUtils
 
 
 class PrimitiveNode(XmlNode):
@@ -28,14 +27,7 @@ class PrimitiveNode(XmlNode):
     def bind(
         self, qname: str, text: Optional[str], tail: Optional[str], objects: List
     ) -> bool:
-        obj = ParserUtils.parse_value(
-            value=text,
-            types=self.var.types,
-            default=self.var.default,
-            ns_map=self.ns_map,
-            tokens_factory=self.var.tokens_factory,
-            format=self.var.format,
-        )
+        obj = self.var.parse_value(text, self.ns_map)
 
         if obj is None and not self.var.nillable:
             obj = ""
@@ -59,6 +59,7 @@ class TreeParser(NodeParser):
                 namespaces=(),
                 elements={},
                 wildcards=(),
+                lazy=False,
             )
 
             child = WildcardNode(
@@ -7,8 +7,10 @@ from typing import Optional
 from typing import Sequence
 from typing import Type
 
+from xsdata.exceptions import ParserError
 from xsdata.formats.converter import converter
 from xsdata.formats.converter import QNameConverter
+from xsdata.formats.dataclass.context import XmlContext
 from xsdata.models.enums import QNames
 from xsdata.utils import collections
 from xsdata.utils import constants
@@ -96,3 +98,52 @@ class ParserUtils:
             value = build_qname(ns_map[prefix], suffix)
 
         return value
+
+    @classmethod
+    def build_projection(
+        cls, context: XmlContext, clazz: Type, fields: Iterable[str]
+    ) -> Dict[str, Optional[Dict]]:
+        """
+        Convert the dot separated field paths to a tree of field names.
+
+        The tree maps the field names of each class to the projection
+        of their nested class, or None to bind the whole field.
+
+        Example::
+
+            >>> ParserUtils.build_projection(context, Books, ["book.title"])
+            {'book': {'title': None}}
+
+        :param context: Model context provider
+        :param clazz: The root class type
+        :param fields: The dot separated field names
+        :raises ParserError: If a field is unknown or the path goes
+            through a field with no single class type.
+        """
+        result: Dict[str, Optional[Dict]] = {}
+        for path in fields:
+            meta = context.build(clazz)
+            projection = result
+            names = path.split(".")
+            for index, name in enumerate(names, start=1):
+                var = next((x for x in meta.get_all_vars() if x.name == name), None)
+                if var is None:
+                    raise ParserError(f"Unknown field: {clazz.__qualname__}.{path}")
+
+                if index == len(names):
+                    projection[name] = None
+                    break
+
+                if var.clazz is None or var.is_clazz_union:
+                    raise ParserError(
+                        f"Unsupported field path: {clazz.__qualname__}.{path}"
+                    )
+
+                nested = projection.setdefault(name, {})
+                if nested is None:
+                    break
+
+                projection = nested
+                meta = context.fetch(var.clazz, meta.namespace)
+
+        return result
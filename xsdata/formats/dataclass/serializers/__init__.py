@@ -1,5 +1,13 @@
+from xsdata.formats.dataclass.serializers.aio import AsyncJsonSerializer
+from xsdata.formats.dataclass.serializers.aio import AsyncXmlSerializer
 from xsdata.formats.dataclass.serializers.json import DictFactory
 from xsdata.formats.dataclass.serializers.json import JsonSerializer
 from xsdata.formats.dataclass.serializers.xml import XmlSerializer
 
-__all__ = ["JsonSerializer", "DictFactory", "XmlSerializer"]
+__all__ = [
+    "AsyncJsonSerializer",
+    "AsyncXmlSerializer",
+    "JsonSerializer",
+    "DictFactory",
+    "XmlSerializer",
+]
@@ -0,0 +1,196 @@
+import asyncio
+import codecs
+import copy
+import inspect
+import itertools
+import json
+from dataclasses import dataclass
+from dataclasses import field
+from io import StringIO
+from typing import Any
+from typing import Callable
+from typing import Dict
+from typing import List
+from typing import Optional
+from typing import Type
+
+from xsdata.exceptions import SerializerError
+from xsdata.formats.dataclass.context import XmlContext
+from xsdata.formats.dataclass.serializers.config import SerializerConfig
+from xsdata.formats.dataclass.serializers.json import JsonSerializer
+from xsdata.formats.dataclass.serializers.mixins import XmlWriter
+from xsdata.formats.dataclass.serializers.writers import XmlEventWriter
+from xsdata.formats.dataclass.serializers.xml import XmlSerializer
+from xsdata.utils import namespaces
+
+CHUNK_SIZE = 16384
+FLUSH_INTERVAL = 100
+BATCH_SIZE = 256
+
+
+@dataclass
+class AsyncXmlSerializer:
+    """
+    Asyncio xml serializer for dataclasses.
+
+    The serializer events are fed to the writer in batches, every time
+    the output reaches the ``chunk_size`` after a batch it's encoded and
+    sent to the async output, the serializer waits for the output to
+    drain and yields control to the event loop before it continues.
+
+    The writer buffers are flushed every ``flush_interval`` closed
+    elements, 100 if omitted. The default writer is the
+    :class:`~xsdata.formats.dataclass.serializers.writers.XmlEventWriter`,
+    the writers that build the whole document in memory, like the
+    :class:`~xsdata.formats.dataclass.serializers.writers.LxmlEventWriter`,
+    produce their output at the end of the document. The compiled
+    functions can't be suspended, the ``compiled`` config is not
+    supported.
+
+    :param config: Serializer configuration
+    :param context: Model context provider
+    :param writer: Override default XmlWriter
+    :param chunk_size: The output size to buffer before sending a chunk
+    :param batch_size: The number of events to feed the writer at once
+    """
+
+    config: SerializerConfig = field(default_factory=SerializerConfig)
+    context: XmlContext = field(default_factory=XmlContext)
+    writer: Type[XmlWriter] = field(default=XmlEventWriter)
+    chunk_size: int = field(default=CHUNK_SIZE)
+    batch_size: int = field(default=BATCH_SIZE)
+
+    async def write(self, out: Any, obj: Any, ns_map: Optional[Dict] = None):
+        """
+        Write the given object tree to the async output.
+
+        The output is encoded with the configuration encoding, the
+        characters that can't be encoded are replaced with character
+        references.
+
+        Example::
+
+            reader, writer = await asyncio.open_connection(host, port)
+            await serializer.write(writer, books)
+
+        :param out: An object with a ``write(data)`` method, either
+            async or with an async ``drain()`` method like the
+            :class:`asyncio.StreamWriter`
+        :param obj: The input dataclass instance
+        :param ns_map: User defined namespace prefix-URI map
+        :raises SerializerError: If the compiled config is enabled
+        """
+        if self.config.compiled:
+            raise SerializerError(
+                "The compiled config is not supported by the async serializer"
+            )
+
+        config = copy.copy(self.config)
+        if config.flush_interval is None:
+            config.flush_interval = FLUSH_INTERVAL
+
+        serializer = XmlSerializer(config=config, context=self.context)
+        output = StringIO()
+        encoder = codecs.getincrementalencoder(self.config.encoding)(
+            "xmlcharrefreplace"
+        )
+        handler = self.writer(
+            config=config,
+            output=output,
+            ns_map=namespaces.clean_prefixes(ns_map) if ns_map else {},
+        )
+
+        handler.start_document()
+        events = serializer.write_object(obj)
+        while True:
+            batch = list(itertools.islice(events, self.batch_size))
+            if not batch:
+                break
+
+            handler.consume(batch)
+            if output.tell() >= self.chunk_size:
+                await write_chunk(out, encoder.encode(pop_value(output)))
+
+        handler.end_document()
+        await write_chunk(out, encoder.encode(pop_value(output), True))
+
+
+@dataclass
+class AsyncJsonSerializer:
+    """
+    Asyncio json serializer for dataclasses.
+
+    The object tree is converted to a dictionary and the json output
+    is encoded incrementally, every time the output reaches the
+    ``chunk_size`` it's sent to the async output, the serializer waits
+    for the output to drain and yields control to the event loop
+    before it continues.
+
+    :param config: Serializer configuration
+    :param context: Model context provider
+    :param dict_factory: Override default dict factory to add further logic
+    :param chunk_size: The output size to buffer before sending a chunk
+    """
+
+    config: SerializerConfig = field(default_factory=SerializerConfig)
+    context: XmlContext = field(default_factory=XmlContext)
+    dict_factory: Callable = field(default=dict)
+    chunk_size: int = field(default=CHUNK_SIZE)
+
+    async def write(self, out: Any, obj: Any):
+        """
+        Write the given object tree to the async output, encoded with the
+        configuration encoding.
+
+        :param out: An object with a ``write(data)`` method, either
+            async or with an async ``drain()`` method like the
+            :class:`asyncio.StreamWriter`
+        :param obj: The input dataclass instance
+        """
+        serializer = JsonSerializer(
+            config=self.config, context=self.context, dict_factory=self.dict_factory
+        )
+        indent = 2 if self.config.pretty_print else None
+        encoder = json.JSONEncoder(indent=indent)
+        encoding = self.config.encoding
+
+        size = 0
+        parts: List[str] = []
+        for part in encoder.iterencode(serializer.convert(obj)):
+            parts.append(part)
+            size += len(part)
+            if size >= self.chunk_size:
+                await write_chunk(out, "".join(parts).encode(encoding))
+                parts.clear()
+                size = 0
+
+        await write_chunk(out, "".join(parts).encode(encoding))
+
+
+async def write_chunk(out: Any, data: bytes):
+    """
+    Write the data to the async output, wait for the output to drain
+    and yield control to the event loop.
+
+    :param out: An object with a ``write(data)`` method, either async
+        or with an async ``drain()`` method
+    :param data: The encoded chunk
+    """
+    if data:
+        result = out.write(data)
+        if inspect.isawaitable(result):
+            await result
+
+        drain = getattr(out, "drain", None)
+        if drain is not None:
+            await drain()
+
+    await asyncio.sleep(0)
+
+
+def pop_value(output: StringIO) -> str:
+    """Return and clear the text buffer contents."""
+    value = output.getvalue()
+    output.seek(0)
+    output.truncate()
+    return value
@@ -0,0 +1,234 @@
+import keyword
+from typing import Any
+from typing import Callable
+from typing import Dict
+from typing import List
+from xml.etree.ElementTree import QName
+
+from xsdata.formats.dataclass.models.elements import XmlMeta
+from xsdata.formats.dataclass.models.elements import XmlVar
+from xsdata.models.enums import QNames
+from xsdata.utils import collections
+from xsdata.utils.constants import EMPTY_MAP
+from xsdata.utils.namespaces import split_qname
+
+
+class SerializerCompiler:
+    """
+    Generate the source of a specialized function that writes the
+    instances of a model directly to an
+    :class:`~xsdata.formats.dataclass.serializers.mixins.XmlWriter`.
+
+    The attributes order, the converters, the nillable and default
+    checks and the child models dispatch are resolved once from the
+    binding metadata. The values the generated code can't handle, e.g.
+    mixed content, wildcards or derived elements, fall back to the
+    generic events of the
+    :class:`~xsdata.formats.dataclass.serializers.XmlSerializer`, the
+    output is identical either way.
+
+    :param context: The models context instance
+    :param meta: The model binding metadata
+    :ivar lines: The generated source lines
+    :ivar scope: The generated function globals
+    """
+
+    __slots__ = ("context", "meta", "lines", "scope")
+
+    def __init__(self, context: Any, meta: XmlMeta):
+        from xsdata.formats.dataclass.serializers.xml import XmlSerializer
+
+        self.context = context
+        self.meta = meta
+        self.lines: List[str] = []
+        self.scope: Dict[str, Any] = {
+            "encode": XmlSerializer.encode,
+            "is_array": collections.is_array,
+            "is_iterator": collections.is_iterator,
+            "split_qname": split_qname,
+            "QName": QName,
+            "EMPTY_MAP": EMPTY_MAP,
+            "XSI_TYPE": QNames.XSI_TYPE,
+            "XSI_NIL": QNames.XSI_NIL,
+            "compile": context.compile,
+            "compiler": compile_serializer,
+            "meta": meta,
+            "meta_qname": meta.qname,
+            "meta_namespace": split_qname(meta.qname)[0],
+        }
+
+    def compile(self) -> Callable:
+        """Generate, execute and return the specialized function."""
+        source = self.build()
+        name = f"<serialize {self.meta.clazz.__qualname__}>"
+        exec(compile(source, name, "exec"), self.scope)  # nosec
+        return self.scope["serialize"]
+
+    def build(self) -> str:
+        """Generate the source of the specialized function."""
+        self.lines = []
+        self.add(
+            0, "def serialize(serializer, writer, obj, qname, nillable, xsi_type):"
+        )
+        self.add(1, "if qname:")
+        self.add(2, "namespace = split_qname(qname)[0]")
+        self.add(1, "else:")
+        self.add(2, "qname = meta_qname")
+        self.add(2, "namespace = meta_namespace")
+
+        if self.meta.nillable:
+            self.add(1, "nillable = True")
+
+        self.add(1, "writer.start_tag(qname)")
+
+        attribute_vars = self.meta.get_attribute_vars()
+        if any(var.is_attribute for var in attribute_vars):
+            self.add(
+                1, "ignore_optionals = serializer.config.ignore_default_attributes"
+            )
+
+        for var in attribute_vars:
+            self.build_attribute(var)
+
+        self.add(1, "if xsi_type:")
+        self.add(2, "writer.add_attribute(XSI_TYPE, QName(xsi_type))")
+        self.add(1, "if nillable:")
+        self.add(2, 'writer.add_attribute(XSI_NIL, "true")')
+
+        element_vars = self.meta.get_element_vars()
+        if any(var.sequential for var in element_vars):
+            self.add(1, "for var, value in serializer.next_value(obj, meta):")
+            self.add(2, "writer.consume(serializer.write_value(value, var, namespace))")
+        else:
+            for var in element_vars:
+                self.build_element(var)
+
+        self.add(1, "writer.end_tag(qname)")
+        return "\n".join(self.lines)
+
+    def build_attribute(self, var: XmlVar):
+        """Generate the code that writes an attribute or the wildcard
+        attributes var."""
+        name = self.bind(var)
+        if var.is_attributes:
+            self.add(1, f"for key, value in {self.getter(var, 'EMPTY_MAP')}.items():")
+            self.add(2, "writer.add_attribute(key, value)")
+        else:
+            self.add(1, f"value = {self.getter(var)}")
+            if var.tokens or var.list_element:
+                self.add(1, "if is_iterator(value):")
+                self.add(2, "value = list(value)")
+            self.add(
+                1,
+                "if value is not None "
+                "and not (is_array(value) and not value) "
+                f"and not (ignore_optionals and {name}.is_optional(value)):",
+            )
+            self.add(2, f"writer.add_attribute({name}.qname, {self.encode(var)})")
+
+    def build_element(self, var: XmlVar):
+        """
+        Generate the code that writes an element var value.
+
+        The checks follow the same order with the generic
+        :meth:`~xsdata.formats.dataclass.serializers.XmlSerializer.write_value`.
+        """
+        self.add(1, f"value = {self.getter(var)}")
+        if var.nillable:
+            level = 1
+        else:
+            level = 2
+            self.add(1, "if value is not None:")
+
+        if (
+            var.mixed
+            or var.tokens
+            or var.is_elements
+            or not (var.is_text or self.is_simple(var))
+        ):
+            self.add_fallback(level, var, "value")
+        elif var.is_text:
+            self.add(level, f"writer.set_data({self.encode(var)})")
+        elif var.list_element:
+            self.add(level, "if is_array(value) or is_iterator(value):")
+            self.add(level + 1, "for item in value:")
+            self.build_single(level + 2, var, "item")
+            self.add(level, "else:")
+            self.build_single(level + 1, var, "value")
+        else:
+            self.build_single(level, var, "value")
+
+    def build_single(self, level: int, var: XmlVar, value: str):
+        """Generate the code that writes a single element value if its type
+        matches exactly the var types."""
+        name = self.bind(var)
+        if var.clazz:
+            self.add(level, f"if {value}.__class__ is {name}.clazz:")
+            self.add(
+                level + 1,
+                f"compile({name}.clazz, compiler, namespace)"
+                f"(serializer, writer, {value}, {name}.qname, {var.nillable}, None)",
+            )
+        else:
+            types = f"{name}_types"
+            self.scope[types] = frozenset(var.types)
+            self.add(level, f"if {value}.__class__ in {types}:")
+            self.add(level + 1, f"writer.start_tag({name}.qname)")
+            if var.nillable:
+                self.add(level + 1, 'writer.add_attribute(XSI_NIL, "true")')
+            self.add(level + 1, f"writer.set_data({self.encode(var, value)})")
+            self.add(level + 1, f"writer.end_tag({name}.qname)")
+
+        self.add(level, "else:")
+        self.add_fallback(level + 1, var, value)
+
+    def add_fallback(self, level: int, var: XmlVar, value: str):
+        """Generate the code that writes the value with the generic
+        serializer events."""
+        name = self.bind(var)
+        self.add(
+            level,
+            f"writer.consume(serializer.write_value({value}, {name}, namespace))",
+        )
+
+    def add(self, level: int, line: str):
+        self.lines.append("    " * level + line)
+
+    def bind(self, var: XmlVar) -> str:
+        """Add the given var to the function globals and return its name."""
+        name = f"var_{var.index}"
+        self.scope[name] = var
+        return name
+
+    @classmethod
+    def getter(cls, var: XmlVar, default: str = "") -> str:
+        """Return the expression that reads the var value from the object."""
+        if default:
+            return f"getattr(obj, {var.name!r}, {default})"
+
+        if var.name.isidentifier() and not keyword.iskeyword(var.name):
+            return f"obj.{var.name}"
+
+        return f"getattr(obj, {var.name!r})"
+
+    def encode(self, var: XmlVar, value: str = "value") -> str:
+        """Return the expression that encodes the value, strings are
+        returned as they are without any function call."""
+        name = self.bind(var)
+        return f"({value} if {value}.__class__ is str else encode({value}, {name}))"
+
+    @classmethod
+    def is_simple(cls, var: XmlVar) -> bool:
+        """Return whether the element values can be written without the
+        generic runtime type checks."""
+        return var.is_element and not (var.any_type or var.lazy)
+
+
+def compile_serializer(context: Any, meta: XmlMeta) -> Callable:
+    """
+    Compile the specialized serialize function of the given model.
+
+    :param context: The models context instance
+    :param meta: The model binding metadata
+    """
+    return SerializerCompiler(context, meta).compile()
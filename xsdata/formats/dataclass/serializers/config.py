@@ -16,6 +16,10 @@ class SerializerConfig:
     :param schema_location: xsi:schemaLocation attribute value
     :param no_namespace_schema_location: xsi:noNamespaceSchemaLocation
         attribute value
+    :param compiled: Write the models with specialized functions compiled
+        once per class
+    :param flush_interval: Flush the output stream every given number of
+        closed elements, disabled if omitted
     """
 
     __slots__ = (
@@ -26,6 +30,8 @@ class SerializerConfig:
         "ignore_default_attributes",
         "schema_location",
         "no_namespace_schema_location",
+        "compiled",
+        "flush_interval",
     )
 
     def __init__(
@@ -37,6 +43,8 @@ class SerializerConfig:
         ignore_default_attributes: bool = False,
         schema_location: Optional[str] = None,
         no_namespace_schema_location: Optional[str] = None,
+        compiled: bool = False,
+        flush_interval: Optional[int] = None,
     ):
         self.encoding = encoding
         self.xml_version = xml_version
@@ -45,3 +53,5 @@ class SerializerConfig:
         self.ignore_default_attributes = ignore_default_attributes
         self.schema_location = schema_location
         self.no_namespace_schema_location = no_namespace_schema_location
+        self.compiled = compiled
+        self.flush_interval = flush_interval
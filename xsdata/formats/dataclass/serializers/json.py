@@ -16,6 +16,7 @@ from xsdata.formats.bindings import AbstractSerializer
 from xsdata.formats.converter import converter
 from xsdata.formats.dataclass.context import XmlContext
 from xsdata.formats.dataclass.models.elements import XmlVar
+from xsdata.formats.dataclass.models.generics import LazyElement
 from xsdata.formats.dataclass.serializers.config import SerializerConfig
 from xsdata.utils import collections
 
@@ -75,6 +76,9 @@ class JsonSerializer(AbstractSerializer):
         self.dump_factory(self.convert(obj), out, indent=indent)
 
     def convert(self, obj: Any, var: Optional[XmlVar] = None) -> Any:
+        if isinstance(obj, LazyElement):
+            obj = obj.lazy_value()
+
         if var is None or self.context.class_type.is_model(obj):
 
             if collections.is_array(obj):
@@ -2,6 +2,7 @@ import abc
 from typing import Any
 from typing import Dict
 from typing import Generator
+from typing import Iterable
 from typing import List
 from typing import Optional
 from typing import TextIO
@@ -57,6 +58,7 @@ class XmlWriter(abc.ABC):
         "ns_context",
         "pending_tag",
         "pending_prefixes",
+        "closed",
     )
 
     def __init__(
@@ -75,6 +77,7 @@ class XmlWriter(abc.ABC):
         self.ns_context: List[Dict] = []
         self.pending_tag: Optional[Tuple] = None
         self.pending_prefixes: List[List] = []
+        self.closed = 0
         self.handler: ContentHandler
 
     def write(self, events: Generator):
@@ -92,6 +95,42 @@ class XmlWriter(abc.ABC):
         :param events: Events generator
         """
         self.start_document()
+        self.consume(events)
+        self.end_document()
+
+    def consume(self, events: Iterable):
+        """
+        Dispatch the given events to the notification receivers.
+
+        :param events: Events iterable
+        """
+        start_tag = self.start_tag
+        end_tag = self.end_tag
+        add_attribute = self.add_attribute
+        set_data = self.set_data
+
+        for event, *args in events:
+            if event == XmlWriterEvent.START:
+                start_tag(*args)
+            elif event == XmlWriterEvent.END:
+                end_tag(*args)
+            elif event == XmlWriterEvent.ATTR:
+                add_attribute(*args)
+            elif event == XmlWriterEvent.DATA:
+                set_data(*args)
+            else:
+                raise XmlWriterError(f"Unhandled event: `{event}`")
+
+    def start_document(self):
+        """
+        Start document notification receiver.
+
+        Write the xml declaration and queue the schema location
+        attributes for the root element.
+        """
+        if self.config.xml_declaration:
+            self.output.write(f'<?xml version="{self.config.xml_version}"')
+            self.output.write(f' encoding="{self.config.encoding}"?>\n')
 
         if self.config.schema_location:
             self.add_attribute(
@@ -107,27 +146,11 @@ class XmlWriter(abc.ABC):
                 check_pending=False,
             )
 
-        for event, *args in events:
-            if event == XmlWriterEvent.START:
-                self.start_tag(*args)
-            elif event == XmlWriterEvent.END:
-                self.end_tag(*args)
-            elif event == XmlWriterEvent.ATTR:
-                self.add_attribute(*args)
-            elif event == XmlWriterEvent.DATA:
-                self.set_data(*args)
-            else:
-                raise XmlWriterError(f"Unhandled event: `{event}`")
-
+    def end_document(self):
+        """End document notification receiver."""
         self.handler.endDocument()
 
-    def start_document(self):
-        """Start document notification receiver."""
-        if self.config.xml_declaration:
-            self.output.write(f'<?xml version="{self.config.xml_version}"')
-            self.output.write(f' encoding="{self.config.encoding}"?>\n')
-
-    def start_tag(self, qname: str):
+    def start_tag(self, qname: str, ns_map: Optional[Dict] = None):
         """
         Start tag notification receiver.
 
@@ -136,11 +159,15 @@ class XmlWriter(abc.ABC):
         for generation.
 
         :param qname: Tag qualified name
+        :param ns_map: The prefix-URI declarations to keep for the
+            element, e.g. the recorded prefixes of a lazy element
         """
         self.flush_start(False)
 
         self.ns_context.append(self.ns_map.copy())
         self.ns_map = self.ns_context[-1]
+        if ns_map:
+            self.ns_map.update(ns_map)
 
         self.pending_tag = split_qname(qname)
         self.add_namespace(self.pending_tag[0])
@@ -230,6 +257,21 @@ class XmlWriter(abc.ABC):
         for prefix in self.pending_prefixes.pop():
             self.handler.endPrefixMapping(prefix)
 
+        if self.config.flush_interval:
+            self.count_closed()
+
+    def count_closed(self):
+        """Count the closed elements and flush the output every
+        configured interval."""
+        self.closed += 1
+        if self.closed >= self.config.flush_interval:
+            self.closed = 0
+            self.flush()
+
+    def flush(self):
+        """Write any buffered content and flush the output stream."""
+        self.output.flush()
+
     def flush_start(self, is_nil: bool = True):
         """
         Flush start notification receiver.
@@ -1,10 +1,12 @@
 from typing import Type
 
 from xsdata.formats.dataclass.serializers.mixins import XmlWriter
+from xsdata.formats.dataclass.serializers.writers.direct import XmlDirectWriter
 from xsdata.formats.dataclass.serializers.writers.native import XmlEventWriter
 
 try:
     from xsdata.formats.dataclass.serializers.writers.lxml import LxmlEventWriter
+    from xsdata.formats.dataclass.serializers.writers.lxml import LxmlStreamWriter
 
     def default_writer() -> Type[XmlWriter]:
         return LxmlEventWriter
@@ -16,4 +18,10 @@ except ImportError:  # pragma: no cover
         return XmlEventWriter
 
 
-__all__ = ["LxmlEventWriter", "XmlEventWriter", "default_writer"]
+__all__ = [
+    "LxmlEventWriter",
+    "LxmlStreamWriter",
+    "XmlDirectWriter",
+    "XmlEventWriter",
+    "default_writer",
+]
@@ -0,0 +1,260 @@
+from typing import Dict
+from typing import List
+from typing import Optional
+from typing import TextIO
+from typing import Tuple
+
+from xsdata.formats.dataclass.serializers.config import SerializerConfig
+from xsdata.formats.dataclass.serializers.mixins import XmlWriter
+from xsdata.formats.dataclass.serializers.mixins import XSI_NIL
+from xsdata.models.enums import Namespace
+from xsdata.utils.constants import EMPTY_MAP
+from xsdata.utils.namespaces import generate_prefix
+from xsdata.utils.namespaces import prefix_exists
+from xsdata.utils.namespaces import split_qname
+
+BUFFER_SIZE = 8192
+
+
+class XmlDirectWriter(XmlWriter):
+    """
+    :class:`~xsdata.formats.dataclass.serializers.mixins.XmlWriter`
+    implementation without any sax content handler.
+
+    Escapes and appends the xml output directly to a list of strings
+    which is written to the output stream whenever it grows too large
+    and at the end of the document.
+    The qualified tag names are built once per namespace prefix, the
+    namespaces and prefixes semantics are identical to the
+    :class:`~xsdata.formats.dataclass.serializers.writers.XmlEventWriter`.
+
+    :param config: Configuration instance
+    :param output: Output text stream
+    :param ns_map: User defined namespace prefix-URI map
+    """
+
+    __slots__ = (
+        "parts",
+        "tags",
+        "names",
+        "prefixes",
+        "prefixes_context",
+        "pending_start",
+        "current_level",
+        "pending_end_element",
+    )
+
+    def __init__(self, config: SerializerConfig, output: TextIO, ns_map: Dict):
+        super().__init__(config, output, ns_map)
+
+        self.parts: List[str] = []
+        self.tags: Dict[Tuple, str] = {}
+        self.names: List[str] = []
+        self.prefixes: Dict[str, Optional[str]] = {}
+        self.prefixes_context: List[Dict] = []
+        self.pending_start = False
+        self.current_level = 0
+        self.pending_end_element = False
+
+    def start_tag(self, qname: str, ns_map: Optional[Dict] = None):
+        if self.pending_tag:
+            self.flush_start(False)
+
+        ns_map = {**self.ns_map, **ns_map} if ns_map else self.ns_map.copy()
+        self.ns_context.append(ns_map)
+        self.ns_map = ns_map
+
+        self.pending_tag = split_qname(qname)
+        uri = self.pending_tag[0]
+        if uri and not prefix_exists(uri, ns_map):
+            generate_prefix(uri, ns_map)
+
+        if self.config.pretty_print:
+            if self.current_level:
+                self.whitespace("\n" + "  " * self.current_level)
+
+            self.current_level += 1
+            self.pending_end_element = False
+
+    def set_data(self, data: object):
+        value = (
+            data if data is None or isinstance(data, str) else self.encode_data(data)
+        )
+        if self.pending_tag:
+            self.flush_start(is_nil=value is None)
+
+        if value:
+            if self.in_tail:
+                self.tail = value
+            else:
+                if self.pending_start:
+                    self.parts.append(">")
+                    self.pending_start = False
+
+                self.parts.append(escape(value))
+
+        self.in_tail = True
+
+    def end_tag(self, qname: str):
+        if self.pending_tag:
+            self.flush_start(True)
+
+        pretty_print = self.config.pretty_print
+        if pretty_print:
+            self.current_level -= 1
+            if self.pending_end_element:
+                self.whitespace("\n" + "  " * self.current_level)
+
+        name = self.names.pop()
+        if self.pending_start:
+            self.parts.append("/>")
+            self.pending_start = False
+        else:
+            self.parts.append(f"</{name}>")
+
+        if self.tail:
+            self.characters(self.tail)
+
+        self.tail = None
+        self.in_tail = False
+        self.ns_context.pop()
+        if self.ns_context:
+            self.ns_map = self.ns_context[-1]
+
+        self.prefixes = self.prefixes_context.pop()
+
+        if pretty_print:
+            self.pending_end_element = True
+            if not self.current_level:
+                self.whitespace("\n")
+
+        if self.config.flush_interval:
+            self.count_closed()
+        elif len(self.parts) > BUFFER_SIZE:
+            self.output.write("".join(self.parts))
+            self.parts.clear()
+
+    def flush_start(self, is_nil: bool = True):
+        if not self.pending_tag:
+            return
+
+        attrs = self.attrs
+        if not is_nil:
+            attrs.pop(XSI_NIL, None)
+
+        for name in attrs.keys():
+            self.add_namespace(name[0])
+
+        self.reset_default_namespace()
+
+        ns_map = self.ns_map
+        parent_ns_map = self.ns_context[-2] if len(self.ns_context) > 1 else EMPTY_MAP
+        if ns_map == parent_ns_map:
+            declarations = []
+        else:
+            declarations = [
+                (prefix, uri)
+                for prefix, uri in ns_map.items()
+                if parent_ns_map.get(prefix) != uri
+            ]
+
+        self.prefixes_context.append(self.prefixes)
+        if declarations:
+            self.prefixes = self.prefixes.copy()
+            for prefix, uri in declarations:
+                self.prefixes[uri] = prefix
+
+        write = self.parts.append
+        if self.pending_start:
+            write(">")
+
+        name = self.build_name(self.pending_tag)
+        self.names.append(name)
+        write(f"<{name}")
+
+        for prefix, uri in declarations:
+            write(f' xmlns:{prefix}="{uri}"' if prefix else f' xmlns="{uri}"')
+
+        for key, value in attrs.items():
+            write(f" {self.build_name(key)}={quote_attribute(value)}")
+
+        self.pending_start = True
+        self.attrs = {}
+        self.in_tail = False
+        self.pending_tag = None
+
+    def end_document(self):
+        self.output.write("".join(self.parts))
+        self.parts.clear()
+
+    def flush(self):
+        self.output.write("".join(self.parts))
+        self.parts.clear()
+        super().flush()
+
+    def characters(self, content: str):
+        """Escape and append text content, close the pending start tag."""
+        if self.pending_start:
+            self.parts.append(">")
+            self.pending_start = False
+
+        self.parts.append(escape(content))
+
+    def whitespace(self, content: str):
+        """Append ignorable whitespace, close the pending start tag."""
+        if self.pending_start:
+            self.parts.append(">")
+            self.pending_start = False
+
+        self.parts.append(content)
+
+    def build_name(self, qname: Tuple) -> str:
+        """
+        Return the prefixed name of the given namespace, local name tuple
+        in the current prefixes context.
+
+        :param qname: The namespace, local name tuple
+        """
+        uri, local_name = qname
+        if not uri:
+            return local_name
+
+        if uri == Namespace.XML.uri:
+            prefix: Optional[str] = Namespace.XML.prefix
+        else:
+            prefix = self.prefixes[uri]
+
+        key = (prefix, local_name)
+        name = self.tags.get(key)
+        if name is None:
+            name = f"{prefix}:{local_name}" if prefix else local_name
+            self.tags[key] = name
+
+        return name
+
+
+def escape(data: str) -> str:
+    """Escape &, < and > in the given text content."""
+    if "&" in data:
+        data = data.replace("&", "&amp;")
+    if ">" in data:
+        data = data.replace(">", "&gt;")
+    if "<" in data:
+        data = data.replace("<", "&lt;")
+    return data
+
+
+def quote_attribute(data: str) -> str:
+    """Escape and quote the given attribute value, same as
+    :func:`xml.sax.saxutils.quoteattr`."""
+    data = escape(data)
+    if "\n" in data or "\r" in data or "\t" in data:
+        data = data.replace("\n", "&#10;").replace("\r", "&#13;").replace("\t", "&#9;")
+
+    if '"' not in data:
+        return f'"{data}"'
+
+    if "'" not in data:
+        return f"'{data}'"
+
+    return '"{}"'.format(data.replace('"', "&quot;"))
@@ -1,12 +1,19 @@
+import codecs
+from typing import Any
 from typing import Dict
-from typing import Generator
+from typing import List
+from typing import Optional
 from typing import TextIO
+from typing import Tuple
+from xml.sax.handler import ContentHandler
 
 from lxml.etree import tostring
+from lxml.etree import xmlfile
 from lxml.sax import ElementTreeContentHandler
 
 from xsdata.formats.dataclass.serializers.config import SerializerConfig
 from xsdata.formats.dataclass.serializers.mixins import XmlWriter
+from xsdata.formats.dataclass.serializers.writers.native import XmlEventWriter
 
 
 class LxmlEventWriter(XmlWriter):
@@ -32,8 +39,8 @@ class LxmlEventWriter(XmlWriter):
 
         self.handler = ElementTreeContentHandler()
 
-    def write(self, events: Generator):
-        super().write(events)
+    def end_document(self):
+        super().end_document()
 
         assert isinstance(self.handler, ElementTreeContentHandler)
 
@@ -42,6 +49,126 @@ class LxmlEventWriter(XmlWriter):
             encoding=self.config.encoding,
             pretty_print=self.config.pretty_print,
             xml_declaration=False,
-        ).decode()
+        ).decode(self.config.encoding)
 
         self.output.write(xml)
+
+
+class LxmlStreamWriter(XmlEventWriter):
+    """
+    :class:`~xsdata.formats.dataclass.serializers.mixins.XmlWriter`
+    implementation based on lxml incremental serialization.
+
+    Based on the :class:`lxml.etree.xmlfile`, converts sax events
+    directly to xml output without building an lxml ElementTree. The
+    escaping and the encoding of the output is handled by lxml and the
+    indentation follows the
+    :class:`~xsdata.formats.dataclass.serializers.writers.XmlEventWriter`.
+
+    The output is equivalent but not identical to the other writers,
+    lxml can't write self-closing tags incrementally and sorts the
+    namespace declarations of each element by prefix.
+
+    :param config: Configuration instance
+    :param output: Output text stream
+    :param ns_map: User defined namespace prefix-URI map
+    """
+
+    __slots__ = ()
+
+    def __init__(self, config: SerializerConfig, output: TextIO, ns_map: Dict):
+        super().__init__(config, output, ns_map)
+
+        self.handler = XmlFileContentHandler(self.output, self.config.encoding)
+
+    def start_document(self):
+        super().start_document()
+        self.handler.startDocument()
+
+    def flush(self):
+        assert isinstance(self.handler, XmlFileContentHandler)
+
+        self.handler.flush()
+        super().flush()
+
+
+class XmlFileContentHandler(ContentHandler):
+    """
+    Sax content handler that writes the events incrementally with
+    :class:`lxml.etree.xmlfile`.
+
+    The encoded output of lxml is decoded back and written to the text
+    output stream. The content after the root element, e.g. the final
+    new line, is written when the document ends.
+
+    :param output: Output text stream
+    :param encoding: Output text encoding
+    """
+
+    def __init__(self, output: TextIO, encoding: str):
+        super().__init__()
+        self.output = output
+        self.encoding = encoding
+        self.decoder = codecs.getincrementaldecoder(encoding)()
+        self.stream: Optional[xmlfile] = None
+        self.writer: Any = None
+        self.elements: List[Any] = []
+        self.nsmap: Dict = {}
+        self.tail: List[str] = []
+        self.names: Dict[Tuple, str] = {}
+
+    def write(self, data: bytes):
+        """Decode and write the lxml output to the text output stream."""
+        self.output.write(self.decoder.decode(data))
+
+    def flush(self):
+        """Write the lxml output buffer to the text output stream."""
+        if self.writer is not None:
+            self.writer.flush()
+
+    def startDocument(self):
+        self.stream = xmlfile(self, encoding=self.encoding)
+        self.writer = self.stream.__enter__()
+
+    def endDocument(self):
+        assert self.stream is not None
+
+        self.stream.__exit__(None, None, None)
+        self.stream = self.writer = None
+        self.output.write(self.decoder.decode(b"", True))
+        self.output.write("".join(self.tail))
+        self.tail.clear()
+
+    def startPrefixMapping(self, prefix: Optional[str], uri: str):
+        self.nsmap[prefix] = uri
+
+    def startElementNS(self, name: Tuple, qname: Any, attrs: Any):
+        clark = self.clark
+        attrib = {clark(key): value for key, value in attrs.items()} if attrs else None
+        element = self.writer.element(clark(name), attrib, self.nsmap)
+        element.__enter__()
+
+        self.elements.append(element)
+        self.nsmap = {}
+
+    def endElementNS(self, name: Tuple, qname: Any):
+        self.elements.pop().__exit__(None, None, None)
+
+    def characters(self, content: str):
+        if self.elements:
+            self.writer.write(content)
+        else:
+            self.tail.append(content)
+
+    def ignorableWhitespace(self, whitespace: str):
+        self.characters(whitespace)
+
+    def clark(self, name: Tuple) -> str:
+        """Convert a namespace, name tuple to the clark notation."""
+        result = self.names.get(name)
+        if result is None:
+            namespace, local_name = name
+            result = f"{{{namespace}}}{local_name}" if namespace else local_name
+            self.names[name] = result
+
+        return result
@@ -1,4 +1,5 @@
 from typing import Dict
+from typing import Optional
 from typing import TextIO
 from xml.sax.saxutils import XMLGenerator
 
@@ -36,8 +37,8 @@ class XmlEventWriter(XmlWriter):
             out=self.output, encoding=self.config.encoding, short_empty_elements=True
         )
 
-    def start_tag(self, qname: str):
-        super().start_tag(qname)
+    def start_tag(self, qname: str, ns_map: Optional[Dict] = None):
+        super().start_tag(qname, ns_map)
 
         if self.config.pretty_print:
             if self.current_level:
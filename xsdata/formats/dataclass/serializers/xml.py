@@ -1,10 +1,16 @@
 from dataclasses import dataclass
 from dataclasses import field
 from enum import Enum
+from io import BufferedIOBase
+from io import BytesIO
+from io import RawIOBase
 from io import StringIO
+from io import TextIOWrapper
 from typing import Any
+from typing import cast
 from typing import Dict
 from typing import Generator
+from typing import IO
 from typing import Iterable
 from typing import Iterator
 from typing import List
@@ -20,11 +26,14 @@ from xsdata.formats.converter import converter
 from xsdata.formats.dataclass.context import XmlContext
 from xsdata.formats.dataclass.models.elements import XmlMeta
 from xsdata.formats.dataclass.models.elements import XmlVar
+from xsdata.formats.dataclass.models.generics import LazyElement
+from xsdata.formats.dataclass.serializers.compiler import compile_serializer
 from xsdata.formats.dataclass.serializers.config import SerializerConfig
 from xsdata.formats.dataclass.serializers.mixins import XmlWriter
 from xsdata.formats.dataclass.serializers.mixins import XmlWriterEvent
 from xsdata.formats.dataclass.serializers.writers import default_writer
 from xsdata.models.enums import DataType
+from xsdata.models.enums import EventType
 from xsdata.models.enums import QNames
 from xsdata.utils import collections
 from xsdata.utils import namespaces
@@ -58,21 +67,71 @@ class XmlSerializer(AbstractSerializer):
         self.write(output, obj, ns_map)
         return output.getvalue()
 
-    def write(self, out: TextIO, obj: Any, ns_map: Optional[Dict] = None):
+    def render_bytes(self, obj: Any, ns_map: Optional[Dict] = None) -> bytes:
         """
-        Write the given object tree to the output text stream.
+        Convert and return the given object tree as xml bytes encoded with
+        the configuration encoding.
 
-        :param out: The output stream
         :param obj: The input dataclass instance
         :param ns_map: User defined namespace prefix-URI map
         """
-        events = self.write_object(obj)
+        output = BytesIO()
+        self.write(output, obj, ns_map)
+        return output.getvalue()
+
+    def write(self, out: IO, obj: Any, ns_map: Optional[Dict] = None):
+        """
+        Write the given object tree to the output stream.
+
+        Binary streams are wrapped and encoded incrementally with the
+        configuration encoding, the characters that can't be encoded
+        are replaced with character references.
+
+        :param out: The output text or binary stream
+        :param obj: The input dataclass instance
+        :param ns_map: User defined namespace prefix-URI map
+        """
+        if isinstance(out, (RawIOBase, BufferedIOBase)):
+            wrapper = TextIOWrapper(
+                out,
+                encoding=self.config.encoding,
+                errors="xmlcharrefreplace",
+                newline="",
+            )
+            try:
+                self.write(wrapper, obj, ns_map)
+            finally:
+                wrapper.detach()
+
+            return
+
         handler = self.writer(
             config=self.config,
-            output=out,
+            output=cast(TextIO, out),
             ns_map=namespaces.clean_prefixes(ns_map) if ns_map else {},
         )
-        handler.write(events)
+
+        if self.config.compiled:
+            handler.start_document()
+            self.write_compiled(handler, obj)
+            handler.end_document()
+        else:
+            handler.write(self.write_object(obj))
+
+    def write_compiled(self, handler: XmlWriter, obj: Any):
+        """
+        Write the given object tree with the compiled serialize function
+        of its class, the derived elements are written with the generic
+        events stream.
+
+        :param handler: The xml writer instance
+        :param obj: The input dataclass instance
+        """
+        if isinstance(obj, self.context.class_type.derived_element):
+            handler.consume(self.write_object(obj))
+        else:
+            func = self.context.compile(obj.__class__, compile_serializer)
+            func(self, handler, obj, None, False, None)
 
     def write_object(self, obj: Any):
         """Produce an events stream from a dataclass or a derived element."""
@@ -145,7 +204,9 @@ class XmlSerializer(AbstractSerializer):
             yield from self.write_tokens(value, var, namespace)
         elif var.is_elements:
             yield from self.write_elements(value, var, namespace)
-        elif var.list_element and collections.is_array(value):
+        elif var.list_element and (
+            collections.is_array(value) or collections.is_iterator(value)
+        ):
             yield from self.write_list(value, var, namespace)
         else:
             yield from self.write_any_type(value, var, namespace)
@@ -160,6 +221,9 @@ class XmlSerializer(AbstractSerializer):
     def write_tokens(self, value: Any, var: XmlVar, namespace: NoneStr) -> Generator:
         """Produce an events stream for the given tokens list or list of tokens
         lists."""
+        if collections.is_iterator(value):
+            value = list(value)
+
         if value or var.nillable:
             if value and collections.is_array(value[0]):
                 for val in value:
@@ -182,7 +246,9 @@ class XmlSerializer(AbstractSerializer):
         The object can be a dataclass or a generic object or any other
         simple type.
         """
-        if isinstance(value, self.context.class_type.any_element):
+        if isinstance(value, LazyElement):
+            yield from self.write_lazy(value, var, namespace)
+        elif isinstance(value, self.context.class_type.any_element):
             yield from self.write_wildcard(value, var, namespace)
         elif isinstance(value, self.context.class_type.derived_element):
             yield from self.write_derived_element(value, namespace)
@@ -230,6 +296,54 @@ class XmlSerializer(AbstractSerializer):
         if value.tail:
             yield XmlWriterEvent.DATA, value.tail
 
+    def write_lazy(self, value: Any, var: XmlVar, namespace: NoneStr) -> Generator:
+        """
+        Produce an events stream for the given lazy field value.
+
+        If the value was never accessed the recorded parser events are
+        written back, otherwise the bound object is serialized.
+        """
+        if value.lazy_events is None:
+            yield from self.write_any_type(value.lazy_value(), var, namespace)
+        else:
+            yield from self.write_events(value.lazy_events)
+
+    @classmethod
+    def write_events(cls, events: List[Tuple]) -> Generator:
+        """
+        Produce an element events stream from the given recorded parser
+        events.
+
+        The attribute values, texts and tails are written as recorded,
+        with the namespace prefixes of every element, so the prefixed
+        values keep their meaning. The parser records the element text
+        with the end event, a first pass locates the text of every
+        start event.
+        """
+        texts: Dict[int, Any] = {}
+        starts: List[int] = []
+        for index, (event, *args) in enumerate(events):
+            if event == EventType.START:
+                starts.append(index)
+            else:
+                texts[starts.pop()] = args[1]
+
+        for index, (event, *args) in enumerate(events):
+            if event == EventType.START:
+                qname, attrs, ns_map = args
+                yield XmlWriterEvent.START, qname, ns_map
+
+                for key, value in attrs.items():
+                    yield XmlWriterEvent.ATTR, key, value
+
+                yield XmlWriterEvent.DATA, texts[index]
+            else:
+                qname, _, tail = args
+                yield XmlWriterEvent.END, qname
+
+                if tail:
+                    yield XmlWriterEvent.DATA, tail
+
     def xsi_type(self, var: XmlVar, value: Any, namespace: NoneStr) -> Optional[str]:
         """Get xsi:type if the given value is a derived instance."""
         if not value or value.__class__ in var.types:
@@ -246,7 +360,7 @@ class XmlSerializer(AbstractSerializer):
 
     def write_elements(self, value: Any, var: XmlVar, namespace: NoneStr) -> Generator:
         """Produce an events stream from compound elements field."""
-        if collections.is_array(value):
+        if collections.is_array(value) or collections.is_iterator(value):
             for choice in value:
                 yield from self.write_choice(choice, var, namespace)
         else:
@@ -329,22 +443,22 @@ class XmlSerializer(AbstractSerializer):
 
             indices = range(index + 1, stop)
             end = next((i for i in indices if not attrs[i].sequential), stop)
-            sequence = attrs[index:end]
+            sequence = [(var, iter(getattr(obj, var.name))) for var in attrs[index:end]]
             index = end
-            j = 0
 
-            rolling = True
-            while rolling:
-                rolling = False
-                for var in sequence:
-                    values = getattr(obj, var.name)
-                    if j < len(values):
-                        rolling = True
-                        value = values[j]
+            while sequence:
+                rolling = []
+                for var, values in sequence:
+                    try:
+                        value = next(values)
+                    except StopIteration:
+                        continue
 
-                        if value is not None or var.nillable:
-                            yield var, value
-                j += 1
+                    rolling.append((var, values))
+                    if value is not None or var.nillable:
+                        yield var, value
+
+                sequence = rolling
 
     @classmethod
     def next_attribute(
@@ -369,6 +483,9 @@ class XmlSerializer(AbstractSerializer):
         for var in meta.get_attribute_vars():
             if var.is_attribute:
                 value = getattr(obj, var.name)
+                if collections.is_iterator(value):
+                    value = list(value)
+
                 if (
                     value is None
                     or (collections.is_array(value) and not value)
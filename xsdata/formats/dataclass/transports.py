@@ -1,8 +1,17 @@
 import abc
+import asyncio
+import zlib
 from typing import Any
 from typing import Dict
+from typing import List
+from typing import Optional
+from typing import Tuple
+from typing import Union
+from urllib.parse import urlencode
+from urllib.parse import urlsplit
 
 import requests
+from requests.adapters import HTTPAdapter
 
 
 class Transport(abc.ABC):
@@ -14,35 +23,92 @@ class Transport(abc.ABC):
         """Send a GET request."""
 
     @abc.abstractmethod
-    def post(self, url: str, data: Any, headers: Dict) -> bytes:
-        """Send a POST request."""
+    def post(self, url: str, data: Any, headers: Dict) -> Any:
+        """Send a POST request, return the content or a binary file-like
+        object."""
+
+    def close(self):  # noqa: B027
+        """
+        Release any open connections.
+
+        An optional hook, the transports without persistent connections
+        inherit this no-op.
+        """
 
 
 class DefaultTransport(Transport):
     """
-    Default transport based on the requests library.
+    Default transport based on a requests session.
+
+    The session keeps the connections open and reuses them for the next
+    requests, up to ``pool_size`` connections per host. The failed
+    connection attempts are retried up to ``retries`` times, the
+    requests that reached the server are never retried.
+
+    In stream mode the POST requests return the response body as a
+    binary file-like object instead of bytes, the content is read while
+    it downloads and the connection is returned to the pool when the
+    body is consumed or closed.
 
-    :param timeout: Read timeout
+    :param timeout: Read timeout or a (connect, read) timeout tuple
+    :param pool_size: The maximum number of connections per host
+    :param retries: The maximum number of connection retries
+    :param keep_alive: Reuse the connections, if disabled every request
+        asks the server to close its connection
+    :param stream: Return the POST response bodies as file-like objects
     """
 
-    __slots__ = "timeout"
+    __slots__ = ("timeout", "stream", "session")
 
-    def __init__(self, timeout: float = 2.0):
+    def __init__(
+        self,
+        timeout: Union[float, Tuple[float, float]] = 2.0,
+        pool_size: int = 10,
+        retries: int = 0,
+        keep_alive: bool = True,
+        stream: bool = False,
+    ):
         self.timeout = timeout
+        self.stream = stream
+        self.session = requests.Session()
+
+        adapter = HTTPAdapter(
+            pool_connections=pool_size, pool_maxsize=pool_size, max_retries=retries
+        )
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        if not keep_alive:
+            self.session.headers["Connection"] = "close"
 
     def get(self, url: str, params: Dict, headers: Dict) -> bytes:
         """
         :raises HTTPError: if status code is not valid for content unmarshalling.
         """
-        res = requests.get(url, params=params, headers=headers, timeout=self.timeout)
+        res = self.session.get(
+            url, params=params, headers=headers, timeout=self.timeout
+        )
         return self.handle_response(res)
 
     def post(self, url: str, data: Any, headers: Dict) -> Any:
         """
         :raises HTTPError: if status code is not valid for content unmarshalling.
         """
-        res = requests.post(url, data=data, headers=headers, timeout=self.timeout)
-        return self.handle_response(res)
+        res = self.session.post(
+            url, data=data, headers=headers, timeout=self.timeout, stream=self.stream
+        )
+        if not self.stream:
+            return self.handle_response(res)
+
+        if res.status_code not in (200, 500):
+            with res:
+                return self.handle_response(res)
+
+        res.raw.decode_content = True
+        return res.raw
+
+    def close(self):
+        """Close the session connections."""
+        self.session.close()
 
     @classmethod
     def handle_response(cls, response: requests.Response) -> bytes:
@@ -55,3 +121,299 @@ class DefaultTransport(Transport):
             response.raise_for_status()
 
         return response.content
+
+
+class AsyncTransport(abc.ABC):
+
+    __slots__ = ()
+
+    @abc.abstractmethod
+    async def get(self, url: str, params: Dict, headers: Dict) -> bytes:
+        """Send a GET request."""
+
+    @abc.abstractmethod
+    async def post(self, url: str, data: Any, headers: Dict) -> Any:
+        """Send a POST request and return the response content or a binary
+        file-like object."""
+
+    @abc.abstractmethod
+    async def close(self):
+        """Release any open connections."""
+
+
+class DefaultAsyncTransport(AsyncTransport):
+    """
+    Default asyncio transport based on HTTP/1.1 keep-alive connections.
+
+    The connections are pooled per scheme, host and port and they are
+    reused by the next requests. Every pool keeps up to ``pool_size``
+    open connections, the requests wait for a free connection when the
+    pool is exhausted. A request is sent again on a new connection only
+    if an idle connection was closed by the server before the response
+    status line, any other failure is raised, since the server might
+    have processed the request.
+
+    :param timeout: Request timeout, it starts once a pooled connection
+        is acquired
+    :param pool_size: The maximum number of connections per host
+    """
+
+    __slots__ = ("timeout", "pool_size", "pools")
+
+    def __init__(self, timeout: float = 2.0, pool_size: int = 10):
+        self.timeout = timeout
+        self.pool_size = pool_size
+        self.pools: Dict[Tuple, ConnectionPool] = {}
+
+    async def get(self, url: str, params: Dict, headers: Dict) -> bytes:
+        """
+        :raises HTTPError: if status code is not valid for content unmarshalling.
+        """
+        if params:
+            separator = "&" if "?" in url else "?"
+            url = f"{url}{separator}{urlencode(params)}"
+
+        return await self.request("GET", url, None, headers)
+
+    async def post(self, url: str, data: Any, headers: Dict) -> bytes:
+        """
+        :raises HTTPError: if status code is not valid for content unmarshalling.
+        """
+        return await self.request("POST", url, data, headers)
+
+    async def request(self, method: str, url: str, data: Any, headers: Dict) -> bytes:
+        """
+        Send the request through a pooled connection and return the
+        response content.
+
+        :raises HTTPError: if status code is not valid for content unmarshalling.
+        """
+        parts = urlsplit(url)
+        https = parts.scheme == "https"
+        port = parts.port or (443 if https else 80)
+        key = (parts.scheme, parts.hostname, port)
+        pool = self.pools.get(key)
+        if pool is None:
+            pool = ConnectionPool(parts.hostname, port, https, self.pool_size)
+            self.pools[key] = pool
+
+        target = parts.path or "/"
+        if parts.query:
+            target = f"{target}?{parts.query}"
+
+        if isinstance(data, str):
+            data = data.encode()
+
+        host = parts.hostname or ""
+        if ":" in host:
+            host = f"[{host}]"
+        if parts.port:
+            host = f"{host}:{parts.port}"
+
+        lines = [f"{method} {target} HTTP/1.1", f"Host: {host}"]
+        if data is not None:
+            lines.append(f"Content-Length: {len(data)}")
+
+        lines.extend(f"{name}: {value}" for name, value in headers.items())
+        request = "\r\n".join(lines).encode("latin-1") + b"\r\n\r\n"
+        if data:
+            request += data
+
+        status, reason, content = await pool.send(request, self.timeout)
+        return self.handle_response(url, status, reason, content)
+
+    async def close(self):
+        """Close the idle connections of all the pools."""
+        pools = list(self.pools.values())
+        self.pools.clear()
+        for pool in pools:
+            pool.close()
+
+    @classmethod
+    def handle_response(
+        cls, url: str, status: int, reason: str, content: bytes
+    ) -> bytes:
+        """
+        Status codes 200 or 500 means that we can unmarshall the response.
+
+        :raises HTTPError: If the response status code is an error other
+            than 500
+        """
+        if status not in (200, 500) and status >= 400:
+            kind = "Client" if status < 500 else "Server"
+            raise requests.HTTPError(f"{status} {kind} Error: {reason} for url: {url}")
+
+        return content
+
+
+class ConnectionClosedError(ConnectionResetError):
+    """The server closed the connection before the response status line,
+    e.g. an idle keep-alive connection that timed out."""
+
+
+class ConnectionPool:
+    """
+    The keep-alive connections of a single host.
+
+    :param host: The server host
+    :param port: The server port
+    :param ssl: Whether to use a secure connection
+    :param size: The maximum number of open connections
+    """
+
+    __slots__ = ("host", "port", "ssl", "idle", "semaphore")
+
+    def __init__(self, host: Optional[str], port: int, ssl: bool, size: int):
+        self.host = host
+        self.port = port
+        self.ssl = ssl
+        self.idle: List[Tuple[asyncio.StreamReader, asyncio.StreamWriter]] = []
+        self.semaphore = asyncio.Semaphore(size)
+
+    async def send(self, request: bytes, timeout: float) -> Tuple[int, str, bytes]:
+        """
+        Wait for a free connection and send the request within the given
+        timeout.
+
+        :param request: The encoded request head and body
+        :param timeout: The request timeout, excluding the pool wait
+        """
+        async with self.semaphore:
+            return await asyncio.wait_for(self.dispatch(request), timeout)
+
+    async def dispatch(self, request: bytes) -> Tuple[int, str, bytes]:
+        """
+        Send the request through an idle or a new connection and return
+        the response status, reason and content.
+
+        :param request: The encoded request head and body
+        """
+        while self.idle:
+            reader, writer = self.idle.pop()
+            if reader.at_eof():
+                writer.close()
+                continue
+
+            try:
+                return await self.exchange(reader, writer, request)
+            except ConnectionClosedError:
+                break
+
+        reader, writer = await asyncio.open_connection(
+            self.host, self.port, ssl=self.ssl or None
+        )
+        return await self.exchange(reader, writer, request)
+
+    async def exchange(
+        self,
+        reader: asyncio.StreamReader,
+        writer: asyncio.StreamWriter,
+        request: bytes,
+    ) -> Tuple[int, str, bytes]:
+        """
+        Write the request, read the response and return the connection to
+        the idle list if it can be reused.
+
+        :param reader: The connection stream reader
+        :param writer: The connection stream writer
+        :param request: The encoded request head and body
+        """
+        try:
+            writer.write(request)
+            await writer.drain()
+            status, reason, content, keep_alive = await read_response(reader)
+        except BaseException:
+            writer.close()
+            raise
+
+        if keep_alive:
+            self.idle.append((reader, writer))
+        else:
+            writer.close()
+
+        return status, reason, content
+
+    def close(self):
+        """Close the idle connections."""
+        while self.idle:
+            self.idle.pop()[1].close()
+
+
+async def read_response(reader: asyncio.StreamReader) -> Tuple[int, str, bytes, bool]:
+    """
+    Read an HTTP/1.1 response and return the status, reason, decoded
+    content and whether the connection can be reused.
+
+    :param reader: The connection stream reader
+    :raises ConnectionClosedError: If the connection is closed before the
+        status line
+    """
+    line = await reader.readline()
+    if not line:
+        raise ConnectionClosedError("Connection closed by the server")
+
+    version, status, reason = (line.decode("latin-1").rstrip() + " ").split(" ", 2)
+    headers = {}
+    while True:
+        line = await reader.readline()
+        if line in (b"\r\n", b"\n", b""):
+            break
+
+        name, _, value = line.decode("latin-1").partition(":")
+        headers[name.strip().lower()] = value.strip()
+
+    keep_alive = (
+        version == "HTTP/1.1" and headers.get("connection", "").lower() != "close"
+    )
+    if status in ("204", "304"):
+        content = b""
+    elif headers.get("transfer-encoding", "").lower() == "chunked":
+        content = await read_chunks(reader)
+    elif "content-length" in headers:
+        content = await reader.readexactly(int(headers["content-length"]))
+    else:
+        content = await reader.read()
+        keep_alive = False
+
+    content = decode_content(content, headers.get("content-encoding", ""))
+    return int(status), reason.strip(), content, keep_alive
+
+
+async def read_chunks(reader: asyncio.StreamReader) -> bytes:
+    """Read and join the chunks of a chunked transfer encoded body."""
+    chunks = []
+    while True:
+        line = await reader.readline()
+        size = int(line.split(b";", 1)[0], 16)
+        if not size:
+            break
+
+        chunks.append(await reader.readexactly(size))
+        await reader.readexactly(2)
+
+    while await reader.readline() not in (b"\r\n", b"\n", b""):
+        pass
+
+    return b"".join(chunks)
+
+
+def decode_content(content: bytes, encoding: str) -> bytes:
+    """
+    Decompress the gzip or deflate encoded content, the deflate content
+    may be sent with or without the zlib wrapper.
+
+    :param content: The response content
+    :param encoding: The response content encoding
+    """
+    encoding = encoding.strip().lower()
+    if not content or encoding in ("", "identity"):
+        return content
+    if encoding in ("gzip", "x-gzip"):
+        return zlib.decompress(content, 16 + zlib.MAX_WBITS)
+    if encoding == "deflate":
+        try:
+            return zlib.decompress(content)
+        except zlib.error:
+            return zlib.decompress(content, -zlib.MAX_WBITS)
+
+    return content
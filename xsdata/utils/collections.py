@@ -19,6 +19,12 @@ def is_array(value: Any) -> bool:
     return False
 
 
+def is_iterator(value: Any) -> bool:
+    """Return whether the given value is a lazy iterator, e.g. a
+    generator."""
+    return isinstance(value, Iterator)
+
+
 def unique_sequence(items: Iterable[T], key: Optional[str] = None) -> List[T]:
     """
     Return a new list with the unique values from an iterable.
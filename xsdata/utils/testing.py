@@ -369,6 +369,7 @@ class XmlVarFactory(Factory):
         namespaces: Optional[Sequence[str]] = None,
         elements: Optional[Dict[str, XmlVar]] = None,
         wildcards: Optional[Sequence[XmlVar]] = None,
+        lazy: bool = False,
         prefix: str = "field_",
         **kwargs: Any,
     ) -> XmlVar:
@@ -409,6 +410,7 @@ class XmlVarFactory(Factory):
             namespaces=namespaces,
             elements=elements,
             wildcards=wildcards,
+            lazy=lazy,
         )
 
 